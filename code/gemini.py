@@ -2,6 +2,8 @@ import os
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from run_stats import stats
+
 class GeminiKeywordPaperExtractor:
     def __init__(self, model_name="gemini-2.0-flash"):
         load_dotenv()
@@ -34,7 +36,8 @@ Section Content:
 \"\"\"
 """
         try:
-            response = self.model.generate_content(prompt)
+            with stats.api_call("gemini"):
+                response = self.model.generate_content(prompt)
             return response.text.strip()
         except Exception as e:
             print(f"Gemini API call failed: {e}")
@@ -72,7 +75,8 @@ References:
 \"\"\"
 """
         try:
-            response = self.model.generate_content(prompt)
+            with stats.api_call("gemini"):
+                response = self.model.generate_content(prompt)
             return response.text.strip()
         except Exception as e:
             print(f"Gemini API call failed: {e}")
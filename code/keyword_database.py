@@ -1,13 +1,17 @@
 import json
 import os
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-# Import the Gemini extractor to use its model
-# Assuming the file is named 'gemini.py' and contains GeminiKeywordPaperExtractor
-from gemini import GeminiKeywordPaperExtractor 
+from atomic_io import atomic_write
+from keyword_graph import KeywordGraph
+from run_stats import stats
+
+# Only needed for the type hint; importing gemini pulls in google.generativeai
+if TYPE_CHECKING:
+    from gemini import GeminiKeywordPaperExtractor
 
 class KeywordDatabase:
-    def __init__(self, db_file: str = "keyword_database.json", gemini_extractor: Optional[GeminiKeywordPaperExtractor] = None):
+    def __init__(self, db_file: str = "keyword_database.json", gemini_extractor: Optional["GeminiKeywordPaperExtractor"] = None):
         """
         Initialize the keyword database.
         
@@ -18,6 +22,8 @@ class KeywordDatabase:
         self.db_file = db_file
         self.gemini_extractor = gemini_extractor # Store the Gemini extractor
         self.data = self._load_database()
+        # Keyword hierarchy index, built on the first graph query and then kept in step with add_paper
+        self._graph: Optional[KeywordGraph] = None
         
     def _load_database(self) -> Dict:
         """Load the database from JSON file or create new if doesn't exist."""
@@ -52,7 +58,8 @@ class KeywordDatabase:
     
     def _save_database(self):
         """Save the current database state to JSON file."""
-        with open(self.db_file, 'w') as f:
+        # Swapped in atomically, so readers (e.g. query_service) never see a partial file
+        with atomic_write(self.db_file) as f:
             json.dump(self.data, f, indent=2)
     
     def _generate_reasoning(self, keyword: str, gemini_claim: str, parent_keyword: Optional[str], child_claim: Optional[str], child_keyword: Optional[str]) -> str:
@@ -83,7 +90,8 @@ class KeywordDatabase:
         )
 
         try:
-            response = self.gemini_extractor.model.generate_content(full_prompt)
+            with stats.api_call("gemini"):
+                response = self.gemini_extractor.model.generate_content(full_prompt)
             return response.text.strip()
         except Exception as e:
             print(f"Error generating reasoning via Gemini: {e}")
@@ -146,7 +154,10 @@ class KeywordDatabase:
         }
         
         self.data["keywords"][keyword].append(paper_data)
+        if self._graph is not None:
+            self._graph.add_paper(keyword, paper_data)
         print(f"Added paper '{paper_title}' to keyword '{keyword}'")
+        stats.incr("papers_added")
         self._save_database()
     
     def add_to_process(self, keyword: str) -> None:
@@ -181,4 +192,34 @@ class KeywordDatabase:
         """
         if keyword in self.data["remaining_to_process"]:
             self.data["remaining_to_process"].remove(keyword)
-            self._save_database()
\ No newline at end of file
+            self._save_database()
+
+    @property
+    def graph(self) -> KeywordGraph:
+        if self._graph is None:
+            self._graph = KeywordGraph.from_keywords(self.data["keywords"])
+        return self._graph
+
+    def get_ancestors(self, keyword: str, depth: Optional[int] = None) -> List[Tuple[str, str, Optional[str], int]]:
+        """
+        Keywords that led to this one, nearest first, as (ancestor, its child on the way, linking claim, distance).
+        """
+        return self.graph.ancestors(keyword, depth)
+
+    def get_descendants(self, keyword: str, depth: Optional[int] = None) -> List[Tuple[str, str, Optional[str], int]]:
+        """
+        Child keywords explored from this one up to depth levels down, as (descendant, its parent, linking claim, distance).
+        """
+        return self.graph.descendants(keyword, depth)
+
+    def get_provenance_path(self, source: str, target: str) -> Optional[List[str]]:
+        """
+        Shortest chain of keywords from source down to target, or None if target was not reached from source.
+        """
+        return self.graph.shortest_path(source, target)
+
+    def get_reachable_papers(self, root: str, depth: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Papers of the root keyword and of every keyword explored from it, by keyword.
+        """
+        return self.graph.reachable_papers(root, depth)
@@ -1,6 +1,8 @@
 # keyword_term_extractor.py
 
 from typing import Optional
+
+from run_stats import stats
 # Assuming GeminiKeywordPaperExtractor is available and provides a 'model' attribute
 # from gemini import GeminiKeywordPaperExtractor 
 
@@ -54,7 +56,8 @@ class KeywordTermExtractor:
             Now extract the key term from the claim above:"""
             
             # Use a direct API call to Gemini
-            response = self.gemini_extractor.model.generate_content(prompt)
+            with stats.api_call("gemini"):
+                response = self.gemini_extractor.model.generate_content(prompt)
             result = response.text
             
             if result:
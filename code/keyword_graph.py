@@ -0,0 +1,164 @@
+import argparse
+import json
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+from xml.etree import ElementTree as ET
+
+
+class KeywordGraph:
+    def __init__(self):
+        """
+        Adjacency-list index of the keyword hierarchy stored on the papers of a KeywordDatabase.
+        A paper under keyword k with parent_keyword p gives the edge p -> k, and one with a different
+        child_keyword c (a paper found via a child and added to its parent) gives k -> c. Each edge keeps
+        the first claim that linked the two keywords.
+        """
+        self.children: Dict[str, Dict[str, Optional[str]]] = {}  # keyword -> {child: claim}
+        self.parents: Dict[str, Dict[str, Optional[str]]] = {}   # keyword -> {parent: claim}
+        self.papers: Dict[str, List[Dict]] = {}                  # keyword -> its paper entries
+
+    @classmethod
+    def from_keywords(cls, keywords: Dict[str, List[Dict]]) -> "KeywordGraph":
+        """Builds the graph from the database's keyword -> papers mapping."""
+        graph = cls()
+        for keyword, papers in keywords.items():
+            graph.papers.setdefault(keyword, [])
+            for paper in papers:
+                graph.add_paper(keyword, paper)
+        return graph
+
+    def add_edge(self, parent: str, child: str, claim: Optional[str] = None):
+        if parent == child:
+            return
+        if self.children.setdefault(parent, {}).get(child) is None:
+            self.children[parent][child] = claim
+        if self.parents.setdefault(child, {}).get(parent) is None:
+            self.parents[child][parent] = claim
+
+    def add_paper(self, keyword: str, paper: Dict):
+        """Indexes one stored paper entry (the dict KeywordDatabase.add_paper appends)."""
+        self.papers.setdefault(keyword, []).append(paper)
+        if paper.get("parent_keyword"):
+            self.add_edge(paper["parent_keyword"], keyword, paper.get("child_claim"))
+        if paper.get("child_keyword"):
+            self.add_edge(keyword, paper["child_keyword"], paper.get("child_claim"))
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.papers or keyword in self.children or keyword in self.parents
+
+    def _walk(self, start: str, adjacency: Dict[str, Dict[str, Optional[str]]], depth: Optional[int]) -> List[Tuple[str, str, Optional[str], int]]:
+        """Breadth-first (keyword, reached_from, claim, distance) tuples, nearest first."""
+        found = []
+        seen = {start}
+        frontier = deque([(start, 0)])
+        while frontier:
+            current, distance = frontier.popleft()
+            if depth is not None and distance >= depth:
+                continue
+            for neighbour in sorted(adjacency.get(current, ())):
+                if neighbour in seen:
+                    continue
+                seen.add(neighbour)
+                found.append((neighbour, current, adjacency[current][neighbour], distance + 1))
+                frontier.append((neighbour, distance + 1))
+        return found
+
+    def ancestors(self, keyword: str, depth: Optional[int] = None) -> List[Tuple[str, str, Optional[str], int]]:
+        """(ancestor, its child on the way to keyword, linking claim, distance) for every ancestor within depth."""
+        return self._walk(keyword, self.parents, depth)
+
+    def descendants(self, keyword: str, depth: Optional[int] = None) -> List[Tuple[str, str, Optional[str], int]]:
+        """(descendant, its parent on the way from keyword, linking claim, distance) for every descendant within depth."""
+        return self._walk(keyword, self.children, depth)
+
+    def shortest_path(self, source: str, target: str) -> Optional[List[str]]:
+        """Keywords on the shortest parent -> child path from source to target, or None if unreachable."""
+        if source not in self or target not in self:
+            return None
+        previous: Dict[str, Optional[str]] = {source: None}
+        frontier = deque([source])
+        while frontier:
+            current = frontier.popleft()
+            if current == target:
+                path = []
+                while current is not None:
+                    path.append(current)
+                    current = previous[current]
+                return path[::-1]
+            for child in self.children.get(current, ()):
+                if child not in previous:
+                    previous[child] = current
+                    frontier.append(child)
+        return None
+
+    def reachable_papers(self, root: str, depth: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """Papers of root and of every descendant within depth, by keyword."""
+        keywords = [root] + [keyword for keyword, _, _, _ in self.descendants(root, depth)]
+        return {keyword: self.papers[keyword] for keyword in keywords if self.papers.get(keyword)}
+
+    def subgraph(self, root: str, depth: Optional[int] = None) -> "KeywordGraph":
+        """The root, its descendants within depth, the edges among them and their papers (e.g. to export one tree)."""
+        keywords = {root} | {keyword for keyword, _, _, _ in self.descendants(root, depth)}
+        graph = KeywordGraph()
+        for keyword in keywords:
+            graph.papers[keyword] = self.papers.get(keyword, [])
+            for child, claim in self.children.get(keyword, {}).items():
+                if child in keywords:
+                    graph.add_edge(keyword, child, claim)
+        return graph
+
+    def edges(self) -> Iterator[Tuple[str, str, Optional[str]]]:
+        for parent in sorted(self.children):
+            for child in sorted(self.children[parent]):
+                yield parent, child, self.children[parent][child]
+
+    def write_edge_list(self, path: str):
+        """One 'parent<TAB>child' line per edge."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for parent, child, _ in self.edges():
+                f.write(f"{parent}\t{child}\n")
+
+    def to_graphml(self) -> str:
+        """GraphML with a paper count per keyword and the linking claim per edge."""
+        root = ET.Element("graphml", xmlns="http://graphml.graphdrawing.org/xmlns")
+        ET.SubElement(root, "key", {"id": "papers", "for": "node", "attr.name": "papers", "attr.type": "int"})
+        ET.SubElement(root, "key", {"id": "claim", "for": "edge", "attr.name": "claim", "attr.type": "string"})
+        graph = ET.SubElement(root, "graph", id="keywords", edgedefault="directed")
+        nodes = sorted(set(self.papers) | set(self.children) | set(self.parents))
+        for keyword in nodes:
+            node = ET.SubElement(graph, "node", id=keyword)
+            ET.SubElement(node, "data", key="papers").text = str(len(self.papers.get(keyword, [])))
+        for parent, child, claim in self.edges():
+            edge = ET.SubElement(graph, "edge", source=parent, target=child)
+            if claim:
+                ET.SubElement(edge, "data", key="claim").text = claim
+        return ET.tostring(root, encoding="unicode")
+
+    def write_graphml(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write(self.to_graphml())
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Export the keyword graph of a keyword database.")
+    parser.add_argument("--db", default="keyword_database.json", help="Keyword database file")
+    parser.add_argument("--root", help="Only export this keyword and its descendants")
+    parser.add_argument("--depth", type=int, help="Descendant levels below --root (default: all)")
+    parser.add_argument("--edges", metavar="FILE", help="Write a tab-separated edge list")
+    parser.add_argument("--graphml", metavar="FILE", help="Write GraphML")
+    args = parser.parse_args(argv)
+
+    with open(args.db, 'r', encoding='utf-8') as f:
+        graph = KeywordGraph.from_keywords(json.load(f).get("keywords", {}))
+    if args.root:
+        graph = graph.subgraph(args.root.lower(), args.depth)
+    if args.edges:
+        graph.write_edge_list(args.edges)
+    if args.graphml:
+        graph.write_graphml(args.graphml)
+    print(f"{len(graph.papers)} keywords, {sum(1 for _ in graph.edges())} edges")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,34 +1,143 @@
-from paper_processor import PaperProcessor
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterator, List
 
-# Initialize processor
-processor = PaperProcessor(2)
+from run_stats import stats
 
-# Start with a root keyword
-root_keyword = "binary search tree"
+PROVIDERS = ["gemini", "openai", "openalex", "google", "tavily", "wikipedia", "web", "browser"]
 
-# Process the keyword and all its sub-keywords
-processor.process_keyword(root_keyword)
 
-# Print database statistics
-print("\n== Database Statistics ==")
-print(f"Total keywords processed: {len(processor.processed_keywords)}")
-print("\nKeywords and their papers:")
-for keyword in processor.database.get_all_keywords():
-    papers = processor.database.get_keyword_papers(keyword)
-    print(f"\n-- {keyword} --")
-    print(f"Number of papers: {len(papers)}")
-    for paper in papers:
-        print(f"  - {paper.get('title', 'No title')}")
+def read_keywords(args) -> Iterator[str]:
+    """Root keywords from the command line, a file, or stdin ('-' or piped input). Blank lines and # comments are skipped."""
+    yield from args.keywords
+    stream = None
+    if args.keywords_file == "-" or (not args.keywords and not args.keywords_file and not sys.stdin.isatty()):
+        stream = sys.stdin
+    elif args.keywords_file:
+        stream = open(args.keywords_file, 'r', encoding='utf-8')
+    if stream is None:
+        return
+    try:
+        for line in stream:
+            keyword = line.strip()
+            if keyword and not keyword.startswith("#"):
+                yield keyword
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
 
-# print("\nRemaining keywords to process:")
-remaining = processor.database.get_remaining_keywords()
-# if remaining:
-#     for keyword in remaining:
-#         print(f"  - {keyword}")
-# else:
-#     print("  None")
 
+def write_output(args, processor, keyword: str, emitted: Dict[str, int]):
+    """Emits the papers added while processing one root keyword. emitted tracks papers already written per keyword."""
+    if args.output == "json":
+        return  # KeywordDatabase already persisted them to --db
+    database = processor.database
+    new_papers = {}
+    for kw in database.get_all_keywords():
+        papers = database.get_keyword_papers(kw)
+        if len(papers) > emitted.get(kw, 0):
+            new_papers[kw] = papers[emitted.get(kw, 0):]
+            emitted[kw] = len(papers)
+    if args.output == "jsonl":
+        with open(args.output_file, 'a', encoding='utf-8') as f:
+            for kw, papers in new_papers.items():
+                f.write(json.dumps({"root": keyword, "keyword": kw, "papers": papers}) + "\n")
+    elif args.output == "stdout":
+        for kw, papers in new_papers.items():
+            print(f"\n-- {kw} --")
+            print(f"Number of new papers: {len(papers)}")
+            for paper in papers:
+                print(f"  - {paper.get('title', 'No title')}")
 
 
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Find the foundational papers for keywords and their sub-keywords.")
+    parser.add_argument("keywords", nargs="*", help="Root keywords to process")
+    parser.add_argument("-f", "--keywords-file", help="File with one root keyword per line ('-' reads stdin)")
+    parser.add_argument("-d", "--depth", type=int, default=2, help="Levels of child keywords to explore (default: 2)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="Threads per pipeline stage (default: 4)")
+    parser.add_argument("--queue-size", type=int, default=8, help="Bound of the queues between pipeline stages")
+    parser.add_argument("--prefetch-workers", type=int, default=2, help="Background Wikipedia prefetch threads (0 disables)")
+    parser.add_argument("--token-budget", type=int, default=3000, help="Token budget of the sections sent to Gemini (0 disables pruning)")
+    parser.add_argument("--no-prefilter", action="store_true", help="Send every paper to the LLM verifier")
+    parser.add_argument("--fallback-pages", type=int, default=3, help="General web pages used when there is no Wikipedia page (0 disables)")
+    parser.add_argument("--search-provider", choices=["google", "tavily"], default="google", help="Search used by the general web fallback")
+    for provider in PROVIDERS:
+        parser.add_argument(f"--{provider}-concurrency", type=int, default=0, metavar="N",
+                            help=f"Maximum concurrent {provider} calls (0: unlimited)")
+    parser.add_argument("--cache-dir", default=".", help="Directory of the verification, Tavily and processed-page caches")
+    parser.add_argument("--db", default="keyword_database.json", help="Keyword database file")
+    parser.add_argument("--seed-textbook", metavar="MAP_FILE", help="Seed the database from a textbook map (e.g. clrs_textbook_map.json) first")
+    parser.add_argument("--output", choices=["json", "jsonl", "stdout"], default="json",
+                        help="json: only the database file; jsonl: also append results to --output-file; stdout: also print them")
+    parser.add_argument("--output-file", default="results.jsonl", help="Target of --output jsonl")
+    return parser
 
-#rewrite the reasoning to flow better some how. Generate a sentence that ties the claim and justification together.
+
+def main(argv: List[str] = None):
+    args = build_parser().parse_args(argv)
+    for provider in PROVIDERS:
+        stats.set_concurrency(provider, getattr(args, f"{provider}_concurrency"))
+
+    # Imported after parsing so that --help does not load the crawler
+    from paper_processor import PaperProcessor
+    from services import Services
+
+    os.makedirs(args.cache_dir, exist_ok=True)
+    services = Services(
+        db_file=args.db,
+        verification_store_file=os.path.join(args.cache_dir, "verification_scores.json"),
+        use_prefilter=not args.no_prefilter,
+        tavily_cache_file=os.path.join(args.cache_dir, "tavily_cache.json"),
+    )
+    processor = PaperProcessor(
+        args.depth,
+        token_budget=args.token_budget or None,
+        stage_workers=args.workers,
+        queue_size=args.queue_size,
+        prefetch_workers=args.prefetch_workers,
+        web_fallback_pages=args.fallback_pages,
+        seen_pages_file=os.path.join(args.cache_dir, "processed_pages.json"),
+        web_search_provider=args.search_provider,
+        services=services,
+    )
+    # Reset before seeding so the OpenAlex calls and papers of --seed-textbook count in the run summary
+    stats.reset()
+    count = 0
+    try:
+        if args.seed_textbook:
+            processor.seed_from_textbook(args.seed_textbook)
+            print(f"Seeded from {args.seed_textbook}: +{stats.get('papers_added')} papers")
+
+        emitted = {kw: len(processor.database.get_keyword_papers(kw)) for kw in processor.database.get_all_keywords()} if args.output != "json" else {}
+        for count, keyword in enumerate(read_keywords(args), 1):
+            started = time.monotonic()
+            papers_before = stats.get("papers_added")
+            print(f"\n### [{count}] {keyword}")
+            try:
+                processor.process_keyword(keyword)
+            except KeyboardInterrupt:
+                print("Interrupted.")
+                break
+            except Exception as e:
+                print(f"Error processing '{keyword}': {e}")
+            write_output(args, processor, keyword, emitted)
+            print(f"### [{count}] {keyword} done in {time.monotonic() - started:.1f}s, "
+                  f"+{stats.get('papers_added') - papers_before} papers, {stats.get('keywords_processed')} keywords so far")
+    finally:
+        processor.close()
+
+    if count == 0 and not args.seed_textbook:
+        print("No keywords given. Pass keywords as arguments, with --keywords-file, or on stdin.")
+        return
+
+    print("\n== Run Summary ==")
+    print(f"Root keywords: {count}")
+    print(stats.summary(processor.cache_hits()))
+
+
+if __name__ == "__main__":
+    main()
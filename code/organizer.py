@@ -10,16 +10,27 @@ class PaperOrganizer:
         self.identified_sources = []
         self.non_identified_sources = []
 
+    def split_claims(self, papers):
+        """
+        Splits a single Gemini result block into identified and non-identified claims
+        without touching the accumulated lists.
+        """
+        identified, non_identified = [], []
+        for paper in papers.split("\n"):
+            paper = paper.strip("-• ").strip()
+            if not paper:
+                continue
+                
+            if "XXX" in paper:
+                non_identified.append(paper)
+            else:
+                identified.append(paper)
+        return identified, non_identified
+
     def organize_papers(self, paper_list):
         for _, papers in paper_list:
-            for paper in papers.split("\n"):
-                paper = paper.strip("-• ").strip()
-                if not paper:
-                    continue
-                    
-                if "XXX" in paper:
-                    self.non_identified_sources.append(paper)
-                else:
-                    self.identified_sources.append(paper)
+            identified, non_identified = self.split_claims(papers)
+            self.identified_sources.extend(identified)
+            self.non_identified_sources.extend(non_identified)
         
-        return self.identified_sources, self.non_identified_sources 
\ No newline at end of file
+        return self.identified_sources, self.non_identified_sources 
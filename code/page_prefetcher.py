@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+
+class WikiPagePrefetcher:
+    def __init__(self, google_searcher, wiki_parser, max_entries: int = 32, workers: int = 2):
+        """
+        Resolves and downloads Wikipedia pages for candidate child keywords in the
+        background while the parent keyword is still being verified.
+
+        Args:
+            google_searcher: GoogleSearcher used to resolve the Wikipedia URL.
+            wiki_parser: WikipediaParser used to download the rendered page.
+            max_entries: Maximum number of pages kept (fetched or in flight). Oldest are evicted first.
+            workers: Number of background fetch threads.
+        """
+        self.google_searcher = google_searcher
+        self.wiki_parser = wiki_parser
+        self.max_entries = max_entries
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wiki-prefetch")
+        self._cache: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _fetch(self, keyword: str) -> Tuple[Optional[str], Optional[str]]:
+        wiki_url = self.google_searcher.find_wikipedia_page(keyword)
+        if not wiki_url:
+            return None, None
+        return wiki_url, self.wiki_parser.fetch_html(f"{wiki_url}?action=render")
+
+    def prefetch(self, keyword: str) -> None:
+        """Schedules a background fetch for keyword unless it is already cached or in flight."""
+        key = keyword.lower().strip()
+        if not key:
+            return
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return
+            self._cache[key] = self.executor.submit(self._fetch, key)
+            while len(self._cache) > self.max_entries:
+                _, evicted = self._cache.popitem(last=False)
+                evicted.cancel()
+        print(f"Prefetching Wikipedia page for candidate keyword: {key}")
+
+    def get(self, keyword: str, timeout: Optional[float] = 30) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """
+        Returns (wiki_url, render_html) for a prefetched keyword, waiting for an in-flight
+        fetch if necessary. wiki_url is None when the search found no Wikipedia page and
+        render_html is None when the download failed. Returns None on a cache miss so the
+        caller can fetch normally.
+        """
+        key = keyword.lower().strip()
+        with self._lock:
+            future = self._cache.pop(key, None)
+        if future is None or future.cancelled():
+            self.misses += 1
+            return None
+        try:
+            result = future.result(timeout=timeout)
+        except Exception as e:
+            print(f"Prefetch for '{key}' failed: {e}")
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def shutdown(self, cancel_futures: bool = True) -> None:
+        """Stops the fetch threads. Queued speculative fetches are dropped unless cancel_futures is False."""
+        self.executor.shutdown(wait=False, cancel_futures=cancel_futures)
@@ -1,56 +1,136 @@
 from organizer import PaperOrganizer
-from gemini import GeminiKeywordPaperExtractor
-from paper_retrievers.openAlex_retriever import OpenAlexRetriever
-from paper_verifier import Paper_Verifier
-from keyword_database import KeywordDatabase
-from scrapers.wiki_parser import WikipediaParser
-from scrapers.google_search import GoogleSearcher
 from title_extractor import TitleExtractor
-from keyword_extractor import KeywordTermExtractor
+from section_pruner import SectionPruner
+from pipeline import StreamingPipeline, Stage, passthrough
+from page_prefetcher import WikiPagePrefetcher
+from services import Services
+from run_stats import stats
 
-import time
-import re
-
-import os
-import time
-import re
-from typing import List, Dict, Optional, Set, Tuple
-import os
-import time
-import re
+from contextlib import closing
 from typing import List, Dict, Optional, Set, Tuple
 
 class PaperProcessor:
-    def __init__(self, max_recursion_depth: int = 0):
+    def __init__(self, max_recursion_depth: int = 0, token_budget: Optional[int] = 3000, stage_workers: int = 4, queue_size: int = 8, prefetch_workers: int = 2, prefetch_cache_size: int = 32, verification_store_file: Optional[str] = "verification_scores.json", use_prefilter: bool = True, web_fallback_pages: int = 3, seen_pages_file: Optional[str] = "processed_pages.json", web_search_provider: str = "google", services: Optional[Services] = None):
         """
-        Initialize the PaperProcessor.
+        Initialize the PaperProcessor. Service clients (Gemini, OpenAlex, verifier, database, scrapers)
+        are created on first use, so constructing a processor is cheap.
+
+        Args:
+            max_recursion_depth: How many levels of child keywords to explore.
+            token_budget: Estimated token budget for the target sections sent to Gemini per keyword.
+                          None disables section pruning.
+            stage_workers: Threads per network-bound pipeline stage (extraction, lookup, verification).
+            queue_size: Bound of the queues between pipeline stages.
+            prefetch_workers: Background threads fetching Wikipedia pages of candidate child keywords. 0 disables prefetching.
+            prefetch_cache_size: Maximum number of prefetched pages kept.
+            verification_store_file: JSON file memoizing verifier scores per (paper, keyword, prompt version).
+                                     None keeps the scores in memory for this run only.
+            use_prefilter: Score papers with a local TF-IDF model first and only send the ambiguous
+                           band to the LLM verifier. Thresholds are calibrated on the keyword database and stored verifier scores.
+            web_fallback_pages: Non-Wikipedia pages fetched and extracted when a keyword has no Wikipedia page. 0 disables the fallback.
+            seen_pages_file: JSON file of content hashes of general web pages already processed.
+            web_search_provider: "google" or "tavily" (cached) for finding the fallback pages.
+            services: Shared Services to use. When given, verification_store_file and use_prefilter are taken from it.
         """
+        self.services = services or Services(verification_store_file=verification_store_file, use_prefilter=use_prefilter)
         self.organizer = PaperOrganizer()
         self.title_extractor = TitleExtractor()
-        self.gemini_extractor = GeminiKeywordPaperExtractor() # Keep this as it's used by KeywordTermExtractor and for other Gemini calls
-        self.openalex = OpenAlexRetriever()
-        self.verifier = Paper_Verifier()
-        self.database = KeywordDatabase()
-        self.wiki_parser = WikipediaParser()
-        self.GoogleSearcher = GoogleSearcher()
-        
-        self.gemini_extractor = GeminiKeywordPaperExtractor() # This instance is now passed to KeywordDatabase
-        self.openalex = OpenAlexRetriever()
-        self.verifier = Paper_Verifier()
-        
-        # Pass the gemini_extractor to KeywordDatabase
-        self.database = KeywordDatabase(gemini_extractor=self.gemini_extractor)
-        
-        self.wiki_parser = WikipediaParser()
-        self.GoogleSearcher = GoogleSearcher()
-        
-        self.keyword_term_extractor = KeywordTermExtractor(self.gemini_extractor)
+        self.section_pruner = SectionPruner(token_budget) if token_budget is not None else None
         
         self.max_recursion_depth = max_recursion_depth
+        self.stage_workers = stage_workers
+        self.queue_size = queue_size
+        self.prefetch_workers = prefetch_workers
+        self.prefetch_cache_size = prefetch_cache_size
+        self.web_fallback_pages = web_fallback_pages
+        self.seen_pages_file = seen_pages_file
+        self.web_search_provider = web_search_provider
+        self._prefetcher = None
+        self._web_fallback = None
         self.processed_keywords = set()
+        # Keywords whose papers were seeded from textbook bibliographies; web search and extraction are skipped for them
+        self.textbook_keywords = set()
+
+    # Shared service clients, created by Services on first use
+    @property
+    def gemini_extractor(self):
+        return self.services.gemini_extractor
+
+    @property
+    def keyword_term_extractor(self):
+        return self.services.keyword_term_extractor
+
+    @property
+    def openalex(self):
+        return self.services.openalex
+
+    @property
+    def verifier(self):
+        return self.services.verifier
+
+    @property
+    def database(self):
+        return self.services.database
+
+    @property
+    def wiki_parser(self):
+        return self.services.wiki_parser
+
+    @property
+    def GoogleSearcher(self):
+        return self.services.google_searcher
+
+    @property
+    def prefetcher(self) -> Optional[WikiPagePrefetcher]:
+        if self._prefetcher is None and self.prefetch_workers > 0:
+            self._prefetcher = WikiPagePrefetcher(self.GoogleSearcher, self.wiki_parser, self.prefetch_cache_size, self.prefetch_workers)
+        return self._prefetcher
+
+    @property
+    def web_fallback(self):
+        if self._web_fallback is None and self.web_fallback_pages > 0:
+            from web_fallback import GeneralWebFallback
+            tavily_searcher = self.services.tavily_searcher if self.web_search_provider == "tavily" else None
+            self._web_fallback = GeneralWebFallback(self.GoogleSearcher, self.web_fallback_pages, self.stage_workers, self.seen_pages_file, tavily_searcher)
+        return self._web_fallback
+
+    def cache_hits(self) -> Dict[str, int]:
+        """Hit counts of the caches in use so far (services that were never created are left out)."""
+        hits = {}
+        initialized = self.services.initialized()
+        if "score_store" in initialized:
+            hits["verification scores"] = self.services.score_store.hits
+        if "tavily_searcher" in initialized:
+            hits["tavily"] = self.services.tavily_searcher.hits
+        if self._prefetcher is not None:
+            hits["prefetched pages"] = self._prefetcher.hits
+        return hits
+
+    def save_caches(self):
+        """Writes the verifier scores gathered since the last checkpoint."""
+        if "score_store" in self.services.initialized():
+            self.services.score_store.flush()
+
+    def close(self):
+        """Stops background work at the end of a run so queued speculative fetches do not delay exit."""
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(cancel_futures=True)
+        self.save_caches()
 
     # REMOVED: The extract_key_term method is no longer directly in PaperProcessor
 
+    def seed_from_textbook(self, map_file: str = "clrs_textbook_map.json", verify: bool = True) -> Set[str]:
+        """
+        Seeds the database from textbook section -> bibliography links. Section titles become keywords
+        and their cited entries are resolved in bulk against OpenAlex.
+        """
+        from textbook_seeder import TextbookSeeder
+        seeder = TextbookSeeder(self.database, self.openalex, self.verifier if verify else None, max_workers=self.stage_workers)
+        seeded = seeder.seed(map_file)
+        self.textbook_keywords.update(seeded)
+        self.save_caches()
+        return seeded
+
     def process_keyword(self, keyword: str, current_depth: int = None, parent_keyword: Optional[str] = None, processed_chain: Optional[Set[str]] = None, claim_from_parent_to_this_keyword: Optional[str] = None):
         """
         Orchestrates the process of finding and verifying papers for a keyword.
@@ -79,6 +159,11 @@ class PaperProcessor:
             
         self.processed_keywords.add(normalized_keyword)
         
+        if normalized_keyword in self.textbook_keywords:
+            print(f"\nSkipping web search and extraction for {keyword} - already seeded from textbook")
+            self.database.remove_from_remaining(normalized_keyword)
+            return
+        
         current_chain_copy = processed_chain.copy()
         current_chain_copy.add(normalized_keyword)
         
@@ -90,48 +175,65 @@ class PaperProcessor:
             print(f"Parent keyword: {parent_keyword.lower()}")
         print(f"Current chain: {current_chain_copy}")
         print(f"{'='*50}")
+        stats.incr("keywords_processed")
         
         # --- Step 1 & 2: Fetching and Parsing Wikipedia Content ---
         print(f"\nStep 1: Fetching Wikipedia content for {keyword}")
-        wiki_url = self.GoogleSearcher.find_wikipedia_page(keyword) 
-        if not wiki_url:
+        prefetched = self.prefetcher.get(normalized_keyword) if self.prefetcher else None
+        if prefetched:
+            print(f"Using prefetched Wikipedia page for {keyword}")
+            wiki_url, html = prefetched
+        else:
+            wiki_url, html = self.GoogleSearcher.find_wikipedia_page(keyword), None
+        if wiki_url:
+            section_items = self._wiki_section_items(keyword, wiki_url, html)
+            extract_stage = lambda item: self._extract_stage(item, keyword)
+        elif self.web_fallback:
+            # No Wikipedia article: stream general web pages into the same pipeline as they are fetched
+            print(f"Could not find Wikipedia page for {keyword}, falling back to general web pages")
+            section_items = self.web_fallback.iter_pages(keyword)
+            extract_stage = lambda item: self._extract_general_stage(item, keyword)
+        else:
             print(f"Could not find Wikipedia page for {keyword}, skipping...")
             return
         
-        render_url = f"{wiki_url}?action=render"
-        
-        sections = self.wiki_parser.extract_sections(render_url)
-        references = self.wiki_parser.extract_references(render_url)
-        sections = self.wiki_parser.reference_fusion(sections, references)
-        print(f"Found {len(sections)} sections")
-        
-        target_sections = self._get_target_sections(sections)
-        
-        # --- Step 3: Extract Papers and Keywords using Gemini ---
-        paper_list, new_keywords = self._extract_papers_and_keywords(target_sections, keyword)
-        
-        # Add new keywords to the database queue for processing later
-        for kw in new_keywords:
-            self.database.add_to_process(kw) 
-        
-        # --- Step 4: Organizing Papers ---
-        print("\nStep 4: Organizing papers into identified and non-identified sources")
-        self.organizer.reset() # Ensure organizer is clean for this run
-        identified_sources, non_identified_sources = self.organizer.organize_papers(paper_list)
-        
-        print(f"Identified sources: {identified_sources}")
-        print(f"Non-identified sources: {non_identified_sources}")
-        
-        # --- Step 5: Extract clean titles ---
-        clean_identified_sources = self.title_extractor.extract_titles(identified_sources)
-        
-        # --- Step 6: Processing Identified Sources (OpenAlex and Verification) ---
-        self._process_identified_sources(
-            clean_identified_sources, 
-            normalized_keyword, 
-            parent_keyword, 
-            claim_from_parent_to_this_keyword
-        )
+        # --- Steps 3-6: Extraction, organizing, OpenAlex lookup and verification ---
+        # The stages run concurrently as a streaming pipeline, so an OpenAlex lookup starts
+        # as soon as the first claim is parsed and verification overlaps with retrieval.
+        print("\nSteps 3-6: Streaming extraction, organizing, lookup and verification")
+        non_identified_sources = []
+        # Only key terms of non-identified claims are recursed into, and only while depth is left,
+        # so only those are worth a speculative (paid) search
+        prefetch_children = self.prefetcher is not None and current_depth - 1 > 0
+        pipeline = self._build_pipeline(normalized_keyword, extract_stage)
+        # closing() stops the pipeline threads even if handling an event raises
+        with closing(pipeline.run(section_items)) as events:
+            for event in events:
+                kind = event[0]
+                if kind == "keyword":
+                    # Add new keywords to the database queue for processing later
+                    self.database.add_to_process(event[1])
+                elif kind == "non_identified":
+                    _, claim, key_term = event
+                    print(f"Non-identified source: {claim}")
+                    non_identified_sources.append((claim, key_term))
+                    if prefetch_children and key_term and key_term.lower() not in current_chain_copy:
+                        self.prefetcher.prefetch(key_term)
+                elif kind == "verified":
+                    _, paper_info, gemini_full_claim_text, score = event
+                    self._handle_verified_paper(
+                        paper_info,
+                        gemini_full_claim_text,
+                        score,
+                        normalized_keyword,
+                        parent_keyword,
+                        claim_from_parent_to_this_keyword
+                    )
+        if pipeline.errors:
+            print(f"{len(pipeline.errors)} pipeline item(s) failed for {keyword}")
+        if not wiki_url:
+            self.web_fallback.save()
+        self.save_caches()
         
         # --- Step 7: Process Non-identified Sources (Recursion) ---
         if current_depth > 0:
@@ -154,78 +256,140 @@ class PaperProcessor:
         print(f"Found {len(target_sections)} target sections")
         return target_sections
 
-    def _extract_papers_and_keywords(self, target_sections: Dict[str, str], keyword: str) -> Tuple[List[Tuple[str, str]], List[str]]:
-        """Extracts papers and new keywords from target sections using Gemini."""
-        print("\nStep 3: Extracting papers using Gemini")
-        paper_list = []
+    def _wiki_section_items(self, keyword: str, wiki_url: str, html: Optional[str]) -> List[Tuple[str, str, str]]:
+        """Steps 1 & 2: Parses the Wikipedia page into the pruned target sections fed to the pipeline."""
+        render_url = f"{wiki_url}?action=render"
+        if html is None:
+            html = self.wiki_parser.fetch_html(render_url)
+        
+        sections = self.wiki_parser.extract_sections(render_url, html)
+        references = self.wiki_parser.extract_references(render_url, html)
+        sections = self.wiki_parser.reference_fusion(sections, references)
+        print(f"Found {len(sections)} sections")
+        
+        target_sections = self._get_target_sections(sections)
+        if self.section_pruner:
+            target_sections = self.section_pruner.prune(target_sections, keyword)
+        return [("section", title, text) for title, text in target_sections.items()]
+
+    def _build_pipeline(self, normalized_keyword: str, extract_stage) -> StreamingPipeline:
+        """Builds the streaming pipeline of Steps 3-6 for one keyword."""
+        return StreamingPipeline([
+            Stage("extract", extract_stage, workers=self.stage_workers),
+            Stage("organize", passthrough("claims", self._organize_stage)),
+            Stage("key_term", passthrough("non_identified", self._key_term_stage), workers=self.stage_workers),
+            Stage("lookup", passthrough("identified", self._lookup_stage), workers=self.stage_workers),
+            Stage("verify", passthrough("paper", lambda item: self._verify_stage(item, normalized_keyword)), workers=self.stage_workers),
+        ], queue_size=self.queue_size)
+
+    def _parse_extraction_result(self, result: str) -> Tuple[str, List[str]]:
+        """Splits a Gemini extraction result into the papers block and new keywords."""
         new_keywords = []
+        if "New Keywords:" in result:
+            papers, keywords = result.split("New Keywords:", 1)
+            for line in keywords.strip().split("\n"):
+                if line.strip().startswith("-"):
+                    new_keyword = line.strip("- ").strip()
+                    normalized_new_keyword = new_keyword.lower()
+                    if normalized_new_keyword and normalized_new_keyword != "none" and normalized_new_keyword not in self.processed_keywords:
+                        new_keywords.append(normalized_new_keyword)
+        else:
+            papers = result
+        
+        papers = papers.replace("Foundational Papers:", "").strip()
+        return papers, new_keywords
+
+    def _extract_stage(self, item: Tuple[str, str, str], keyword: str):
+        """Step 3: Extracts papers and new keywords from one target section using Gemini."""
+        _, section_title, section_text = item
+        print(f"\nProcessing section: {section_title}")
+        result = self.gemini_extractor.extract_papers_and_keywords(section_title, section_text, keyword)
+        if not result:
+            return
+        
+        papers, new_keywords = self._parse_extraction_result(result)
+        print(f"Found {len(new_keywords)} new keywords in section: {section_title}")
+        for kw in new_keywords:
+            yield ("keyword", kw)
+        yield ("claims", section_title, papers)
+
+    def _extract_general_stage(self, item: Tuple[str, str, str, List[str], str], keyword: str):
+        """Step 3 (web fallback): Extracts papers from one general web page using Gemini."""
+        _, page_title, all_text, explicit_references, content_hash = item
+        print(f"\nProcessing web page: {page_title}")
+        result = self.gemini_extractor.extract_papers_and_keywords_general(page_title, all_text, explicit_references, keyword)
+        if not result:
+            return
+        
+        papers, new_keywords = self._parse_extraction_result(result)
+        for kw in new_keywords:
+            yield ("keyword", kw)
+        yield ("claims", page_title, papers)
+        # Only a page that made it through extraction is skipped on later runs
+        self.web_fallback.mark_processed(content_hash)
+
+    def _organize_stage(self, item: Tuple[str, str, str]):
+        """Steps 4 & 5: Splits claims into identified/non-identified sources and extracts clean titles."""
+        _, _, papers = item
+        identified_sources, non_identified_sources = self.organizer.split_claims(papers)
+        for clean_title, claim in self.title_extractor.extract_titles(identified_sources):
+            yield ("identified", clean_title, claim)
+        for claim in non_identified_sources:
+            yield ("non_identified", claim)
+
+    def _key_term_stage(self, item: Tuple[str, str]):
+        """Extracts the key term of a non-identified claim early so its page can be prefetched."""
+        _, claim = item
+        # Call the extract_key_term method from the KeywordTermExtractor instance
+        yield ("non_identified", claim, self.keyword_term_extractor.extract_key_term("", claim))
+
+    def _lookup_stage(self, item: Tuple[str, str, str]):
+        """Step 6a: Searches OpenAlex for an identified source."""
+        _, clean_title_from_gemini, gemini_full_claim_text = item
+        print(f"\nProcessing paper: {clean_title_from_gemini}")
+        
+        paper_info = self.openalex.search_paper(clean_title_from_gemini)
+        if not paper_info or not paper_info.get("title"):
+            print(f"No paper info found in OpenAlex for: {clean_title_from_gemini}")
+            return
+        paper_info['reasoning'] = gemini_full_claim_text
+        yield ("paper", paper_info, gemini_full_claim_text)
 
-        for section_title, section_text in target_sections.items():
-            print(f"\nProcessing section: {section_title}")
-            result = self.gemini_extractor.extract_papers_and_keywords(section_title, section_text, keyword)
+    def _verify_stage(self, item: Tuple[str, Dict, str], normalized_keyword: str):
+        """Step 6b: Verifies the relevance of a paper for the current keyword."""
+        _, paper_info, gemini_full_claim_text = item
+        print(f"Found paper info for '{paper_info.get('title')}', verifying relevance...")
+        score = self.verifier.verify_paper_for_keyword(paper_info, normalized_keyword)
+        yield ("verified", paper_info, gemini_full_claim_text, score)
+
+    def _handle_verified_paper(self, paper_info: Dict, gemini_full_claim_text: str, score: Optional[int], normalized_keyword: str, parent_keyword: Optional[str], claim_from_parent_to_this_keyword: Optional[str]):
+        """Step 6c: Adds a verified paper to the database (and to the parent keyword when applicable)."""
+        print(gemini_full_claim_text)
+        if score is not None and score >= 6:  
+            print(f"Paper verified with score {score}, adding to database for {normalized_keyword}")
             
-            if result:
-                if "New Keywords:" in result:
-                    papers, keywords = result.split("New Keywords:")
-                    for line in keywords.strip().split("\n"):
-                        if line.strip().startswith("-"):
-                            new_keyword = line.strip("- ").strip()
-                            normalized_new_keyword = new_keyword.lower()
-                            if normalized_new_keyword and normalized_new_keyword != "none" and normalized_new_keyword not in self.processed_keywords:
-                                new_keywords.append(normalized_new_keyword)
-                else:
-                    papers = result
-                
-                papers = papers.replace("Foundational Papers:", "").strip()
-                paper_list.append((section_title, papers))
-
-        print(f"Found {len(paper_list)} paper entries")
-        print(f"Found {len(new_keywords)} new keywords to process")
-        return paper_list, new_keywords
-
-    def _process_identified_sources(self, clean_identified_sources: List[Tuple[str, str]], normalized_keyword: str, parent_keyword: Optional[str], claim_from_parent_to_this_keyword: Optional[str]):
-        """Processes identified sources by searching OpenAlex, verifying, and adding to database."""
-        print("\nStep 6: Processing identified sources")
-        for clean_title_from_gemini, gemini_full_claim_text in clean_identified_sources:
-            print(f"\nProcessing paper: {clean_title_from_gemini}")
-
-            paper_info = self.openalex.search_paper(clean_title_from_gemini)
-            paper_info['reasoning'] = gemini_full_claim_text
-            if paper_info:
-                print("Found paper info, verifying relevance...")
-
-                # Verify for current keyword
-                scores, _ = self.verifier.verify_papers([paper_info],
-                    f"Which foundational research papers were responsible for inventing/discovering {normalized_keyword} in Computer Science?")
-
-                print(gemini_full_claim_text)
-                if scores and scores[0] >= 6:  
-                    print(f"Paper verified with score {scores[0]}, adding to database for {normalized_keyword}")
-                    
-                    current_child_keyword_for_db = normalized_keyword if parent_keyword else None
-
-                    self.database.add_paper(
-                        normalized_keyword, 
-                        paper_info, 
-                        gemini_full_claim_text, 
-                        parent_keyword=parent_keyword.lower() if parent_keyword else None, 
-                        child_claim=claim_from_parent_to_this_keyword,
-                        child_keyword=current_child_keyword_for_db 
-                    )
+            current_child_keyword_for_db = normalized_keyword if parent_keyword else None
 
-                    # If this is a child keyword, verify and add for the parent keyword
-                    if parent_keyword:
-                        self._verify_and_add_to_parent(
-                            paper_info, 
-                            gemini_full_claim_text, 
-                            normalized_keyword, 
-                            parent_keyword, 
-                            claim_from_parent_to_this_keyword
-                        )
-                else:
-                    print(f"Paper rejected with score {scores[0] if scores else 'N/A'}")
-            else:
-                print("No paper info found in OpenAlex")
+            self.database.add_paper(
+                normalized_keyword, 
+                paper_info, 
+                gemini_full_claim_text, 
+                parent_keyword=parent_keyword.lower() if parent_keyword else None, 
+                child_claim=claim_from_parent_to_this_keyword,
+                child_keyword=current_child_keyword_for_db 
+            )
+
+            # If this is a child keyword, verify and add for the parent keyword
+            if parent_keyword:
+                self._verify_and_add_to_parent(
+                    paper_info, 
+                    gemini_full_claim_text, 
+                    normalized_keyword, 
+                    parent_keyword, 
+                    claim_from_parent_to_this_keyword
+                )
+        else:
+            print(f"Paper rejected with score {score if score is not None else 'N/A'}")
 
     def _verify_and_add_to_parent(self, paper_info: Dict, gemini_full_claim_text: str, normalized_child_keyword: str, parent_keyword: str, original_claim_from_parent: str):
         """Verifies a paper for the parent keyword and adds it to the database."""
@@ -234,11 +398,10 @@ class PaperProcessor:
         parent_paper_info = paper_info.copy()
         parent_paper_info['reasoning'] = f"Found via child keyword '{normalized_child_keyword}'. Derived from parent's claim: \"{original_claim_from_parent}\"."
 
-        parent_scores, _ = self.verifier.verify_papers([parent_paper_info],
-            f"Which foundational research papers were responsible for inventing/discovering {parent_keyword} in Computer Science?")
-        print(_)
-        if parent_scores and parent_scores[0] >= 6:
-            print(f"Paper verified for parent with score {parent_scores[0]}, adding to parent")
+        # Memoized per (paper, keyword), so a pair reached through several paths is only scored once
+        parent_score = self.verifier.verify_paper_for_keyword(parent_paper_info, parent_keyword.lower())
+        if parent_score >= 6:
+            print(f"Paper verified for parent with score {parent_score}, adding to parent")
             
             self.database.add_paper(
                 parent_keyword.lower(), 
@@ -249,18 +412,15 @@ class PaperProcessor:
                 child_keyword=normalized_child_keyword 
             )
         else:
-            print(f"Paper rejected for parent with score {parent_scores[0] if parent_scores else 'N/A'}")
+            print(f"Paper rejected for parent with score {parent_score}")
 
-    def _process_non_identified_sources(self, non_identified_sources: List[str], current_depth: int, normalized_keyword: str, current_chain_copy: Set[str]):
-        """Processes non-identified sources and initiates recursion for new keywords."""
+    def _process_non_identified_sources(self, non_identified_sources: List[Tuple[str, Optional[str]]], current_depth: int, normalized_keyword: str, current_chain_copy: Set[str]):
+        """Processes non-identified sources (claim, key term) and initiates recursion for new keywords."""
         print("\nStep 7: Processing non-identified sources")
         
-        for claim in non_identified_sources:
+        for claim, key_term in non_identified_sources:
             print(f"\nProcessing non-identified claim: {claim[:100]}...")
             
-            # Call the extract_key_term method from the new KeywordTermExtractor instance
-            key_term = self.keyword_term_extractor.extract_key_term("", claim)
-            
             normalized_key_term = key_term.lower() if key_term else None
             
             if normalized_key_term and normalized_key_term not in current_chain_copy:
@@ -1,6 +1,8 @@
 import requests
 from bs4 import BeautifulSoup
 
+from run_stats import stats
+
 class OpenAlexRetriever:
     def __init__(self) -> None:
         self.base_url = "https://api.openalex.org/works"
@@ -21,7 +23,8 @@ class OpenAlexRetriever:
     def scrape_abstract_from_webpage(self, url):
         try:
             headers = {'User-Agent': 'Mozilla/5.0'}
-            response = requests.get(url, headers=headers, timeout=10)
+            with stats.api_call("web"):
+                response = requests.get(url, headers=headers, timeout=10)
             soup = BeautifulSoup(response.text, 'html.parser')
 
             abstract_div = soup.find('div', {'id': 'Abs1-content'})
@@ -33,9 +36,13 @@ class OpenAlexRetriever:
             print(f"Error scraping abstract: {e}")
             return None
 
-    def search_paper(self, title):
-        url = f"{self.base_url}?filter=title.search:{title}"
-        response = requests.get(url)
+    def search_paper(self, title, year=None):
+        # Commas separate OpenAlex filters, so they cannot appear inside the title value
+        url = f"{self.base_url}?filter=title.search:{title.replace(',', ' ')}"
+        if year:
+            url += f",publication_year:{year}"
+        with stats.api_call("openalex"):
+            response = requests.get(url)
         data = response.json()
         
         if 'results' in data and len(data['results']) > 0:
@@ -2,25 +2,13 @@ import openai
 from openai import OpenAI
 import os
 from dotenv import load_dotenv
+import hashlib
 
+from run_stats import stats
+from verification_store import VerificationScoreStore
+from relevance_prefilter import RelevancePrefilter, ACCEPT, REJECT
 
-class Paper_Verifier:
-    def __init__(self):
-        self.OPEN_API_KEY = api_key = os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.OPEN_API_KEY)
-        
-    def verify_papers(self, papers, query):
-        scores = []
-        feedback = []
-        
-        for paper in papers:
-            abstract = paper.get('abstract', 'No abstract available')
-            link = paper.get('link', 'No link available')
-            citations = paper.get('citations', 0)
-            title = paper.get('title', 'No title Available')
-            reasoning = paper.get('reasoning', 'No Reasoning Available')
-            
-            prompt = f"""
+VERIFIER_PROMPT = """
             You are evaluating the relevance of a research paper to a given query.
             
             Query: "{query}"
@@ -44,18 +32,81 @@ class Paper_Verifier:
             
             Return ONLY a single integer score between 0 and 9. Do not include any other text.
             """
+
+# Cached scores are only valid for the prompt that produced them
+PROMPT_VERSION = hashlib.sha1(VERIFIER_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+FOUNDATIONAL_QUERY = "Which foundational research papers were responsible for inventing/discovering {keyword} in Computer Science?"
+
+class Paper_Verifier:
+    def __init__(self, score_store: VerificationScoreStore = None, prefilter: RelevancePrefilter = None):
+        self.OPEN_API_KEY = api_key = os.getenv("OPENAI_API_KEY")
+        self.client = OpenAI(api_key=self.OPEN_API_KEY)
+        self.score_store = score_store
+        self.prefilter = prefilter
+        if self.score_store is not None:
+            # Scores produced by an older prompt are no longer comparable
+            self.score_store.invalidate(keep_version=PROMPT_VERSION)
+
+    def verify_paper_for_keyword(self, paper, keyword):
+        """
+        Scores a paper for the foundational-papers query of keyword. Scores are memoized per
+        (paper, keyword, prompt version) in the score store, so repeated pairs skip the LLM.
+        Clear negatives and clear positives are decided by the local prefilter when one is set.
+        """
+        if self.score_store is not None:
+            cached = self.score_store.get(paper, keyword, PROMPT_VERSION)
+            if cached is not None:
+                print(f"Using cached verification score {cached} for '{paper.get('title')}' and '{keyword}'")
+                return cached
+
+        if self.prefilter is not None:
+            decision, local_score = self.prefilter.decide(paper, keyword)
+            if decision == REJECT:
+                print(f"Prefilter rejected '{paper.get('title')}' for '{keyword}' (local score {local_score:.3f})")
+                return self.prefilter.reject_score
+            if decision == ACCEPT:
+                print(f"Prefilter fast-tracked '{paper.get('title')}' for '{keyword}' (local score {local_score:.3f})")
+                return self.prefilter.accept_score
+
+        scores, _ = self.verify_papers([paper], FOUNDATIONAL_QUERY.format(keyword=keyword))
+        score = scores[0] if scores else 0
+        if self.score_store is not None:
+            self.score_store.put(paper, keyword, PROMPT_VERSION, score)
+        return score
+        
+    def verify_papers(self, papers, query):
+        scores = []
+        feedback = []
+        
+        for paper in papers:
+            abstract = paper.get('abstract', 'No abstract available')
+            link = paper.get('link', 'No link available')
+            citations = paper.get('citations', 0)
+            title = paper.get('title', 'No title Available')
+            reasoning = paper.get('reasoning', 'No Reasoning Available')
             
-            response = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-                model="gpt-4o-mini",
-                temperature=0, # Use temperature 0 for consistent scoring
+            prompt = VERIFIER_PROMPT.format(
+                query=query,
+                abstract=abstract,
+                link=link,
+                citations=citations,
+                title=title,
+                reasoning=reasoning,
             )
             
+            with stats.api_call("openai"):
+                response = self.client.chat.completions.create(
+                    messages=[
+                        {
+                            "role": "user",
+                            "content": prompt,
+                        }
+                    ],
+                    model="gpt-4o-mini",
+                    temperature=0, # Use temperature 0 for consistent scoring
+                )
+            
             # Extract the score from the response, handling potential formatting issues
             response_text = response.choices[0].message.content.strip()
             
@@ -0,0 +1,136 @@
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, List, Tuple
+
+_DONE = object()
+# Seconds between checks of the stop event while a thread waits on a queue
+POLL_INTERVAL = 0.2
+
+
+class Stage:
+    def __init__(self, name: str, fn: Callable, workers: int = 1):
+        """
+        A single pipeline stage.
+
+        Args:
+            name: Name used in log messages.
+            fn: Called with one item, returns an iterable of output items (or None to drop the item).
+            workers: Number of threads running this stage.
+        """
+        self.name = name
+        self.fn = fn
+        self.workers = max(1, workers)
+
+
+class StreamingPipeline:
+    def __init__(self, stages: List[Stage], queue_size: int = 8):
+        """
+        Runs stages concurrently, connected by bounded queues. A full queue blocks the
+        upstream stage (backpressure), so at most queue_size items wait between two stages.
+        Errors raised by a stage for one item are logged and collected in errors; the other
+        items keep flowing.
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.errors: List[Tuple[str, Exception]] = []
+        self._errors_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _put(self, q: queue.Queue, item) -> bool:
+        """Blocking put that gives up (returning False) once the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _get(self, q: queue.Queue):
+        """Blocking get that returns _DONE once the pipeline is stopped."""
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _DONE
+
+    def _record_error(self, name: str, error: Exception):
+        print(f"Error in pipeline stage '{name}': {error}")
+        with self._errors_lock:
+            self.errors.append((name, error))
+
+    def _run_stage(self, stage: Stage, in_q: queue.Queue, out_q: queue.Queue, remaining: List[int], lock: threading.Lock):
+        while True:
+            item = self._get(in_q)
+            if item is _DONE:
+                # Let the other workers of this stage see the sentinel too
+                self._put(in_q, _DONE)
+                with lock:
+                    remaining[0] -= 1
+                    last_worker = remaining[0] == 0
+                if last_worker:
+                    self._put(out_q, _DONE)
+                return
+
+            try:
+                outputs = stage.fn(item)
+                if outputs is not None:
+                    for output in outputs:
+                        if not self._put(out_q, output):
+                            return
+            except Exception as e:
+                self._record_error(stage.name, e)
+
+    def _feed(self, items: Iterable, first_q: queue.Queue):
+        try:
+            for item in items:
+                if not self._put(first_q, item):
+                    return
+        except Exception as e:
+            self._record_error("feed", e)
+        finally:
+            self._put(first_q, _DONE)
+
+    def run(self, items: Iterable) -> Iterator:
+        """
+        Streams items through all stages and yields the outputs of the last stage as
+        soon as they are produced. Output order follows completion order. If the consumer
+        stops early (break, an exception, or closing this generator), every pipeline thread
+        exits within POLL_INTERVAL of finishing its current item.
+        """
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in range(len(self.stages) + 1)]
+        self._stop.clear()
+
+        threading.Thread(target=self._feed, args=(items, queues[0]), daemon=True).start()
+        for i, stage in enumerate(self.stages):
+            remaining = [stage.workers]
+            lock = threading.Lock()
+            for _ in range(stage.workers):
+                threading.Thread(
+                    target=self._run_stage,
+                    args=(stage, queues[i], queues[i + 1], remaining, lock),
+                    name=f"pipeline-{stage.name}",
+                    daemon=True,
+                ).start()
+
+        try:
+            while True:
+                output = queues[-1].get()
+                if output is _DONE:
+                    return
+                yield output
+        finally:
+            self._stop.set()
+
+
+def passthrough(kind: str, fn: Callable) -> Callable:
+    """
+    Wraps fn so it only handles items tagged with kind (items are tuples whose first
+    element is the tag). All other items are forwarded unchanged to the next stage.
+    """
+    def handler(item):
+        if item[0] != kind:
+            return [item]
+        return fn(item)
+    return handler
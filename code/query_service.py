@@ -0,0 +1,298 @@
+import argparse
+import bisect
+import difflib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from keyword_graph import KeywordGraph
+
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+
+
+def normalize_doi(value: str) -> str:
+    """Bare lower-case DOI from a DOI or a doi.org URL (OpenAlex stores papers under https://doi.org/...)."""
+    doi = value.strip().lower()
+    for prefix in DOI_PREFIXES:
+        if doi.startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+
+class KeywordIndex:
+    def __init__(self, data: Dict):
+        """
+        Read-only lookup structures over one snapshot of the keyword database.
+
+        Args:
+            data: Loaded keyword_database.json contents.
+        """
+        self.keywords: Dict[str, List[Dict]] = data.get("keywords", {})
+        self.remaining: List[str] = list(data.get("remaining_to_process", []))
+        self.sorted_keywords = sorted(self.keywords)
+        self.by_doi: Dict[str, List[Tuple[str, Dict]]] = {}
+        for keyword, papers in self.keywords.items():
+            for paper in papers:
+                url = paper.get("url")
+                if url:
+                    self.by_doi.setdefault(normalize_doi(url), []).append((keyword, paper))
+        self.graph = KeywordGraph.from_keywords(self.keywords)
+        self.graphml: Optional[str] = None  # built on the first /graph.graphml request
+
+    def prefix(self, prefix: str, limit: int) -> List[str]:
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self.sorted_keywords, prefix)
+        matches = []
+        for keyword in self.sorted_keywords[start:]:
+            if not keyword.startswith(prefix) or len(matches) >= limit:
+                break
+            matches.append(keyword)
+        return matches
+
+    def fuzzy(self, query: str, limit: int) -> List[str]:
+        """Substring matches first, then the closest spellings."""
+        query = query.lower().strip()
+        matches = [keyword for keyword in self.sorted_keywords if query in keyword][:limit]
+        for keyword in difflib.get_close_matches(query, self.sorted_keywords, n=limit, cutoff=0.6):
+            if len(matches) >= limit:
+                break
+            if keyword not in matches:
+                matches.append(keyword)
+        return matches
+
+    def provenance(self, keyword: str, depth: int) -> Dict:
+        """Parent chain (with the claims linking each step) and child keywords up to depth levels away."""
+        return {
+            "keyword": keyword,
+            "ancestors": [{"keyword": k, "child": via, "claim": claim, "distance": distance}
+                          for k, via, claim, distance in self.graph.ancestors(keyword, depth)],
+            "descendants": [{"keyword": k, "parent": via, "claim": claim, "distance": distance}
+                            for k, via, claim, distance in self.graph.descendants(keyword, depth)],
+        }
+
+
+class QueryStore:
+    def __init__(self, db_file: str = "keyword_database.json", cache_size: int = 512, reload_interval: float = 1.0):
+        """
+        Serves queries from an in-memory KeywordIndex and rebuilds it when the database file changes.
+        KeywordDatabase replaces the file atomically, so a reload always sees a complete snapshot and
+        readers never hold a lock the crawler waits on.
+
+        Args:
+            db_file: KeywordDatabase JSON file.
+            cache_size: Number of encoded responses kept (LRU). Cleared on every reload.
+            reload_interval: Minimum seconds between checks of the file's modification time.
+        """
+        self.db_file = db_file
+        self.cache_size = cache_size
+        self.reload_interval = reload_interval
+        self.index = KeywordIndex({})
+        self.version: Optional[Tuple[int, int]] = None
+        self.loaded_at = 0.0
+        self._checked_at = 0.0
+        self._reload_lock = threading.Lock()
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_hits = 0
+        self.reload()
+
+    def _file_version(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.db_file)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def reload(self) -> bool:
+        """Rebuilds the index if the file changed since the last load. Returns True if it did."""
+        with self._reload_lock:
+            self._checked_at = time.monotonic()
+            version = self._file_version()
+            if version == self.version:
+                return False
+            data = {}
+            if version is not None:
+                try:
+                    with open(self.db_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError) as e:
+                    print(f"Could not reload {self.db_file}, keeping the previous snapshot: {e}")
+                    return False
+            index = KeywordIndex(data)
+            with self._cache_lock:
+                self.index = index
+                self.version = version
+                self._cache.clear()
+            self.loaded_at = time.time()
+            print(f"Loaded {len(index.keywords)} keywords from {self.db_file}")
+            return True
+
+    def maybe_reload(self):
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            self.reload()
+
+    def cached(self, key: str, build) -> Tuple[int, bytes]:
+        """Status and encoded JSON body for key, built from the current index on a cache miss."""
+        self.maybe_reload()
+        with self._cache_lock:
+            body = self._cache.get(key)
+            if body is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return 200, body
+            index, version = self.index, self.version
+        status, payload = build(index)
+        body = json.dumps(payload).encode('utf-8')
+        if status == 200:
+            with self._cache_lock:
+                # Do not cache a response built from a snapshot that was replaced meanwhile
+                if version == self.version:
+                    self._cache[key] = body
+                    if len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return status, body
+
+
+def _int_param(params: Dict[str, List[str]], name: str, default: int, maximum: int) -> int:
+    try:
+        return max(0, min(int(params.get(name, [default])[0]), maximum))
+    except ValueError:
+        return default
+
+
+def route(path: str, params: Dict[str, List[str]]):
+    """Returns a function building (status, payload) from a KeywordIndex, or None for an unknown path."""
+    limit = _int_param(params, "limit", 20, 1000)
+    if path == "/keywords":
+        prefix = params.get("prefix", [""])[0]
+        return lambda index: (200, {"keywords": index.prefix(prefix, limit) if prefix else index.sorted_keywords[:limit],
+                                    "total": len(index.sorted_keywords)})
+    if path.startswith("/keyword/"):
+        keyword = unquote(path[len("/keyword/"):]).lower()
+
+        def keyword_papers(index):
+            if keyword not in index.keywords:
+                return 404, {"error": f"Unknown keyword '{keyword}'"}
+            return 200, {"keyword": keyword, "papers": index.keywords[keyword]}
+        return keyword_papers
+    if path == "/search":
+        query = params.get("q", [""])[0]
+        if not query:
+            return lambda index: (400, {"error": "Missing q parameter"})
+        return lambda index: (200, {"query": query, "keywords": index.fuzzy(query, limit)})
+    if path == "/paper":
+        doi = normalize_doi(params.get("doi", [""])[0])
+        if not doi:
+            return lambda index: (400, {"error": "Missing doi parameter"})
+
+        def paper(index):
+            entries = index.by_doi.get(doi)
+            if not entries:
+                return 404, {"error": f"No paper with DOI '{doi}'"}
+            return 200, {"doi": doi, "entries": [{"keyword": keyword, "paper": p} for keyword, p in entries]}
+        return paper
+    if path.startswith("/provenance/"):
+        keyword = unquote(path[len("/provenance/"):]).lower()
+        depth = _int_param(params, "depth", 3, 50)
+
+        def provenance(index):
+            if keyword not in index.graph:
+                return 404, {"error": f"Unknown keyword '{keyword}'"}
+            return 200, index.provenance(keyword, depth)
+        return provenance
+    if path == "/path":
+        source = params.get("from", [""])[0].lower()
+        target = params.get("to", [""])[0].lower()
+        if not source or not target:
+            return lambda index: (400, {"error": "Missing from or to parameter"})
+
+        def shortest_path(index):
+            path = index.graph.shortest_path(source, target)
+            if path is None:
+                return 404, {"error": f"No provenance path from '{source}' to '{target}'"}
+            return 200, {"from": source, "to": target, "path": path}
+        return shortest_path
+    if path.startswith("/reachable/"):
+        keyword = unquote(path[len("/reachable/"):]).lower()
+        depth = _int_param(params, "depth", 50, 50)
+
+        def reachable(index):
+            if keyword not in index.graph:
+                return 404, {"error": f"Unknown keyword '{keyword}'"}
+            return 200, {"root": keyword, "papers": index.graph.reachable_papers(keyword, depth)}
+        return reachable
+    if path == "/edges":
+        return lambda index: (200, {"edges": [[parent, child] for parent, child, _ in index.graph.edges()]})
+    return None
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    store: QueryStore = None  # set by make_server
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip("/") or "/"
+        if path == "/status":
+            store = self.store
+            store.maybe_reload()
+            self._send(200, json.dumps({"db_file": store.db_file, "keywords": len(store.index.keywords),
+                                        "remaining_to_process": len(store.index.remaining),
+                                        "loaded_at": store.loaded_at, "cache_hits": store.cache_hits}).encode('utf-8'))
+            return
+        if path == "/graph.graphml":
+            self.store.maybe_reload()
+            index = self.store.index
+            if index.graphml is None:
+                index.graphml = index.graph.to_graphml()
+            self._send(200, index.graphml.encode('utf-8'), "application/xml")
+            return
+        build = route(path, parse_qs(parsed.query))
+        if build is None:
+            self._send(404, json.dumps({"error": f"Unknown endpoint '{path}'"}).encode('utf-8'))
+            return
+        status, body = self.store.cached(path + "?" + parsed.query, build)
+        self._send(status, body)
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # one line per request would drown the crawler's output when both run in one terminal
+
+
+def make_server(db_file: str = "keyword_database.json", host: str = "127.0.0.1", port: int = 8765, cache_size: int = 512) -> ThreadingHTTPServer:
+    handler = type("BoundQueryHandler", (QueryHandler,), {"store": QueryStore(db_file, cache_size)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Read-only HTTP/JSON queries over the keyword database.")
+    parser.add_argument("--db", default="keyword_database.json", help="Keyword database file")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-size", type=int, default=512, help="Responses kept in the cache")
+    args = parser.parse_args(argv)
+
+    server = make_server(args.db, args.host, args.port, args.cache_size)
+    print(f"Serving {args.db} on http://{args.host}:{args.port}")
+    print("Endpoints: /keyword/<keyword>, /keywords?prefix=, /search?q=, /paper?doi=, /provenance/<keyword>?depth=, "
+          "/path?from=&to=, /reachable/<keyword>?depth=, /edges, /graph.graphml, /status")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import json
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "in", "is", "it",
+    "its", "of", "on", "or", "that", "the", "this", "to", "was", "we", "were", "which", "with",
+}
+MISSING_ABSTRACTS = {"", "no abstract found", "no abstract available"}
+
+ACCEPT = "accept"
+REJECT = "reject"
+ASK_LLM = "llm"
+
+
+def _recall_threshold(values: List[float], recall: float) -> float:
+    """Highest threshold t such that at least recall of values are >= t."""
+    ordered = sorted(values)
+    allowed_below = int(math.floor((1 - recall) * len(ordered) + 1e-9))
+    return ordered[min(allowed_below, len(ordered) - 1)]
+
+
+class RelevancePrefilter:
+    def __init__(self, reject_below: float = 0.02, accept_above: Optional[float] = None,
+                 accept_score: int = 7, reject_score: int = 0):
+        """
+        CPU-only TF-IDF scorer used ahead of the LLM verifier. Clear negatives are rejected,
+        clear positives are fast-tracked and only the ambiguous band is sent to the LLM.
+
+        Args:
+            reject_below: Papers with a local score below this are rejected without the LLM.
+            accept_above: Papers with a local score at or above this are accepted without the LLM.
+                          None disables fast-tracking until the filter is calibrated.
+            accept_score: Verifier-scale score (0-9) assigned to fast-tracked papers.
+            reject_score: Verifier-scale score (0-9) assigned to rejected papers.
+        """
+        self.reject_below = reject_below
+        self.accept_above = accept_above
+        self.accept_score = accept_score
+        self.reject_score = reject_score
+        self.idf: Dict[str, float] = {}
+        self.default_idf = 1.0
+
+    def _tokenize(self, text: str) -> List[str]:
+        tokens = []
+        for token in re.findall(r"[a-z0-9]+", (text or "").lower()):
+            if token in STOPWORDS:
+                continue
+            # Cheap plural folding so "trees" matches "tree"
+            if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+                token = token[:-1]
+            tokens.append(token)
+        return tokens
+
+    def _paper_text(self, paper: Dict) -> Tuple[str, bool]:
+        abstract = paper.get("abstract") or ""
+        has_abstract = abstract.strip().lower() not in MISSING_ABSTRACTS
+        title = paper.get("title") or ""
+        # Titles are short but precise, so they count twice
+        return f"{title} {title} {abstract if has_abstract else ''}", has_abstract
+
+    def fit(self, documents: List[str]) -> None:
+        """Fits the IDF weights on a corpus of paper texts."""
+        doc_freq = Counter()
+        for doc in documents:
+            doc_freq.update(set(self._tokenize(doc)))
+        n_docs = len(documents)
+        self.idf = {term: math.log((1 + n_docs) / (1 + df)) + 1 for term, df in doc_freq.items()}
+        self.default_idf = math.log(1 + n_docs) + 1
+
+    def _vector(self, text: str) -> Dict[str, float]:
+        counts = Counter(self._tokenize(text))
+        vector = {term: (1 + math.log(tf)) * self.idf.get(term, self.default_idf) for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        return {term: w / norm for term, w in vector.items()}
+
+    def score(self, paper: Dict, keyword: str) -> float:
+        """Cosine similarity between the keyword query and the paper's title and abstract."""
+        text, _ = self._paper_text(paper)
+        query = self._vector(keyword)
+        doc = self._vector(text)
+        return sum(w * doc.get(term, 0.0) for term, w in query.items())
+
+    def decide(self, paper: Dict, keyword: str) -> Tuple[str, float]:
+        """
+        Returns (decision, local score) where decision is ACCEPT, REJECT or ASK_LLM.
+        Papers without an abstract are never rejected locally since the title alone is too thin.
+        """
+        local_score = self.score(paper, keyword)
+        _, has_abstract = self._paper_text(paper)
+        if self.accept_above is not None and local_score >= self.accept_above:
+            return ACCEPT, local_score
+        if has_abstract and local_score < self.reject_below:
+            return REJECT, local_score
+        return ASK_LLM, local_score
+
+    def calibrate(self, keyword_papers: Dict[str, List[Dict]], labelled_pairs: Iterable[Tuple[str, Dict, int]] = (),
+                  reject_recall: float = 0.98, accept_precision: float = 0.95, positive_score: int = 6,
+                  min_pairs: int = 20, min_negatives: int = 20) -> None:
+        """
+        Fits the IDF weights and thresholds on historical data. Papers stored in the keyword database
+        passed the verifier, and the labelled pairs (from VerificationScoreStore.labelled_pairs) carry
+        LLM scores on both sides of positive_score.
+
+        reject_below is placed under the (1 - reject_recall) quantile of all positives' local scores,
+        so at least reject_recall of them survive. When that many positives have no term overlap with
+        their keyword, reject_below becomes 0 and nothing is rejected locally. accept_above is the lowest local score above which the labelled pairs reach
+        accept_precision; fast-tracking stays off until there are min_negatives labelled negatives.
+
+        Args:
+            keyword_papers: keyword -> list of papers, as stored in KeywordDatabase.data["keywords"].
+            labelled_pairs: (keyword, paper, LLM score) triples.
+            reject_recall: Fraction of historical positives that must survive the reject threshold.
+            accept_precision: Fraction of labelled pairs above accept_above that must be positives.
+            positive_score: Verifier score from which a paper is accepted.
+            min_pairs: Minimum number of positives with abstracts required to move reject_below.
+            min_negatives: Minimum number of labelled negatives required to enable fast-tracking.
+        """
+        stored = [(keyword, paper) for keyword, papers in keyword_papers.items() for paper in papers]
+        labelled = list(labelled_pairs)
+        self.fit([self._paper_text(paper)[0] for _, paper in stored] + [self._paper_text(paper)[0] for _, paper, _ in labelled])
+
+        positives = [self.score(paper, keyword) for keyword, paper in stored if self._paper_text(paper)[1]]
+        positives += [self.score(paper, keyword) for keyword, paper, score in labelled
+                      if score >= positive_score and self._paper_text(paper)[1]]
+        if len(positives) < min_pairs:
+            print(f"Only {len(positives)} historical positives with abstracts, keeping default prefilter thresholds")
+        else:
+            # Halve the low quantile: the band just below it is still sent to the LLM
+            self.reject_below = _recall_threshold(positives, reject_recall) * 0.5
+            if sum(1 for value in positives if value >= self.reject_below) < reject_recall * len(positives):
+                self.reject_below = 0.0
+
+        scored = sorted(((self.score(paper, keyword), score >= positive_score) for keyword, paper, score in labelled), reverse=True)
+        negatives = sum(1 for _, positive in scored if not positive)
+        self.accept_above = None
+        if negatives < min_negatives:
+            print(f"Only {negatives} labelled negatives, fast-tracking stays off")
+        else:
+            # Walk down from the highest local score and keep the lowest cut that is still precise enough
+            accepted = 0
+            for count, (local_score, positive) in enumerate(scored, 1):
+                accepted += positive
+                if accepted / count >= accept_precision and local_score > self.reject_below:
+                    self.accept_above = local_score
+        accept = f"{self.accept_above:.3f}" if self.accept_above is not None else "off"
+        kept = sum(1 for value in positives if value >= self.reject_below) / max(len(positives), 1)
+        print(f"Calibrated prefilter on {len(positives)} positives and {negatives} negatives: "
+              f"reject < {self.reject_below:.3f} (keeps {kept:.0%} of positives), accept >= {accept}")
+
+    def calibrate_from_file(self, db_file: str = "keyword_database.json", **kwargs) -> None:
+        if not os.path.exists(db_file):
+            print(f"{db_file} not found, keeping default prefilter thresholds")
+            return
+        with open(db_file, 'r') as f:
+            self.calibrate(json.load(f).get("keywords", {}), **kwargs)
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+class RunStats:
+    def __init__(self):
+        """
+        Process-wide counters (API calls per provider, keywords and papers processed) and optional
+        per-provider concurrency limits. Every outgoing API call is wrapped in api_call(provider).
+        """
+        self.started = time.monotonic()
+        self._counters: Counter = Counter()
+        self._lock = threading.Lock()
+        self._limits: Dict[str, threading.BoundedSemaphore] = {}
+
+    def set_concurrency(self, provider: str, limit: Optional[int]):
+        """Caps concurrent calls to a provider. None or 0 removes the cap. Set before the run starts."""
+        if limit:
+            self._limits[provider] = threading.BoundedSemaphore(limit)
+        else:
+            self._limits.pop(provider, None)
+
+    def incr(self, name: str, amount: int = 1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def get(self, name: str) -> int:
+        with self._lock:
+            return self._counters[name]
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    @contextmanager
+    def api_call(self, provider: str):
+        """Counts one call to provider and holds its concurrency slot for the duration of the call."""
+        self.incr(f"api_calls.{provider}")
+        semaphore = self._limits.get(provider)
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+        self.started = time.monotonic()
+
+    def summary(self, cache_hits: Optional[Dict[str, int]] = None) -> str:
+        elapsed = time.monotonic() - self.started
+        minutes = max(elapsed / 60, 1e-9)
+        counters = self.snapshot()
+        keywords = counters.get("keywords_processed", 0)
+        papers = counters.get("papers_added", 0)
+        lines = [
+            f"Elapsed: {elapsed:.1f}s",
+            f"Keywords processed: {keywords} ({keywords / minutes:.2f}/min)",
+            f"Papers added: {papers} ({papers / minutes:.2f}/min)",
+            "API calls:",
+        ]
+        api_calls = {name.split(".", 1)[1]: count for name, count in counters.items() if name.startswith("api_calls.")}
+        for provider, count in sorted(api_calls.items()):
+            lines.append(f"  {provider}: {count}")
+        if not api_calls:
+            lines.append("  none")
+        if cache_hits:
+            lines.append("Cache hits:")
+            for cache, count in sorted(cache_hits.items()):
+                lines.append(f"  {cache}: {count}")
+        return "\n".join(lines)
+
+
+stats = RunStats()
@@ -0,0 +1,221 @@
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+from atomic_io import atomic_write
+
+# Resource types that are never needed to read page text
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+
+# A refused domain goes straight to the browser for this long before plain requests are tried again
+BROWSER_DOMAIN_TTL = 7 * 24 * 3600
+# 429/503 are often transient, so a domain is only remembered after this many of them in one run
+TRANSIENT_FAILURES_TO_REMEMBER = 3
+# Extra seconds a fetch may wait on top of its page timeout (browser start-up, queued fetches)
+QUEUE_GRACE_SECONDS = 60
+
+_STOP = object()
+
+
+def url_domain(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+class BrowserPool:
+    def __init__(self, size: int = 2, user_agent: Optional[str] = None, domain_file: Optional[str] = "browser_domains.json",
+                 domain_ttl: float = BROWSER_DOMAIN_TTL):
+        """
+        Keeps a few warm headless Chromium contexts for pages that reject plain requests.
+        Playwright's sync API is bound to the thread that started it, so every worker thread owns
+        one browser, one context and one reused page, and fetches are handed to the workers through a queue.
+
+        Args:
+            size: Number of warm browser workers, started lazily on the first fetch.
+            user_agent: User agent for the browser contexts.
+            domain_file: JSON file remembering which domains need the browser tier (None = in memory only).
+            domain_ttl: Seconds a domain stays in the browser tier.
+        """
+        self.size = size
+        self.user_agent = user_agent
+        self.domain_file = domain_file
+        self.domain_ttl = domain_ttl
+        self.jobs: "queue.Queue" = queue.Queue()
+        self.workers = []
+        self.lock = threading.Lock()
+        self.alive = 0  # workers that have not stopped
+        self.worker_errors: Dict[str, BaseException] = {}  # worker name -> why it stopped
+        # Set once every worker has failed; then no fetch can be served
+        self.launch_error: Optional[BaseException] = None
+        self.transient_failures: Counter = Counter()
+        self.browser_domains: Dict[str, float] = self._load_domains()  # domain -> time it was remembered
+
+    def _load_domains(self) -> Dict[str, float]:
+        if self.domain_file and os.path.exists(self.domain_file):
+            try:
+                with open(self.domain_file, 'r', encoding='utf-8') as f:
+                    domains = json.load(f)
+                if isinstance(domains, list):
+                    # Older files were a plain list; give those domains a fresh TTL
+                    return {domain: time.time() for domain in domains}
+                return {domain: float(marked_at) for domain, marked_at in domains.items()}
+            except (json.JSONDecodeError, AttributeError, TypeError, ValueError):
+                print(f"Warning: '{self.domain_file}' is malformed. Forgetting browser-only domains.")
+        return {}
+
+    def _save_domains(self):
+        if not self.domain_file:
+            return
+        with atomic_write(self.domain_file, encoding='utf-8') as f:
+            json.dump(dict(sorted(self.browser_domains.items())), f, indent=2)
+
+    def needs_browser(self, url: str) -> bool:
+        """True if a plain request to this domain was refused within the last domain_ttl seconds."""
+        marked_at = self.browser_domains.get(url_domain(url))
+        return marked_at is not None and time.time() - marked_at < self.domain_ttl
+
+    def mark_needs_browser(self, url: str, status_code: int = 403):
+        """
+        Records that a plain request to the url's domain was refused. A 403 is remembered right away;
+        transient codes (429, 503) only after TRANSIENT_FAILURES_TO_REMEMBER of them.
+        """
+        domain = url_domain(url)
+        with self.lock:
+            if self.needs_browser(url):
+                return
+            if status_code != 403:
+                self.transient_failures[domain] += 1
+                if self.transient_failures[domain] < TRANSIENT_FAILURES_TO_REMEMBER:
+                    return
+            self.transient_failures.pop(domain, None)
+            self.browser_domains[domain] = time.time()
+            self._save_domains()
+        print(f"Remembering that {domain} needs the browser tier.")
+
+    def _start_workers(self):
+        with self.lock:
+            while len(self.workers) < self.size:
+                worker = threading.Thread(target=self._worker, name=f"browser-{len(self.workers)}", daemon=True)
+                self.alive += 1
+                worker.start()
+                self.workers.append(worker)
+
+    @staticmethod
+    def _block_heavy_resources(route):
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            route.abort()
+        else:
+            route.continue_()
+
+    def _fail_pending(self):
+        """Fails every queued fetch with the pool's launch error (no worker is left to serve them)."""
+        while True:
+            try:
+                job = self.jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is _STOP:
+                continue
+            _, _, future = job
+            if future.set_running_or_notify_cancel():
+                future.set_exception(self.launch_error)
+
+    def _worker(self):
+        error = None
+        try:
+            # Imported here so that loading the scrapers does not start up Playwright
+            from playwright.sync_api import sync_playwright
+            self._serve(sync_playwright)
+        except BaseException as e:
+            error = e
+            print(f"Browser worker {threading.current_thread().name} stopped: {e}")
+        finally:
+            with self.lock:
+                self.alive -= 1
+                if error is not None:
+                    self.worker_errors[threading.current_thread().name] = error
+                    # The healthy workers keep serving the queue; only the last one fails the pool
+                    if self.alive == 0:
+                        self.launch_error = error
+                pool_failed = error is not None and self.alive == 0
+            if pool_failed:
+                self._fail_pending()
+
+    def _serve(self, sync_playwright):
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            context = browser.new_context(user_agent=self.user_agent) if self.user_agent else browser.new_context()
+            context.route("**/*", self._block_heavy_resources)
+            page = context.new_page()
+            try:
+                while True:
+                    job = self.jobs.get()
+                    if job is _STOP:
+                        break
+                    url, timeout_ms, future = job
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        page.goto(url, timeout=timeout_ms, wait_until="domcontentloaded")
+                        future.set_result(page.content())
+                    except Exception as e:
+                        future.set_exception(e)
+                        # A page stuck in a bad state is replaced rather than reused
+                        page.close()
+                        page = context.new_page()
+            finally:
+                context.close()
+                browser.close()
+
+    def submit(self, url: str, timeout_ms: int = 30000) -> Future:
+        """Queues a browser fetch and returns a Future of the rendered HTML."""
+        future: Future = Future()
+        if self.launch_error is not None:
+            future.set_exception(self.launch_error)
+            return future
+        self._start_workers()
+        self.jobs.put((url, timeout_ms, future))
+        if self.launch_error is not None:
+            # The workers died while this job was being queued
+            self._fail_pending()
+        return future
+
+    def fetch(self, url: str, timeout_ms: int = 30000) -> str:
+        """
+        Rendered HTML of url. Raises concurrent.futures.TimeoutError if no worker finished it within
+        the page timeout plus QUEUE_GRACE_SECONDS.
+        """
+        future = self.submit(url, timeout_ms)
+        try:
+            return future.result(timeout=timeout_ms / 1000 + QUEUE_GRACE_SECONDS)
+        except FutureTimeoutError:
+            future.cancel()  # a worker that has not started it yet skips it
+            raise
+
+    def shutdown(self):
+        with self.lock:
+            workers, self.workers = self.workers, []
+        for _ in workers:
+            self.jobs.put(_STOP)
+        for worker in workers:
+            worker.join(timeout=10)
+
+
+_shared_pool: Optional[BrowserPool] = None
+_shared_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Process-wide pool shared by every WebPageExtractor."""
+    global _shared_pool
+    with _shared_lock:
+        if _shared_pool is None:
+            _shared_pool = BrowserPool()
+            atexit.register(_shared_pool.shutdown)
+        return _shared_pool
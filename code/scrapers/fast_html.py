@@ -0,0 +1,350 @@
+"""
+lxml fast path for the scrapers' HTML extraction. Every function returns the same output as the
+BeautifulSoup code it replaces, or None when lxml is unavailable or cannot parse the document so
+callers can fall back to BeautifulSoup. tests/test_fast_html.py checks parity offline on fixture
+pages; run this module with a URL or HTML file to check another page.
+"""
+import bisect
+import re
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+# BeautifulSoup's get_text() leaves out the contents of these tags (and comments)
+NON_TEXT_TAGS = {"script", "style", "template", "rt", "rp"}
+PAGE_NOISE_TAGS = ["script", "style", "header", "footer", "nav", "form", "noscript", "iframe", "aside"]
+PARAGRAPH_TAGS = ['p', 'h1', 'h2', 'h3', 'h4', 'h5', 'li']
+MAIN_CLASS_PATTERN = re.compile("content|article|main", re.I)
+REFERENCE_HEADER_PATTERN = re.compile(r"(references|bibliography|sources|works cited)")
+REFERENCE_BLOCK_TAGS = ("p", "li", "div")
+HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+# A block with nested blocks is still one reference when this much of its text is outside them,
+# e.g. a PMC <li> whose citation text is followed by a <div> of [PubMed] [DOI] links
+OWN_TEXT_MIN_CHARS = 10
+
+# Output caps for WebPageExtractor.extract_content_and_refs; large PMC articles otherwise flood the prompt
+MAX_REFERENCES = 200
+MAX_REFERENCE_CHARS = 20000
+MAX_LINKS = 500
+
+
+def parse(html) -> Optional["lxml.html.HtmlElement"]:
+    if lxml is None or not html:
+        return None
+    try:
+        return lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError):
+        return None
+
+
+def _strings(element) -> Iterator[str]:
+    if element.text and element.tag not in NON_TEXT_TAGS:
+        yield element.text
+    for child in element:
+        # Comments and processing instructions have a non-string tag; only their tail is text
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def get_text(element, separator: str = "", strip: bool = False) -> str:
+    """Equivalent of BeautifulSoup's Tag.get_text(separator, strip=strip)."""
+    if strip:
+        return separator.join(s.strip() for s in _strings(element) if s.strip())
+    return separator.join(_strings(element))
+
+
+def stripped_strings(element) -> List[str]:
+    return [s.strip() for s in _strings(element) if s.strip()]
+
+
+def has_class(element, name: str) -> bool:
+    return name in (element.get("class") or "").split()
+
+
+def _descendants(element, tags) -> list:
+    # find_all() semantics: matching descendants in document order, never the element itself
+    return [el for el in element.iterdescendants(*tags)]
+
+
+def section_rank(header_name: str) -> int:
+    # A reference section under <h3> ends at the next h1-h3; one introduced by <strong>/<b> at any heading
+    return HEADING_LEVELS.get(header_name, 6)
+
+
+def bounded_references(texts: Iterator[str], max_references: int = MAX_REFERENCES, max_chars: int = MAX_REFERENCE_CHARS) -> List[str]:
+    """Collects distinct reference texts longer than 10 characters, stopping once either cap is reached."""
+    refs, seen, total = [], set(), 0
+    for text in texts:
+        if len(text) <= 10 or text in seen:
+            continue
+        if len(refs) >= max_references or total + len(text) > max_chars:
+            break
+        seen.add(text)
+        refs.append(text)
+        total += len(text)
+    return refs
+
+
+def bounded_links(links: Iterator, max_links: int = MAX_LINKS) -> List[Dict]:
+    """Keeps the first anchor for each distinct href, skipping in-page fragment links."""
+    refs, seen = [], set()
+    for anchor, href in links:
+        if href.startswith("#") or href in seen:
+            continue
+        if len(refs) >= max_links:
+            break
+        seen.add(href)
+        refs.append({"anchor": anchor, "href": href})
+    return refs
+
+
+def _iter_following(element) -> Iterator:
+    """Elements after element's start tag in document order, generated lazily (find_all_next order)."""
+    yield from element.iterdescendants()
+    node = element
+    while node is not None:
+        for sibling in node.itersiblings():
+            yield sibling
+            yield from sibling.iterdescendants()
+        node = node.getparent()
+
+
+def own_text_length(parts: Iterator[str]) -> int:
+    return len(" ".join(" ".join(parts).split()))
+
+
+def _own_strings(element) -> Iterator[str]:
+    """Text of element outside its nested p/li/div blocks."""
+    if element.text and element.tag not in NON_TEXT_TAGS:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS and child.tag not in REFERENCE_BLOCK_TAGS:
+            yield from _own_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _reference_blocks(header) -> Iterator[str]:
+    # One text per reference: a block is emitted whole (and its nested blocks skipped) when it has no
+    # nested blocks or enough text of its own; wrapper blocks are descended into instead
+    rank = section_rank(header.tag)
+    emitted = None
+    for element in _iter_following(header):
+        if not isinstance(element.tag, str):
+            continue
+        if HEADING_LEVELS.get(element.tag, 99) <= rank:
+            return
+        if element.tag not in REFERENCE_BLOCK_TAGS:
+            continue
+        if emitted is not None and any(ancestor is emitted for ancestor in element.iterancestors()):
+            continue
+        if next(element.iterdescendants(*REFERENCE_BLOCK_TAGS), None) is None or own_text_length(_own_strings(element)) > OWN_TEXT_MIN_CHARS:
+            emitted = element
+            yield get_text(element, " ", strip=True)
+
+
+def page_paragraphs(html) -> Optional[List[str]]:
+    """Fast path for GoogleSearcher.fetch_page_text: the main content's paragraphs."""
+    root = parse(html)
+    if root is None:
+        return None
+    for tag in _descendants(root, PAGE_NOISE_TAGS):
+        tag.drop_tree()
+
+    main_content = next(root.iter("main"), None)
+    if main_content is None:
+        main_content = next(root.iter("article"), None)
+    if main_content is None:
+        main_content = next((div for div in root.iter("div") if MAIN_CLASS_PATTERN.search(div.get("class") or "")), None)
+    if main_content is None:
+        main_content = root
+
+    paragraphs = []
+    for p in _descendants(main_content, PARAGRAPH_TAGS):
+        text = get_text(p).strip()
+        if text and len(text) > 15:
+            paragraphs.append(text)
+
+    if not paragraphs:
+        text = get_text(main_content, separator="\n")
+        lines = [line.strip() for line in text.splitlines()]
+        paragraphs = [line for line in lines if line and len(line) > 15]
+    return paragraphs
+
+
+def metadata(html, url: str) -> Optional[Dict]:
+    """Fast path for WebPageExtractor.extract_metadata."""
+    root = parse(html)
+    if root is None:
+        return None
+    title_tag = next(root.iter("title"), None)
+    title = title_tag.text if title_tag is not None and len(title_tag) == 0 else None
+    desc_tags = root.xpath("//meta[@name='description']") or root.xpath("//meta[@property='og:description']")
+    description = desc_tags[0].get("content") if desc_tags else None
+    return {"title": title, "description": description, "url": url}
+
+
+def content_and_refs(html, max_references: int = MAX_REFERENCES, max_reference_chars: int = MAX_REFERENCE_CHARS,
+                     max_links: int = MAX_LINKS) -> Optional[Dict]:
+    """Fast path for WebPageExtractor.extract_content_and_refs."""
+    root = parse(html)
+    if root is None:
+        return None
+    for tag in _descendants(root, ["script", "style"]):
+        tag.drop_tree()
+
+    all_text = " ".join(text for text in (get_text(p, " ", strip=True) for p in root.iter("p")) if text)
+
+    global_refs = bounded_links(((get_text(a, " ", strip=True), a.get("href"))
+                                 for a in root.iter("a") if a.get("href") is not None), max_links)
+
+    explicit_refs = []
+    for header in root.iter("h2", "h3", "h4", "strong", "b"):
+        if REFERENCE_HEADER_PATTERN.search(get_text(header).lower()):
+            explicit_refs = bounded_references(_reference_blocks(header), max_references, max_reference_chars)
+            break
+
+    return {
+        "all_text": all_text,
+        "explicit_references": explicit_refs,
+        "global_references": global_refs
+    }
+
+
+def wiki_references(html) -> Optional[Dict[int, str]]:
+    """
+    Fast path for WikipediaParser.extract_references. Returns numbered references, {} when the
+    page has no References/Notes heading, or None to fall back to BeautifulSoup.
+    """
+    root = parse(html)
+    if root is None:
+        return None
+
+    def has_heading(section_name):
+        if root.xpath("//*[@id=$id]", id=section_name):
+            return True
+        names = [section_name.lower(), f'notes and {section_name.lower()}']
+        return any(get_text(h).strip().lower() in names for h in root.iter('h2', 'h3', 'h4'))
+
+    has_references, has_notes = has_heading('References'), has_heading('Notes')
+    if not has_references and not has_notes:
+        print("Could not find References or Notes heading with content.")
+        return {}
+
+    refs = {}
+    for ol in root.iter('ol'):
+        if not has_class(ol, 'references'):
+            continue
+        for li in ol.iterchildren('li'):
+            backlink = next((span for span in li.iter('span') if has_class(span, 'mw-cite-backlink')), None)
+            if backlink is not None:
+                backlink.drop_tree()
+            text = " ".join(stripped_strings(li))
+            refs[len(refs) + 1] = re.sub(r'^(\^\s*([a-z]\s+)*)+', '', text).strip()
+
+    # Both headings collect the same <ol class="references"> lists, so only the messages differ
+    if has_references and refs:
+        print(f"Using References section with {len(refs)} references")
+    elif refs:
+        print(f"No References section found, using Notes section with {len(refs)} references")
+    else:
+        print("Could not find References or Notes heading with content.")
+    return refs
+
+
+def wiki_sections(html) -> Optional[Dict[str, str]]:
+    """Fast path for WikipediaParser.extract_sections."""
+    root = parse(html)
+    if root is None:
+        return None
+    content = next((div for div in root.iter('div') if has_class(div, 'mw-parser-output')), None)
+    if content is None:
+        print("Article body container not found.")
+        return {}
+
+    headings = _descendants(content, ['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+    paragraphs = [p for p in content.iterdescendants('p') if get_text(p).strip()]
+    paragraph_lines = [p.sourceline for p in paragraphs]
+    paragraph_text = lambda ps: "\n\n".join(" ".join(stripped_strings(p)) for p in ps)
+
+    sections = {}
+    if headings:
+        first_heading_idx = bisect.bisect_right(paragraph_lines, headings[0].sourceline)
+        intro_paragraphs = paragraphs[:first_heading_idx] if first_heading_idx < len(paragraphs) else paragraphs
+    else:
+        intro_paragraphs = paragraphs
+    if intro_paragraphs:
+        sections["Introduction"] = paragraph_text(intro_paragraphs)
+
+    current_path = {level: None for level in range(1, 7)}
+    for i, heading in enumerate(headings):
+        level = int(heading.tag[1])
+        heading_text = get_text(heading).strip()
+        current_path[level] = heading_text
+        for l in range(level + 1, 7):
+            current_path[l] = None
+        if level == 2:
+            full_path_heading = heading_text
+        else:
+            path_parts = [current_path[l] for l in range(2, level) if current_path[l] is not None]
+            full_path_heading = " - ".join(path_parts + [heading_text])
+
+        # Paragraphs are in document order, so each section is a contiguous slice by source line
+        start_idx = bisect.bisect_right(paragraph_lines, heading.sourceline)
+        if i < len(headings) - 1:
+            end_idx = bisect.bisect_right(paragraph_lines, headings[i + 1].sourceline)
+        else:
+            end_idx = len(paragraphs)
+        if start_idx < end_idx:
+            sections[full_path_heading] = paragraph_text(paragraphs[start_idx:end_idx])
+    return sections
+
+
+if __name__ == "__main__":
+    # Parity check against the BeautifulSoup implementations: python fast_html.py <url or file.html>
+    import os
+    import sys
+    from unittest import mock
+
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import requests
+    from scrapers import fast_html, general_scraper, google_search, wiki_parser
+
+    if len(sys.argv) != 2:
+        sys.exit("usage: python scrapers/fast_html.py <url or file.html>")
+    source = sys.argv[1]
+    if os.path.exists(source):
+        with open(source, 'r', encoding='utf-8') as f:
+            page_html = f.read()
+    else:
+        page_html = requests.get(source, headers={"User-Agent": "Mozilla/5.0"}, timeout=30).text
+
+    # Disable the fast path inside the scrapers to get the BeautifulSoup results
+    with mock.patch.object(fast_html, "lxml", None):
+        extractor = general_scraper.WebPageExtractor(source)
+        extractor.html = page_html
+        slow = {
+            "page_paragraphs": google_search.GoogleSearcher()._page_paragraphs_bs4(page_html),
+            "metadata": extractor.extract_metadata(),
+            "content_and_refs": extractor.extract_content_and_refs(),
+            "wiki_references": wiki_parser.WikipediaParser().extract_references(source, page_html),
+            "wiki_sections": wiki_parser.WikipediaParser().extract_sections(source, page_html),
+        }
+
+    fast = {
+        "page_paragraphs": fast_html.page_paragraphs(page_html),
+        "metadata": fast_html.metadata(page_html, source),
+        "content_and_refs": fast_html.content_and_refs(page_html),
+        "wiki_references": fast_html.wiki_references(page_html),
+        "wiki_sections": fast_html.wiki_sections(page_html),
+    }
+    mismatches = [name for name in fast if fast[name] != slow[name]]
+    for name in fast:
+        print(f"{name}: {'OK' if name not in mismatches else 'MISMATCH'}")
+    sys.exit(1 if mismatches else 0)
@@ -1,11 +1,21 @@
 import re
 import requests
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright
+from bs4 import BeautifulSoup, NavigableString, Tag
+from scrapers import fast_html
+from scrapers.browser_pool import get_browser_pool
+from run_stats import stats
+
+# Status codes that bot-protected sites answer plain requests with
+BROWSER_TIER_STATUS_CODES = {403, 429, 503}
 
 class WebPageExtractor:
-    def __init__(self, url: str):
+    def __init__(self, url: str, browser_pool=None, max_references: int = fast_html.MAX_REFERENCES,
+                 max_reference_chars: int = fast_html.MAX_REFERENCE_CHARS, max_links: int = fast_html.MAX_LINKS):
         self.url = url
+        self.max_references = max_references
+        self.max_reference_chars = max_reference_chars
+        self.max_links = max_links
+        self.browser_pool = browser_pool or get_browser_pool()
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -14,34 +24,46 @@ class WebPageExtractor:
             )
         }
         self.html = None
-        self.soup = None
+        self._soup = None
+
+    @property
+    def soup(self):
+        # Only built when the lxml fast path is unavailable
+        if self._soup is None and self.html is not None:
+            self._soup = BeautifulSoup(self.html, "html.parser")
+        return self._soup
 
     def fetch_requests(self):
-        resp = requests.get(self.url, headers=self.headers, timeout=10)
+        with stats.api_call("web"):
+            resp = requests.get(self.url, headers=self.headers, timeout=10)
         resp.raise_for_status()
         return resp.text
 
     def fetch_playwright(self):
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(self.url, timeout=30000)
-            content = page.content()
-            browser.close()
-            return content
+        with stats.api_call("browser"):
+            return self.browser_pool.fetch(self.url, timeout_ms=30000)
 
     def fetch(self):
-        try:
-            self.html = self.fetch_requests()
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None and e.response.status_code == 403:
-                print("⚠️ 403 Forbidden – retrying with Playwright...")
-                self.html = self.fetch_playwright()
-            else:
-                raise e
-        self.soup = BeautifulSoup(self.html, "html.parser")
+        # Domains that refused plain requests before go straight to the browser tier
+        if self.browser_pool.needs_browser(self.url):
+            self.html = self.fetch_playwright()
+        else:
+            try:
+                self.html = self.fetch_requests()
+            except requests.exceptions.HTTPError as e:
+                if e.response is not None and e.response.status_code in BROWSER_TIER_STATUS_CODES:
+                    print(f"⚠️ {e.response.status_code} – retrying with Playwright...")
+                    self.browser_pool.mark_needs_browser(self.url, e.response.status_code)
+                    self.html = self.fetch_playwright()
+                else:
+                    raise e
+        self._soup = None
 
     def extract_metadata(self):
+        fast_meta = fast_html.metadata(self.html, self.url)
+        if fast_meta is not None:
+            return fast_meta
+
         title = self.soup.title.string if self.soup.title else None
         desc_tag = self.soup.find("meta", attrs={"name": "description"}) or \
                    self.soup.find("meta", attrs={"property": "og:description"})
@@ -49,6 +71,10 @@ class WebPageExtractor:
         return {"title": title, "description": description, "url": self.url}
 
     def extract_content_and_refs(self):
+        fast_result = fast_html.content_and_refs(self.html, self.max_references, self.max_reference_chars, self.max_links)
+        if fast_result is not None:
+            return fast_result
+
         # remove scripts/styles
         for script in self.soup(["script", "style"]):
             script.decompose()
@@ -56,22 +82,15 @@ class WebPageExtractor:
         # get all visible text as one block
         all_text = " ".join([p.get_text(" ", strip=True) for p in self.soup.find_all("p") if p.get_text(strip=True)])
 
-        # extract all explicit <a> references
-        global_refs = []
-        for a in self.soup.find_all("a", href=True):
-            anchor = a.get_text(" ", strip=True)
-            href = a["href"]
-            global_refs.append({"anchor": anchor, "href": href})
+        # extract explicit <a> references, one per distinct href
+        global_refs = fast_html.bounded_links(((a.get_text(" ", strip=True), a["href"])
+                                               for a in self.soup.find_all("a", href=True)), self.max_links)
 
         # try to find a dedicated references section
         explicit_refs = []
         for header in self.soup.find_all(["h2", "h3", "h4", "strong", "b"]):
             if re.search(r"(references|bibliography|sources|works cited)", header.get_text().lower()):
-                sibs = header.find_all_next(["p", "li", "div"])
-                for s in sibs:
-                    t = s.get_text(" ", strip=True)
-                    if len(t) > 10:
-                        explicit_refs.append(t)
+                explicit_refs = fast_html.bounded_references(self._reference_blocks(header), self.max_references, self.max_reference_chars)
                 break
 
         return {
@@ -80,6 +99,33 @@ class WebPageExtractor:
             "global_references": global_refs
         }
 
+    def _own_strings(self, element):
+        # bs4 counterpart of fast_html._own_strings
+        for child in element.children:
+            if isinstance(child, Tag):
+                if child.name not in fast_html.NON_TEXT_TAGS and child.name not in fast_html.REFERENCE_BLOCK_TAGS:
+                    yield from self._own_strings(child)
+            elif type(child) is NavigableString:
+                yield child
+
+    def _reference_blocks(self, header):
+        # Walks forward lazily until the next heading of the same or higher rank (see fast_html._reference_blocks)
+        rank = fast_html.section_rank(header.name)
+        emitted = None
+        for element in header.next_elements:
+            if not isinstance(element, Tag):
+                continue
+            if fast_html.HEADING_LEVELS.get(element.name, 99) <= rank:
+                return
+            if element.name not in fast_html.REFERENCE_BLOCK_TAGS:
+                continue
+            if emitted is not None and any(parent is emitted for parent in element.parents):
+                continue
+            if element.find(fast_html.REFERENCE_BLOCK_TAGS) is None or \
+                    fast_html.own_text_length(self._own_strings(element)) > fast_html.OWN_TEXT_MIN_CHARS:
+                emitted = element
+                yield element.get_text(" ", strip=True)
+
     def run(self):
         self.fetch()
         meta = self.extract_metadata()
@@ -1,28 +1,71 @@
 import requests
 from bs4 import BeautifulSoup
 from googlesearch import search
+from scrapers import fast_html
+from run_stats import stats
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+import threading
 import time
 import re
 
+
+class HostThrottle:
+    def __init__(self, delay: float):
+        """Spaces requests to the same host at least `delay` seconds apart; different hosts never wait on each other."""
+        self.delay = delay
+        self.next_slot = {}
+        self.lock = threading.Lock()
+
+    def wait(self, url: str):
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class GoogleSearcher:
-    def __init__(self, user_agent=None):
+    def __init__(self, user_agent=None, max_workers=8, per_host_delay=2.0, fetch_timeout=15):
+        """
+        Args:
+            max_workers: Upper bound on pages fetched at once (shared by every caller of this searcher).
+            per_host_delay: Minimum seconds between two requests to the same host.
+            fetch_timeout: Total seconds allowed per URL, including the body download.
+        """
         self.headers = {
             "User-Agent": user_agent or "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
             "Accept-Language": "en-US,en;q=0.9"
         }
+        self.fetch_timeout = fetch_timeout
+        self.throttle = HostThrottle(per_host_delay)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="page-fetch")
 
     def search_query(self, query, max_results=3):
-        return list(search(query, num_results=max_results))
+        with stats.api_call("google"):
+            return list(search(query, num_results=max_results))
 
-    def fetch_page_text(self, url):
-        try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+    def _download(self, url, timeout):
+        """GETs a page, giving up once the whole download exceeds `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        with stats.api_call("web"), self.session.get(url, headers=self.headers, timeout=timeout, stream=True) as response:
             if response.status_code != 200:
-                return f"[Error {response.status_code}]: Unable to fetch {url}"
-        except Exception as e:
-            return f"[Exception]: {e}"
-
-        soup = BeautifulSoup(response.text, "html.parser")
+                return response.status_code, None
+            chunks = []
+            for chunk in response.iter_content(chunk_size=65536):
+                chunks.append(chunk)
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"download exceeded {timeout}s")
+            return response.status_code, b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+
+    def _page_paragraphs_bs4(self, html):
+        soup = BeautifulSoup(html, "html.parser")
         for tag in soup(["script", "style", "header", "footer", "nav", "form", "noscript", "iframe", "aside"]):
             tag.decompose()
         main_content = soup.find("main") or soup.find("article") or soup.find("div", class_=re.compile("content|article|main", re.I)) or soup
@@ -37,6 +80,20 @@ class GoogleSearcher:
             text = main_content.get_text(separator="\n")
             lines = [line.strip() for line in text.splitlines()]
             paragraphs = [line for line in lines if line and len(line) > 15]
+        return paragraphs
+
+    def fetch_page_text(self, url, timeout=None):
+        self.throttle.wait(url)
+        try:
+            status_code, html = self._download(url, timeout or self.fetch_timeout)
+            if status_code != 200:
+                return f"[Error {status_code}]: Unable to fetch {url}"
+        except Exception as e:
+            return f"[Exception]: {e}"
+
+        paragraphs = fast_html.page_paragraphs(html)
+        if paragraphs is None:
+            paragraphs = self._page_paragraphs_bs4(html)
 
         visible_text = "\n\n".join(paragraphs)
         return re.sub(r'\n\s*\n', '\n\n', visible_text)
@@ -59,6 +116,25 @@ class GoogleSearcher:
 
         return "\n\n".join(filtered_paragraphs)
 
+    def _fetch_meaningful(self, url, timeout=None):
+        print(f"Fetching content from: {url}")
+        return self.extract_meaningful_info(self.fetch_page_text(url, timeout))
+
+    def iter_urls_contents(self, urls, timeout=None):
+        """Fetches URLs concurrently and yields (url, meaningful content) in completion order."""
+        futures = {self.executor.submit(self._fetch_meaningful, url, timeout): url for url in urls}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def iter_webpage_contents(self, query, max_results=3, timeout=None):
+        """Streaming variant of get_webpage_contents: pages are yielded as soon as each one is fetched."""
+        print(f"Searching for: {query}")
+        urls = self.search_query(query, max_results)
+        if not urls:
+            yield ("No results found", "Search failed to return any valid URLs.")
+            return
+        yield from self.iter_urls_contents(urls, timeout)
+
     def get_webpage_contents(self, query, max_results=3):
         print(f"Searching for: {query}")
         urls = self.search_query(query, max_results)
@@ -66,15 +142,9 @@ class GoogleSearcher:
         if not urls:
             return [("No results found", "Search failed to return any valid URLs.")]
 
-        page_contents = []
-        for url in urls:
-            print(f"Fetching content from: {url}")
-            content = self.fetch_page_text(url)
-            meaningful_content = self.extract_meaningful_info(content)
-            page_contents.append((url, meaningful_content))
-            time.sleep(2)
-
-        return page_contents
+        # Pages are fetched concurrently but returned in search-rank order
+        contents = dict(self.iter_urls_contents(urls))
+        return [(url, contents[url]) for url in dict.fromkeys(urls)]
 
     def extract_citation_blocks(self, text):
         citation_blocks = []
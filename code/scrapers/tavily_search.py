@@ -1,26 +1,150 @@
 from tavily import TavilyClient
 from dotenv import load_dotenv
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+import json
 import os
+import re
+import threading
+
+from atomic_io import atomic_write
+from run_stats import stats
 
 load_dotenv()
+
+
+def normalize_query(query: str) -> str:
+    return re.sub(r'\s+', ' ', query.lower()).strip()
+
+
+class FixtureBackend:
+    def __init__(self, fixture_file: str):
+        """
+        Offline stand-in for TavilyClient that answers from a JSON file of
+        {normalized query: response}. Unknown queries get an empty response.
+        """
+        with open(fixture_file, 'r', encoding='utf-8') as f:
+            self.responses = {normalize_query(query): response for query, response in json.load(f).items()}
+        self.calls = 0
+
+    def search(self, query, **kwargs):
+        self.calls += 1
+        return self.responses.get(normalize_query(query), {"query": query, "answer": None, "results": []})
+
+
 class TavilySearcher:
-    def __init__(self):
-        self.TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+    def __init__(self, cache_file: Optional[str] = "tavily_cache.json", backend=None, max_workers: int = 4):
+        """
+        Tavily client that caches full responses (answer plus result URLs, snippets and scores)
+        per normalized query, so repeated keywords never cost another API call.
+
+        Args:
+            cache_file: JSON file backing the cache. None keeps responses in memory only.
+            backend: Object with a TavilyClient-compatible search(). Defaults to TavilyClient,
+                     use FixtureBackend to run offline.
+            max_workers: Concurrent API requests in search_many.
+        """
+        if backend is None:
+            self.TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+
+            if not self.TAVILY_API_KEY:
+                raise ValueError("Tavily API key not found")
 
-        if not self.TAVILY_API_KEY:
-            raise ValueError("Tavily API key not found")
+            backend = TavilyClient(api_key=self.TAVILY_API_KEY)
+        self.client = backend
+        self.cache_file = cache_file
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self.cache: Dict[str, Dict] = self._load()
+        self.hits = 0
+        self.misses = 0
 
-        self.client = TavilyClient(api_key=self.TAVILY_API_KEY)
+    def _load(self) -> Dict:
+        if self.cache_file and os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                print(f"Error reading {self.cache_file}, starting with an empty Tavily cache")
+        return {}
+
+    def save(self):
+        if not self.cache_file:
+            return
+        with self._lock:
+            snapshot = dict(self.cache)
+        with self._save_lock:
+            with atomic_write(self.cache_file, encoding='utf-8') as f:
+                json.dump(snapshot, f)
+
+    @staticmethod
+    def cache_key(query: str, search_depth: str, max_results: int) -> str:
+        return f"{search_depth}|{max_results}|{normalize_query(query)}"
+
+    def search(self, query: str, max_results: int = 5, search_depth: str = "basic") -> Dict:
+        """Full Tavily response for the query: {"answer", "results": [{url, title, content, score}, ...]}."""
+        key = self.cache_key(query, search_depth, max_results)
+        with self._lock:
+            if key in self.cache:
+                self.hits += 1
+                return self.cache[key]
+            # Concurrent callers asking the same query wait for the single request in flight
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._in_flight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            with stats.api_call("tavily"):
+                response = self.client.search(query=query, search_depth=search_depth, include_answer=True, max_results=max_results)
+            with self._lock:
+                self.cache[key] = response
+            self.save()
+            future.set_result(response)
+            return response
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def search_many(self, queries: Iterable[str], max_results: int = 5, search_depth: str = "basic") -> Dict[str, Dict]:
+        """Runs several queries concurrently. Returns query -> response; failed queries are left out."""
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return {}
+
+        def run(query):
+            try:
+                return self.search(query, max_results, search_depth)
+            except Exception as e:
+                print(f"Tavily search failed for '{query}': {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queries))) as executor:
+            responses = executor.map(run, queries)
+        return {query: response for query, response in zip(queries, responses) if response is not None}
+
+    def result_urls(self, query: str, max_results: int = 5) -> List[str]:
+        """Result URLs of the query, best scored first."""
+        results = self.search(query, max_results).get("results", [])
+        return [result["url"] for result in sorted(results, key=lambda r: r.get("score", 0), reverse=True) if result.get("url")]
 
     def search_query(self, query):
-        response = self.client.search(query=query, search_depth="basic", include_answer=True, max_results=5)        
+        response = self.search(query)
         if response.get('answer'):
             answer = response['answer']
             # return self.extract_quoted_text(answer)
             return answer
-        
+
         return "Could not extract paper title"
-    
+
     def extract_quoted_text(self, text):
         if '"' in text:
             start = text.find('"')
@@ -36,4 +160,4 @@ if __name__ == "__main__":
     query = f"Which foundational research papers were responsible for inventing/discovering Convolutional Neural Networks in Computer Science? Look for older, foundational papers."
 
     title = searcher.search_query(query)
-    print(f"\nExtracted title: {title}")
\ No newline at end of file
+    print(f"\nExtracted title: {title}")
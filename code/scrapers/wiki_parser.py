@@ -2,6 +2,9 @@ import requests
 from bs4 import BeautifulSoup
 import re
 
+from scrapers import fast_html
+from run_stats import stats
+
 class WikipediaParser:
     def __init__(self):
         self.session = requests.Session()
@@ -9,18 +12,26 @@ class WikipediaParser:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
 
-    def extract_page_soup(self, full_url):
+    def fetch_html(self, full_url):
         try:
             print(f"Fetching URL: {full_url}")
-            resp = self.session.get(full_url)
+            with stats.api_call("wikipedia"):
+                resp = self.session.get(full_url)
             resp.raise_for_status()
             print("Successfully fetched page.")
-            return BeautifulSoup(resp.text, 'html.parser')
+            return resp.text
         except requests.RequestException as e:
             print(f"Error fetching page: {e}")
         except Exception as e:
             print(f"Unexpected error: {e}")
         return None
+
+    def extract_page_soup(self, full_url, html=None):
+        if html is None:
+            html = self.fetch_html(full_url)
+        if html is None:
+            return None
+        return BeautifulSoup(html, 'html.parser')
     
     def _extract_refs_from_section(self, soup, section_name):
         """Helper method to extract references from a specific section"""
@@ -60,20 +71,17 @@ class WikipediaParser:
         
         return refs
     
-    def extract_references(self, full_url):
-        try:
-            print(f"Fetching URL: {full_url}")
-            resp = self.session.get(full_url)
-            resp.raise_for_status()
-            print("Successfully fetched page.")
-        except requests.RequestException as e:
-            print(f"Error fetching page: {e}")
-            return []
-        except Exception as e:
-            print(f"An unexpected error occurred during fetch: {e}")
+    def extract_references(self, full_url, html=None):
+        if html is None:
+            html = self.fetch_html(full_url)
+        if html is None:
             return []
 
-        soup = BeautifulSoup(resp.text, 'lxml')
+        fast_refs = fast_html.wiki_references(html)
+        if fast_refs is not None:
+            return fast_refs
+
+        soup = BeautifulSoup(html, 'lxml')
 
         # Extract references from both "References" and "Notes" sections
         references_refs = self._extract_refs_from_section(soup, 'References')
@@ -93,8 +101,16 @@ class WikipediaParser:
             print("Could not find References or Notes heading with content.")
             return {}
     
-    def extract_sections(self, full_url):
-        soup = self.extract_page_soup(full_url)
+    def extract_sections(self, full_url, html=None):
+        if html is None:
+            html = self.fetch_html(full_url)
+        if html is None:
+            return {}
+        fast_sections = fast_html.wiki_sections(html)
+        if fast_sections is not None:
+            return fast_sections
+
+        soup = self.extract_page_soup(full_url, html)
         if not soup:
             return {}
 
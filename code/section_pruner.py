@@ -0,0 +1,158 @@
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+# Wikipedia render output joins citation markers with spaces, e.g. "[ 12 ]"
+CITATION_PATTERN = re.compile(r"\[\s*(\d+)\s*\]")
+YEAR_PATTERN = re.compile(r"\b(1[5-9]\d\d|20\d\d)s?\b")
+CUE_PATTERN = re.compile(
+    r"\b(introduc\w*|propos\w*|invent\w*|discover\w*|develop\w*|first|originat\w*|pioneer\w*|publish\w*|describ\w*|coin\w*)\b",
+    re.IGNORECASE,
+)
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+REFERENCES_MARKER = "\n\nReferences:\n"
+
+
+class SectionPruner:
+    def __init__(self, token_budget: int = 3000, chars_per_token: int = 4,
+                 year_weight: float = 1.0, citation_weight: float = 1.5,
+                 cue_weight: float = 1.0, bm25_weight: float = 1.0,
+                 k1: float = 1.5, b: float = 0.75):
+        """
+        Ranks section paragraphs by cheap local signals and keeps the best ones
+        that fit into a token budget before anything is sent to Gemini.
+
+        Args:
+            token_budget: Maximum estimated tokens kept across all target sections.
+            chars_per_token: Characters per token used for the token estimate.
+            year_weight, citation_weight, cue_weight, bm25_weight: Signal weights.
+            k1, b: BM25 parameters.
+        """
+        self.token_budget = token_budget
+        self.chars_per_token = chars_per_token
+        self.year_weight = year_weight
+        self.citation_weight = citation_weight
+        self.cue_weight = cue_weight
+        self.bm25_weight = bm25_weight
+        self.k1 = k1
+        self.b = b
+        self.last_stats = {"tokens_before": 0, "tokens_after": 0, "tokens_saved": 0}
+
+    def estimate_tokens(self, text: str) -> int:
+        if not text:
+            return 0
+        return max(1, math.ceil(len(text) / self.chars_per_token))
+
+    def _tokenize(self, text: str) -> List[str]:
+        return TOKEN_PATTERN.findall(text.lower())
+
+    def _split_section(self, content: str) -> Tuple[List[str], Dict[int, str]]:
+        """Splits fused section content into paragraphs and its numbered references."""
+        body, _, refs_block = content.partition(REFERENCES_MARKER)
+        paragraphs = [p.strip() for p in body.split("\n\n") if p.strip()]
+
+        references = {}
+        for line in refs_block.split("\n"):
+            match = re.match(r"^\[(\d+)\]\s*(.*)", line.strip())
+            if match:
+                references[int(match.group(1))] = match.group(2)
+        return paragraphs, references
+
+    def _bm25_scores(self, paragraphs: List[str], keyword: str) -> List[float]:
+        docs = [self._tokenize(p) for p in paragraphs]
+        query = set(self._tokenize(keyword))
+        if not docs or not query:
+            return [0.0] * len(docs)
+
+        n_docs = len(docs)
+        avg_len = sum(len(d) for d in docs) / n_docs or 1.0
+        doc_freq = Counter()
+        for doc in docs:
+            doc_freq.update(set(doc))
+
+        scores = []
+        for doc in docs:
+            counts = Counter(doc)
+            score = 0.0
+            for term in query:
+                tf = counts.get(term, 0)
+                if not tf:
+                    continue
+                idf = math.log(1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                score += idf * tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * len(doc) / avg_len))
+            scores.append(score)
+        return scores
+
+    def score_paragraph(self, paragraph: str, bm25_score: float = 0.0) -> float:
+        years = len(YEAR_PATTERN.findall(paragraph))
+        citations = len(CITATION_PATTERN.findall(paragraph))
+        cues = len(CUE_PATTERN.findall(paragraph))
+        # Diminishing returns so one long list of years does not dominate
+        return (self.year_weight * math.log1p(years)
+                + self.citation_weight * math.log1p(citations)
+                + self.cue_weight * math.log1p(cues)
+                + self.bm25_weight * bm25_score)
+
+    def prune(self, target_sections: Dict[str, str], keyword: str, token_budget: Optional[int] = None) -> Dict[str, str]:
+        """
+        Keeps the highest scoring paragraphs of the target sections that fit into the
+        token budget. Kept paragraphs stay in document order and only the references
+        they cite are re-fused under each section.
+
+        Returns:
+            The pruned sections, in the same format produced by WikipediaParser.reference_fusion.
+        """
+        budget = self.token_budget if token_budget is None else token_budget
+
+        tokens_before = sum(self.estimate_tokens(content) for content in target_sections.values())
+        if tokens_before <= budget:
+            self.last_stats = {"tokens_before": tokens_before, "tokens_after": tokens_before, "tokens_saved": 0}
+            return dict(target_sections)
+
+        split_sections = {title: self._split_section(content) for title, content in target_sections.items()}
+
+        # (score, section title, paragraph index, paragraph, cited reference numbers)
+        candidates = []
+        all_paragraphs = [p for paragraphs, _ in split_sections.values() for p in paragraphs]
+        bm25_scores = iter(self._bm25_scores(all_paragraphs, keyword))
+        for title, (paragraphs, references) in split_sections.items():
+            for idx, paragraph in enumerate(paragraphs):
+                cited = {int(n) for n in CITATION_PATTERN.findall(paragraph) if int(n) in references}
+                candidates.append((self.score_paragraph(paragraph, next(bm25_scores)), title, idx, paragraph, cited))
+
+        candidates.sort(key=lambda c: c[0], reverse=True)
+
+        used_tokens = 0
+        kept: Dict[str, List[Tuple[int, str]]] = {title: [] for title in target_sections}
+        kept_refs: Dict[str, Set[int]] = {title: set() for title in target_sections}
+        for _, title, idx, paragraph, cited in candidates:
+            references = split_sections[title][1]
+            new_refs = cited - kept_refs[title]
+            cost = self.estimate_tokens(paragraph) + sum(self.estimate_tokens(f"[{n}] {references[n]}") for n in new_refs)
+            if used_tokens + cost > budget:
+                continue
+            used_tokens += cost
+            kept[title].append((idx, paragraph))
+            kept_refs[title].update(new_refs)
+
+        pruned_sections = {}
+        for title, paragraphs in kept.items():
+            if not paragraphs:
+                continue
+            content = "\n\n".join(p for _, p in sorted(paragraphs))
+            if kept_refs[title]:
+                references = split_sections[title][1]
+                content += REFERENCES_MARKER + "\n".join(f"[{n}] {references[n]}" for n in sorted(kept_refs[title]))
+            pruned_sections[title] = content
+
+        tokens_after = sum(self.estimate_tokens(content) for content in pruned_sections.values())
+        self.last_stats = {
+            "tokens_before": tokens_before,
+            "tokens_after": tokens_after,
+            "tokens_saved": max(0, tokens_before - tokens_after),
+        }
+        kept_count = sum(len(p) for p in kept.values())
+        print(f"Section pruning kept {kept_count}/{len(candidates)} paragraphs "
+              f"(~{tokens_after} of ~{tokens_before} tokens, saved ~{self.last_stats['tokens_saved']})")
+        return pruned_sections
@@ -0,0 +1,129 @@
+import threading
+from typing import Callable, Dict, List, Optional
+
+
+class Services:
+    def __init__(self, db_file: str = "keyword_database.json", verification_store_file: Optional[str] = "verification_scores.json",
+                 use_prefilter: bool = True, tavily_cache_file: Optional[str] = "tavily_cache.json"):
+        """
+        Lazily created, shared service clients. Each client (and the module behind it, e.g.
+        google.generativeai, openai, bs4 or googlesearch) is only imported and constructed the first
+        time it is used, and then reused by every caller. Safe to use from pipeline threads.
+
+        Args:
+            db_file: KeywordDatabase JSON file.
+            verification_store_file: JSON file memoizing verifier scores. None keeps them in memory.
+            use_prefilter: Give the verifier a TF-IDF prefilter calibrated on the keyword database and the stored verifier scores.
+            tavily_cache_file: JSON file caching Tavily responses.
+        """
+        self.db_file = db_file
+        self.verification_store_file = verification_store_file
+        self.use_prefilter = use_prefilter
+        self.tavily_cache_file = tavily_cache_file
+        self._instances: Dict[str, object] = {}
+        # Re-entrant because factories use other services (the verifier needs the prefilter, which needs the database)
+        self._lock = threading.RLock()
+
+    def _get(self, name: str, factory: Callable[[], object]):
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = factory()
+                    self._instances[name] = instance
+        return instance
+
+    def initialized(self) -> List[str]:
+        """Names of the services created so far."""
+        return list(self._instances)
+
+    @property
+    def gemini_extractor(self):
+        def create():
+            from gemini import GeminiKeywordPaperExtractor
+            return GeminiKeywordPaperExtractor()
+        return self._get("gemini_extractor", create)
+
+    @property
+    def keyword_term_extractor(self):
+        def create():
+            from keyword_extractor import KeywordTermExtractor
+            return KeywordTermExtractor(self.gemini_extractor)
+        return self._get("keyword_term_extractor", create)
+
+    @property
+    def openalex(self):
+        def create():
+            from paper_retrievers.openAlex_retriever import OpenAlexRetriever
+            return OpenAlexRetriever()
+        return self._get("openalex", create)
+
+    @property
+    def database(self):
+        def create():
+            from keyword_database import KeywordDatabase
+            return KeywordDatabase(self.db_file, gemini_extractor=self.gemini_extractor)
+        return self._get("database", create)
+
+    @property
+    def score_store(self):
+        def create():
+            from verification_store import VerificationScoreStore
+            return VerificationScoreStore(self.verification_store_file)
+        return self._get("score_store", create)
+
+    @property
+    def prefilter(self):
+        if not self.use_prefilter:
+            return None
+
+        def create():
+            # paper_verifier is imported by the verifier (the prefilter's only user) anyway
+            from paper_verifier import PROMPT_VERSION
+            from relevance_prefilter import RelevancePrefilter
+            prefilter = RelevancePrefilter()
+            prefilter.calibrate(self.database.data["keywords"], self.score_store.labelled_pairs(PROMPT_VERSION))
+            return prefilter
+        return self._get("prefilter", create)
+
+    @property
+    def verifier(self):
+        def create():
+            from paper_verifier import Paper_Verifier
+            return Paper_Verifier(self.score_store, self.prefilter)
+        return self._get("verifier", create)
+
+    @property
+    def wiki_parser(self):
+        def create():
+            from scrapers.wiki_parser import WikipediaParser
+            return WikipediaParser()
+        return self._get("wiki_parser", create)
+
+    @property
+    def google_searcher(self):
+        def create():
+            from scrapers.google_search import GoogleSearcher
+            return GoogleSearcher()
+        return self._get("google_searcher", create)
+
+    @property
+    def tavily_searcher(self):
+        def create():
+            from scrapers.tavily_search import TavilySearcher
+            return TavilySearcher(self.tavily_cache_file)
+        return self._get("tavily_searcher", create)
+
+
+_shared_services: Optional[Services] = None
+_shared_lock = threading.Lock()
+
+
+def get_services() -> Services:
+    """Process-wide Services with the default configuration."""
+    global _shared_services
+    with _shared_lock:
+        if _shared_services is None:
+            _shared_services = Services()
+        return _shared_services
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The crawler modules import each other as top-level modules (e.g. "from scrapers import fast_html")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The textbook ingestion modules (bib_parser, citation_connecter, ...) live in a sibling directory
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "textbook_code"))
@@ -0,0 +1,38 @@
+import json
+import os
+
+from atomic_io import atomic_write
+
+
+def test_atomic_write_keeps_existing_mode(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text("{}")
+    os.chmod(path, 0o640)
+    with atomic_write(str(path)) as f:
+        json.dump({"a": 1}, f)
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert json.loads(path.read_text()) == {"a": 1}
+
+
+def test_atomic_write_uses_umask_for_new_file(tmp_path):
+    path = tmp_path / "new.json"
+    umask = os.umask(0o022)
+    try:
+        with atomic_write(str(path)) as f:
+            f.write("{}")
+    finally:
+        os.umask(umask)
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+
+def test_atomic_write_leaves_target_on_error(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"old": true}')
+    try:
+        with atomic_write(str(path)) as f:
+            f.write("partial")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert json.loads(path.read_text()) == {"old": True}
+    assert os.listdir(tmp_path) == ["data.json"]
@@ -0,0 +1,62 @@
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import pytest
+
+from scrapers import browser_pool
+from scrapers.browser_pool import BrowserPool, _STOP
+
+
+class FakePool(BrowserPool):
+    """Serves fetches without Chromium; the workers named in broken fail to launch."""
+
+    def __init__(self, broken=(), serve=True, **kwargs):
+        super().__init__(domain_file=None, **kwargs)
+        self.broken = set(broken)
+        self.serve = serve
+
+    def _serve(self, sync_playwright):
+        name = threading.current_thread().name
+        if name in self.broken:
+            raise RuntimeError(f"{name}: Chromium is not installed")
+        while True:
+            job = self.jobs.get()
+            if job is _STOP:
+                return
+            url, _, future = job
+            if not self.serve:
+                continue  # never answers, like a hung browser
+            if future.set_running_or_notify_cancel():
+                future.set_result(f"<html>{url}</html>")
+
+
+def test_one_failed_worker_does_not_fail_the_pool():
+    pool = FakePool(broken={"browser-0"}, size=2)
+    try:
+        for i in range(5):
+            assert pool.fetch(f"https://example.org/{i}", timeout_ms=1000) == f"<html>https://example.org/{i}</html>"
+        pool.workers[0].join(timeout=5)  # the broken worker has stopped
+        assert pool.fetch("https://example.org/late", timeout_ms=1000) == "<html>https://example.org/late</html>"
+        assert pool.launch_error is None
+        assert list(pool.worker_errors) == ["browser-0"]
+    finally:
+        pool.shutdown()
+
+
+def test_pool_fails_when_no_worker_is_alive():
+    pool = FakePool(broken={"browser-0", "browser-1"}, size=2)
+    with pytest.raises(RuntimeError):
+        pool.fetch("https://example.org/", timeout_ms=1000)
+    with pytest.raises(RuntimeError):
+        pool.submit("https://example.org/again").result(timeout=1)
+    pool.shutdown()
+
+
+def test_fetch_timeout_raises_futures_timeout(monkeypatch):
+    monkeypatch.setattr(browser_pool, "QUEUE_GRACE_SECONDS", 0)
+    pool = FakePool(serve=False, size=1)
+    try:
+        with pytest.raises(FutureTimeoutError):
+            pool.fetch("https://example.org/slow", timeout_ms=100)
+    finally:
+        pool.shutdown()
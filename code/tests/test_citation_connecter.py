@@ -0,0 +1,24 @@
+from citation_connecter import ReferenceExtractor
+
+BIBLIOGRAPHY = "\n".join(f"[{n}] Author {n}. Title {n}. Venue, 19{n:02d}." for n in range(1, 31))
+
+
+def cited(text):
+    extractor = ReferenceExtractor(None, BIBLIOGRAPHY)
+    _, ref_to_sentences = extractor.build_citation_index(text)
+    return sorted(ref_to_sentences)
+
+
+def test_lists_ranges_and_adjacent_markers():
+    assert cited("Knuth [3] traces it back. See also [5, 7] and [12–14].") == [3, 5, 7, 12, 13, 14]
+    assert cited("Both [2][4] discuss it.") == [2, 4]
+
+
+def test_indexing_is_not_a_citation():
+    assert cited("The loop sets A[1] and A[1][2] to zero.") == []
+
+
+def test_interval_notation_is_not_a_citation():
+    assert cited("Pick x uniformly in [0, 1].") == []
+    assert cited("Every key lies in [1, 100].") == []
+    assert cited("Keys in the range [1–25] are kept.") == []
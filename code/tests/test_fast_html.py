@@ -0,0 +1,81 @@
+"""Offline parity checks between the lxml fast path and the BeautifulSoup fallbacks it replaces."""
+import os
+from unittest import mock
+
+import pytest
+
+from scrapers import fast_html, general_scraper, google_search, wiki_parser
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES = ["wikipedia_quicksort.html", "pmc_article.html", "generic_blog.html"]
+
+pytestmark = pytest.mark.skipif(fast_html.lxml is None, reason="lxml is not installed")
+
+
+def load(name):
+    with open(os.path.join(FIXTURES, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def fast_results(html, url):
+    return {
+        "page_paragraphs": fast_html.page_paragraphs(html),
+        "metadata": fast_html.metadata(html, url),
+        "content_and_refs": fast_html.content_and_refs(html),
+        "wiki_references": fast_html.wiki_references(html),
+        "wiki_sections": fast_html.wiki_sections(html),
+    }
+
+
+def bs4_results(html, url):
+    # Without lxml every fast_html function returns None and the scrapers use BeautifulSoup
+    with mock.patch.object(fast_html, "lxml", None):
+        extractor = general_scraper.WebPageExtractor(url, browser_pool=mock.Mock())
+        extractor.html = html
+        return {
+            "page_paragraphs": google_search.GoogleSearcher(max_workers=1)._page_paragraphs_bs4(html),
+            "metadata": extractor.extract_metadata(),
+            "content_and_refs": extractor.extract_content_and_refs(),
+            "wiki_references": wiki_parser.WikipediaParser().extract_references(url, html),
+            "wiki_sections": wiki_parser.WikipediaParser().extract_sections(url, html),
+        }
+
+
+@pytest.mark.parametrize("page", PAGES)
+def test_fast_path_matches_bs4(page):
+    html = load(page)
+    url = f"https://example.org/{page}"
+    fast = fast_results(html, url)
+    slow = bs4_results(html, url)
+    for name in fast:
+        assert fast[name] == slow[name], name
+
+
+def test_wikipedia_sections_and_references():
+    html = load("wikipedia_quicksort.html")
+    sections = fast_html.wiki_sections(html)
+    assert list(sections) == ["Introduction", "History", "History - Later work", "History - Later work - Dual pivot", "Algorithm"]
+    assert "var x" not in sections["History - Later work"]
+    assert "comment" not in sections["History - Later work"]
+
+    references = fast_html.wiki_references(html)
+    assert references[1].startswith("Hoare, C. A. R. (1961)")
+    assert references[2].startswith("Hoare, C. A. R. (1962)")
+    assert len(references) == 3
+
+
+def test_pmc_references_keep_citation_text():
+    # Each <li> nests a <div> of [PubMed] [DOI] links; the citation text must not be dropped
+    refs = fast_html.content_and_refs(load("pmc_article.html"))["explicit_references"]
+    assert len(refs) == 3
+    assert refs[0].startswith("1. Smith J, Doe A. A foundational paper on widgets.")
+    assert refs[0].endswith("[PubMed] [DOI]")
+    assert refs[2] == "3. Poe E. On the theory of sprockets. Sprocket Q. 2005;9:1–2."
+
+
+def test_generic_page_links_are_deduplicated():
+    result = fast_html.content_and_refs(load("generic_blog.html"))
+    hrefs = [ref["href"] for ref in result["global_references"]]
+    assert hrefs.count("https://example.com/luhn") == 1
+    assert "#top" not in hrefs
+    assert result["explicit_references"][0].startswith("Knuth, D.")
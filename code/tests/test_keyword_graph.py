@@ -0,0 +1,93 @@
+from xml.etree import ElementTree as ET
+
+from keyword_database import KeywordDatabase
+from keyword_graph import KeywordGraph
+
+
+def paper(url, parent=None, child=None, claim=None):
+    return {"title": url, "url": url, "parent_keyword": parent, "child_claim": claim, "child_keyword": child}
+
+
+# neural network -> cnn -> backpropagation -> chain rule, neural network -> rnn, and a paper
+# found via the child "pooling" that was added to its parent cnn
+KEYWORDS = {
+    "neural network": [paper("u1")],
+    "cnn": [paper("u2", "neural network", "cnn", "claim nn-cnn"), paper("u3", None, "pooling", "claim cnn-pooling")],
+    "backpropagation": [paper("u4", "cnn", "backpropagation", "claim cnn-bp")],
+    "chain rule": [paper("u5", "backpropagation", "chain rule", "claim bp-cr")],
+    "rnn": [paper("u6", "neural network", "rnn", "claim nn-rnn")],
+    "pooling": [paper("u7", "cnn", "pooling")],
+}
+
+
+def build():
+    return KeywordGraph.from_keywords(KEYWORDS)
+
+
+def test_ancestors_respect_depth():
+    graph = build()
+    assert [a[0] for a in graph.ancestors("chain rule")] == ["backpropagation", "cnn", "neural network"]
+    assert [a[0] for a in graph.ancestors("chain rule", depth=2)] == ["backpropagation", "cnn"]
+    assert graph.ancestors("chain rule", depth=1) == [("backpropagation", "chain rule", "claim bp-cr", 1)]
+    assert graph.ancestors("neural network") == []
+
+
+def test_descendants_respect_depth():
+    graph = build()
+    assert [(d[0], d[3]) for d in graph.descendants("neural network", depth=1)] == [("cnn", 1), ("rnn", 1)]
+    assert {d[0] for d in graph.descendants("neural network", depth=2)} == {"cnn", "rnn", "backpropagation", "pooling"}
+    assert {d[0] for d in graph.descendants("neural network")} == {"cnn", "rnn", "backpropagation", "pooling", "chain rule"}
+    assert graph.descendants("neural network", depth=0) == []
+    # The first claim seen for an edge is kept
+    assert ("pooling", "cnn", "claim cnn-pooling", 1) in graph.descendants("cnn", depth=1)
+
+
+def test_shortest_path():
+    graph = build()
+    assert graph.shortest_path("neural network", "chain rule") == ["neural network", "cnn", "backpropagation", "chain rule"]
+    assert graph.shortest_path("cnn", "cnn") == ["cnn"]
+    # Edges point from parent to child only
+    assert graph.shortest_path("chain rule", "neural network") is None
+    assert graph.shortest_path("rnn", "unknown") is None
+
+
+def test_reachable_papers():
+    graph = build()
+    reachable = graph.reachable_papers("cnn")
+    assert set(reachable) == {"cnn", "backpropagation", "chain rule", "pooling"}
+    assert [p["url"] for p in reachable["cnn"]] == ["u2", "u3"]
+    assert set(graph.reachable_papers("cnn", depth=1)) == {"cnn", "backpropagation", "pooling"}
+
+
+def test_exports(tmp_path):
+    graph = build()
+    edges_file = tmp_path / "edges.tsv"
+    graph.write_edge_list(str(edges_file))
+    edges = [tuple(line.split("\t")) for line in edges_file.read_text(encoding="utf-8").splitlines()]
+    assert sorted(edges) == sorted([("neural network", "cnn"), ("neural network", "rnn"), ("cnn", "backpropagation"),
+                                    ("cnn", "pooling"), ("backpropagation", "chain rule")])
+
+    graphml_file = tmp_path / "graph.graphml"
+    graph.write_graphml(str(graphml_file))
+    ns = {"g": "http://graphml.graphdrawing.org/xmlns"}
+    root = ET.parse(str(graphml_file)).getroot()
+    nodes = {node.get("id"): node.find("g:data", ns).text for node in root.iterfind(".//g:node", ns)}
+    assert nodes["cnn"] == "2" and len(nodes) == 6
+    claims = {(e.get("source"), e.get("target")): e.find("g:data", ns).text for e in root.iterfind(".//g:edge", ns)}
+    assert claims[("backpropagation", "chain rule")] == "claim bp-cr"
+
+    subgraph = graph.subgraph("cnn", depth=1)
+    assert sorted(subgraph.edges()) == [("cnn", "backpropagation", "claim cnn-bp"), ("cnn", "pooling", "claim cnn-pooling")]
+
+
+def test_database_keeps_graph_in_step(tmp_path):
+    db = KeywordDatabase(str(tmp_path / "db.json"))
+    db.add_paper("cnn", {"title": "A", "url": "u1"}, "claim")
+    assert db.get_ancestors("cnn") == []
+    db.add_paper("pooling", {"title": "B", "url": "u2"}, "claim", parent_keyword="cnn", child_claim="why", child_keyword="pooling")
+    assert db.get_provenance_path("cnn", "pooling") == ["cnn", "pooling"]
+    assert db.get_descendants("cnn") == [("pooling", "cnn", "why", 1)]
+    assert set(db.get_reachable_papers("cnn")) == {"cnn", "pooling"}
+
+    # A fresh instance rebuilds the same graph from the saved file
+    assert KeywordDatabase(str(tmp_path / "db.json")).get_provenance_path("cnn", "pooling") == ["cnn", "pooling"]
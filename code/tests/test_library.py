@@ -0,0 +1,18 @@
+from library import book_id_for, reference_id
+
+
+def test_reference_id_ignores_author_and_venue_formatting():
+    clrs = "C. A. R. Hoare. Quicksort. Computer Journal, 5(1):10–15, 1962."
+    other = "Charles A. R. Hoare. Quicksort. Comput. J., 5(1): 10-15,\n1962."
+    assert reference_id(clrs) == reference_id(other)
+    assert reference_id(clrs) != reference_id("C. A. R. Hoare. Algorithm 64: Quicksort. Communications of the ACM, 4(7):321, 1961.")
+
+
+def test_reference_id_folds_accents():
+    assert reference_id("L´aszl´o Lov´asz and M. D. Plummer. Matching Theory. North Holland, 1986.") == \
+        reference_id("László Lovász and Michael D. Plummer. Matching theory. North-Holland, 1986.")
+
+
+def test_same_named_books_in_different_directories_stay_apart():
+    assert book_id_for("shelf_a/algorithms.pdf") != book_id_for("shelf_b/algorithms.pdf")
+    assert book_id_for("shelf_a/algorithms.pdf").startswith("algorithms-")
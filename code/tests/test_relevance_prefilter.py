@@ -0,0 +1,40 @@
+from relevance_prefilter import RelevancePrefilter, REJECT
+
+
+def paper(title, abstract):
+    return {"title": title, "abstract": abstract}
+
+
+def overlapping(i):
+    return paper(f"Convolutional networks study {i}", f"We train convolutional networks on image benchmark {i}.")
+
+
+def unrelated(i):
+    return paper(f"Learning representations {i}", f"A new procedure adjusts internal weights in experiment {i}.")
+
+
+def kept_share(prefilter, pairs):
+    kept = sum(1 for keyword, p in pairs if prefilter.decide(p, keyword)[0] != REJECT)
+    return kept / len(pairs)
+
+
+def test_calibration_keeps_reject_recall_of_positives():
+    # A few positives share no terms with their keyword, like "Long Short-Term Memory" for rnn
+    stored = {"convolutional network": [overlapping(i) for i in range(40)] + [unrelated(i) for i in range(10)]}
+    labelled = [("convolutional network", paper(f"Gardening tips {i}", f"Roses and tulips in season {i}."), 1) for i in range(30)]
+    prefilter = RelevancePrefilter()
+    prefilter.calibrate(stored, labelled, reject_recall=0.98)
+    positives = [(keyword, p) for keyword, papers in stored.items() for p in papers]
+    assert kept_share(prefilter, positives) >= 0.98
+    assert prefilter.reject_below == 0.0
+
+
+def test_calibration_rejects_when_positives_overlap():
+    stored = {"convolutional network": [overlapping(i) for i in range(50)]}
+    labelled = [("convolutional network", paper(f"Gardening tips {i}", f"Roses and tulips in season {i}."), 1) for i in range(30)]
+    prefilter = RelevancePrefilter()
+    prefilter.calibrate(stored, labelled, reject_recall=0.98)
+    positives = [(keyword, p) for keyword, papers in stored.items() for p in papers]
+    assert kept_share(prefilter, positives) >= 0.98
+    assert prefilter.reject_below > 0
+    assert prefilter.decide(labelled[0][1], "convolutional network")[0] == REJECT
@@ -0,0 +1,70 @@
+import json
+import os
+import threading
+import time
+
+from scrapers.tavily_search import FixtureBackend, TavilySearcher
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "tavily_responses.json")
+QUICKSORT = "Quicksort original paper that introduced it"
+RED_BLACK = "Red-black tree original paper that introduced it"
+
+
+class BlockingBackend(FixtureBackend):
+    """Holds every search until released, so concurrent identical queries overlap."""
+
+    def __init__(self, fixture_file):
+        super().__init__(fixture_file)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def search(self, query, **kwargs):
+        self.entered.set()
+        self.release.wait(5)
+        return super().search(query, **kwargs)
+
+
+def test_repeated_query_is_served_from_the_cache(tmp_path):
+    cache_file = str(tmp_path / "tavily_cache.json")
+    backend = FixtureBackend(FIXTURE)
+    searcher = TavilySearcher(cache_file, backend=backend)
+    first = searcher.search(QUICKSORT)
+    # Case and spacing differences normalize to the same cache key
+    again = searcher.search("  quicksort ORIGINAL paper that introduced it ")
+    assert again == first
+    assert backend.calls == 1
+    assert (searcher.hits, searcher.misses) == (1, 1)
+    assert searcher.result_urls(QUICKSORT)[0] == "https://academic.oup.com/comjnl/article/5/1/10/395338"
+
+    # A new searcher answers from the saved cache without calling the backend
+    with open(cache_file, 'r', encoding='utf-8') as f:
+        assert len(json.load(f)) == 1
+    reloaded_backend = FixtureBackend(FIXTURE)
+    assert TavilySearcher(cache_file, backend=reloaded_backend).search(QUICKSORT) == first
+    assert reloaded_backend.calls == 0
+
+
+def test_concurrent_identical_queries_make_one_backend_call():
+    backend = BlockingBackend(FIXTURE)
+    searcher = TavilySearcher(None, backend=backend)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(searcher.search(QUICKSORT))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    assert backend.entered.wait(5)
+    time.sleep(0.2)  # let the other callers find the request in flight
+    backend.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert backend.calls == 1
+    assert len(results) == 5 and all(result is results[0] for result in results)
+
+
+def test_search_many_runs_each_distinct_query_once():
+    backend = FixtureBackend(FIXTURE)
+    searcher = TavilySearcher(None, backend=backend, max_workers=2)
+    responses = searcher.search_many([QUICKSORT, RED_BLACK, QUICKSORT, "unknown topic"])
+    assert list(responses) == [QUICKSORT, RED_BLACK, "unknown topic"]
+    assert responses[RED_BLACK]["results"][0]["url"] == "https://ieeexplore.ieee.org/document/4567957"
+    assert responses["unknown topic"]["results"] == []
+    assert backend.calls == 3
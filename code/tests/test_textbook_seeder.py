@@ -0,0 +1,30 @@
+from textbook_seeder import parse_reference_title, section_title_to_keyword
+
+
+def test_reference_title_after_abbreviated_names():
+    assert parse_reference_title("A. Karatsuba and Yu. Ofman. Multiplication of multidigit numbers on automata. "
+                                 "Soviet Physics—Doklady, 7(7):595–596, 1963.") == \
+        ("Multiplication of multidigit numbers on automata", 1963)
+    assert parse_reference_title("Lestor R. Ford, Jr. and D. R. Fulkerson. Flows in Networks. Princeton\n"
+                                 "University Press, 1962.") == ("Flows in Networks", 1962)
+
+
+def test_reference_title_joins_hyphenated_lines():
+    title, year = parse_reference_title("Michael R. Garey, R. L. Graham, and J. D. Ullman. Worst-case analysis of memory al-\n"
+                                        "location algorithms. In Proceedings of the Fourth Annual ACM Symposium on\n"
+                                        "Theory of Computing, pages 143–150, 1972.")
+    assert title == "Worst-case analysis of memory allocation algorithms"
+    assert year == 1972
+
+
+def test_author_fragments_are_not_titles():
+    assert parse_reference_title("W. Daniel Hillis and Jr. Guy L. Steele. Data parallel algorithms. "
+                                 "Communications of the ACM, 29(12):1170–1183, 1986.")[0] is None
+    assert parse_reference_title("Eric Bach. Private communication, 1989.") == (None, 1989)
+    assert parse_reference_title("C. A. R. Hoare. Quicksort. Computer Journal, 5(1):10–15, 1962.") == ("Quicksort", 1962)
+
+
+def test_generic_section_titles_are_not_keywords():
+    assert section_title_to_keyword("2 Getting Started") is None
+    assert section_title_to_keyword("3 Growth of Functions") is None
+    assert section_title_to_keyword("12.3 Insertion and deletion") == "insertion and deletion"
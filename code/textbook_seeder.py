@@ -0,0 +1,156 @@
+import json
+import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+# Bibliography entries are split into fields by the textbook ingestion code's parser
+TEXTBOOK_CODE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "textbook_code")
+if TEXTBOOK_CODE_DIR not in sys.path:
+    sys.path.append(TEXTBOOK_CODE_DIR)
+from bib_parser import join_lines, parse_fields
+
+# Front/back matter, exercise sections and chapter headings that are not concepts worth tracking
+GENERIC_SECTION_TITLES = {
+    "contents", "preface", "introduction", "exercises", "problems", "chapter notes",
+    "bibliography", "references", "index", "appendix", "notes", "summary",
+    "overview", "background", "preliminaries", "foundations", "conclusion", "conclusions",
+    "further reading", "getting started", "growth of functions", "the role of algorithms in computing",
+    "sets, etc.", "mathematical background", "selected topics",
+}
+
+# "and D. R. Fulkerson", "Guy L. Steele": a piece of the author list taken for the title
+AUTHOR_FRAGMENT_PATTERN = re.compile(r"^(?:(?:and|with)\s|(?:[A-Z][\w'\u00b4\u00a8-]*\.?\s+)*[A-Z]\.\s+[A-Z][\w'\u00b4\u00a8-]+$)")
+# Cited works with nothing to look up
+UNPUBLISHED_PATTERN = re.compile(r"^(?:private|personal) communication|^unpublished", re.IGNORECASE)
+
+
+def section_title_to_keyword(title: str) -> Optional[str]:
+    """Turns a TOC title such as '12.3 Insertion and deletion' into a keyword, or None for generic sections."""
+    keyword = re.sub(r'^\s*(?:[IVXLC]+|[A-Z]|\d+)(?:\.\d+)*\s+', '', title).strip()
+    keyword = re.sub(r'\s+', ' ', keyword).lower()
+    if not keyword or keyword in GENERIC_SECTION_TITLES or keyword.startswith("appendix"):
+        return None
+    return keyword
+
+
+def looks_like_authors(title: str, authors: List[str] = ()) -> bool:
+    """True for a 'title' that is really part of the author list, e.g. after a name was split at a period."""
+    if AUTHOR_FRAGMENT_PATTERN.match(title):
+        return True
+    # A lone word after an author list that ends in a cut-off name ("A. Karatsuba and Yu" + "Ofman")
+    return len(title.split()) == 1 and bool(authors) and len(authors[-1].rstrip('.')) <= 2
+
+
+def parse_reference_title(source_text: str) -> Tuple[Optional[str], Optional[int]]:
+    """(title, year) of a raw bibliography entry, or (None, year) when no usable title is found."""
+    text = ""
+    for line in source_text.splitlines():
+        text = join_lines(text, line.strip())
+    fields = parse_fields(text)
+    title = fields["title"]
+    if not title or looks_like_authors(title, fields["authors"]) or UNPUBLISHED_PATTERN.match(title):
+        return None, fields["year"]
+    return title, fields["year"]
+
+
+class TextbookSeeder:
+    def __init__(self, database, openalex, verifier=None, max_workers: int = 8, min_level: int = 2, min_score: int = 6):
+        """
+        Seeds the KeywordDatabase from textbook section -> bibliography links (clrs_textbook_map.json),
+        skipping web search and Gemini extraction for every keyword the textbook covers.
+
+        Args:
+            database: KeywordDatabase to seed.
+            openalex: OpenAlexRetriever used to resolve bibliography entries.
+            verifier: Optional Paper_Verifier. When set, papers are only added if they score >= min_score.
+            max_workers: Concurrent OpenAlex lookups.
+            min_level: Minimum TOC level used for keywords (level 1 holds parts and front matter).
+        """
+        self.database = database
+        self.openalex = openalex
+        self.verifier = verifier
+        self.max_workers = max_workers
+        self.min_level = min_level
+        self.min_score = min_score
+
+    def load_links(self, map_file: str) -> Dict[str, List[Dict]]:
+        """Returns keyword -> list of {source_text, context_sentence, section} from the textbook map."""
+        if not os.path.exists(map_file):
+            print(f"Textbook map {map_file} not found")
+            return {}
+        with open(map_file, 'r', encoding='utf-8') as f:
+            sections = json.load(f)
+
+        links: Dict[str, List[Dict]] = {}
+        for section_title, section in sections.items():
+            if section.get("details", {}).get("level", 0) < self.min_level or not section.get("sources"):
+                continue
+            keyword = section_title_to_keyword(section_title)
+            if not keyword:
+                continue
+            for source in section["sources"]:
+                links.setdefault(keyword, []).append({**source, "section": section_title})
+        return links
+
+    def resolve_titles(self, titles: Set[Tuple[str, Optional[int]]]) -> Dict[Tuple[str, Optional[int]], Dict]:
+        """
+        Resolves (title, year) pairs against OpenAlex concurrently. A known year narrows the lookup to an
+        exact publication_year filter; if that finds nothing the title alone is tried. Unresolved titles are left out.
+        """
+        ordered = sorted(titles, key=lambda item: (item[0], item[1] or 0))
+        print(f"Resolving {len(ordered)} bibliography entries against OpenAlex...")
+
+        def lookup(item):
+            title, year = item
+            try:
+                info = self.openalex.search_paper(title, year=year) if year else None
+                if not info or not info.get("title"):
+                    info = self.openalex.search_paper(title)
+                return info
+            except Exception as e:
+                print(f"OpenAlex lookup failed for '{title}': {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(lookup, ordered)
+        return {item: info for item, info in zip(ordered, results) if info and info.get("title")}
+
+    def seed(self, map_file: str = "clrs_textbook_map.json") -> Set[str]:
+        """Adds textbook-cited papers to the database. Returns the set of seeded keywords."""
+        links = self.load_links(map_file)
+        titles = set()
+        for sources in links.values():
+            for source in sources:
+                # Prefer the fields from the layout-aware bibliography parser when the map has them
+                title, year = source.get("title"), source.get("year")
+                if not title or looks_like_authors(title, source.get("authors", [])):
+                    title, year = parse_reference_title(source.get("source_text", ""))
+                source["parsed_title"] = title
+                source["parsed_year"] = year
+                if title:
+                    titles.add((title, year))
+        resolved = self.resolve_titles(titles)
+
+        seeded = set()
+        for keyword, sources in links.items():
+            seen_urls = set()
+            for source in sources:
+                paper_info = resolved.get((source.get("parsed_title"), source.get("parsed_year")))
+                if not paper_info or paper_info.get("url") in seen_urls:
+                    continue
+                seen_urls.add(paper_info.get("url"))
+
+                claim = f"\"{source.get('context_sentence', '').strip()}\" - [\"{source['parsed_title']}\"] :-: {source.get('source_text', '').strip()} (cited in textbook section '{source['section']}')"
+                paper_info = {**paper_info, "reasoning": claim}
+                if self.verifier is not None:
+                    score = self.verifier.verify_paper_for_keyword(paper_info, keyword)
+                    if score < self.min_score:
+                        print(f"Textbook paper '{paper_info['title']}' rejected for '{keyword}' with score {score}")
+                        continue
+                self.database.add_paper(keyword, paper_info, claim)
+                seeded.add(keyword)
+
+        print(f"Seeded {len(seeded)} keywords from {map_file}")
+        return seeded
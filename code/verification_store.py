@@ -0,0 +1,156 @@
+import json
+import os
+import re
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from atomic_io import atomic_write
+
+# Abstracts kept for prefilter calibration are cut to this length
+SAMPLE_ABSTRACT_CHARS = 2000
+
+
+def canonical_paper_id(paper: Dict) -> Optional[str]:
+    """
+    Returns a stable id for a paper: the lower-cased DOI when the URL is a DOI,
+    otherwise the URL, otherwise the normalized title.
+    """
+    url = (paper.get("url") or "").strip()
+    doi_match = re.search(r"(10\.\d{4,9}/\S+)", url)
+    if doi_match:
+        return "doi:" + doi_match.group(1).lower()
+    if url and url != "No URL found":
+        return "url:" + url.lower()
+    title = re.sub(r"[^a-z0-9]+", " ", (paper.get("title") or "").lower()).strip()
+    if title:
+        return "title:" + title
+    return None
+
+
+def normalize_keyword(keyword: str) -> str:
+    return " ".join(keyword.lower().split())
+
+
+class VerificationScoreStore:
+    def __init__(self, store_file: str = "verification_scores.json"):
+        """
+        Persistent store of verifier scores keyed by (canonical paper id, normalized keyword, prompt version).
+        The title and abstract of every scored paper are kept too, so the relevance prefilter can be
+        calibrated on both low and high LLM scores. put() only marks the store dirty; callers save it
+        with flush() at checkpoints (e.g. once per processed keyword) and at shutdown.
+
+        Args:
+            store_file: Path to the JSON file backing the store. None keeps the store in memory only.
+        """
+        self.store_file = store_file
+        self._lock = threading.Lock()
+        # Serializes writers without holding _lock (and so blocking verify workers) during disk I/O
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        # prompt version -> keyword -> paper id -> score
+        self.scores: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # paper id -> {"title", "abstract"}
+        self.samples: Dict[str, Dict[str, str]] = {}
+        self._load()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        if self.store_file and os.path.exists(self.store_file):
+            try:
+                with open(self.store_file, 'r') as f:
+                    data = json.load(f)
+                self.scores = data.get("scores", {})
+                self.samples = data.get("samples", {})
+            except json.JSONDecodeError:
+                print(f"Error reading {self.store_file}, starting with an empty verification store")
+
+    def save(self) -> None:
+        if not self.store_file:
+            return
+        with self._save_lock:
+            with self._lock:
+                snapshot = {
+                    "scores": {version: {keyword: dict(papers) for keyword, papers in by_keyword.items()}
+                               for version, by_keyword in self.scores.items()},
+                    "samples": dict(self.samples),
+                }
+                self._dirty = False
+            with atomic_write(self.store_file) as f:
+                json.dump(snapshot, f)
+
+    def flush(self) -> None:
+        """Saves the store if scores were added since the last save."""
+        if self._dirty:
+            self.save()
+
+    def get(self, paper: Dict, keyword: str, prompt_version: str) -> Optional[int]:
+        paper_id = canonical_paper_id(paper)
+        if paper_id is None:
+            return None
+        with self._lock:
+            score = self.scores.get(prompt_version, {}).get(normalize_keyword(keyword), {}).get(paper_id)
+            if score is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return score
+
+    def _keep_sample(self, paper_id: str, paper: Dict):
+        if paper_id not in self.samples:
+            self.samples[paper_id] = {
+                "title": paper.get("title") or "",
+                "abstract": (paper.get("abstract") or "")[:SAMPLE_ABSTRACT_CHARS],
+            }
+
+    def put(self, paper: Dict, keyword: str, prompt_version: str, score: int) -> None:
+        paper_id = canonical_paper_id(paper)
+        if paper_id is None:
+            return
+        with self._lock:
+            self.scores.setdefault(prompt_version, {}).setdefault(normalize_keyword(keyword), {})[paper_id] = score
+            self._keep_sample(paper_id, paper)
+            self._dirty = True
+
+    def bulk_put(self, entries: Iterable[Tuple[Dict, str, int]], prompt_version: str) -> int:
+        """Pre-populates the store with (paper, keyword, score) entries and saves once. Returns the number stored."""
+        count = 0
+        with self._lock:
+            by_keyword = self.scores.setdefault(prompt_version, {})
+            for paper, keyword, score in entries:
+                paper_id = canonical_paper_id(paper)
+                if paper_id is None:
+                    continue
+                by_keyword.setdefault(normalize_keyword(keyword), {})[paper_id] = score
+                self._keep_sample(paper_id, paper)
+                count += 1
+        self.save()
+        return count
+
+    def invalidate(self, keep_version: Optional[str] = None) -> int:
+        """
+        Drops every score not produced by keep_version (all scores if keep_version is None),
+        e.g. after the verifier prompt changed. Returns the number of scores removed.
+        """
+        with self._lock:
+            removed = 0
+            for version in list(self.scores):
+                if version != keep_version:
+                    removed += sum(len(papers) for papers in self.scores.pop(version).values())
+            if removed:
+                scored = {paper_id for by_keyword in self.scores.values() for papers in by_keyword.values() for paper_id in papers}
+                self.samples = {paper_id: sample for paper_id, sample in self.samples.items() if paper_id in scored}
+        if removed:
+            print(f"Invalidated {removed} cached verification scores")
+            self.save()
+        return removed
+
+    def labelled_pairs(self, prompt_version: str) -> Iterator[Tuple[str, Dict, int]]:
+        """(keyword, {"title", "abstract"}, score) for every stored score of prompt_version whose paper text is known."""
+        with self._lock:
+            by_keyword = {keyword: dict(papers) for keyword, papers in self.scores.get(prompt_version, {}).items()}
+        for keyword, papers in by_keyword.items():
+            for paper_id, score in papers.items():
+                sample = self.samples.get(paper_id)
+                if sample is not None:
+                    yield keyword, sample, score
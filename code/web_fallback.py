@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Optional, Tuple
+
+from atomic_io import atomic_write
+
+# Longest article text sent to the general extraction prompt
+MAX_PAGE_CHARS = 20000
+
+
+def page_content_hash(keyword: str, text: str) -> str:
+    """Hash of a page's normalized text for one keyword, so mirrors and re-runs are recognised."""
+    normalized = re.sub(r'\s+', ' ', text.lower()).strip()
+    return hashlib.sha1(f"{keyword.lower()}\n{normalized}".encode('utf-8')).hexdigest()
+
+
+class GeneralWebFallback:
+    def __init__(self, google_searcher, max_pages: int = 3, workers: int = 4, seen_pages_file: Optional[str] = "processed_pages.json", tavily_searcher=None):
+        """
+        Finds and fetches non-Wikipedia pages about a keyword when it has no Wikipedia article.
+
+        Args:
+            google_searcher: GoogleSearcher used to find candidate pages.
+            max_pages: Number of non-Wikipedia results fetched per keyword.
+            workers: Pages fetched concurrently.
+            seen_pages_file: JSON file of content hashes of pages already processed. None keeps them in memory only.
+            tavily_searcher: Optional TavilySearcher used instead of Google; its cached results are reused on re-runs.
+        """
+        self.google_searcher = google_searcher
+        self.tavily_searcher = tavily_searcher
+        self.max_pages = max_pages
+        self.workers = workers
+        self.seen_pages_file = seen_pages_file
+        self._lock = threading.Lock()
+        self.seen_hashes = self._load()
+        # Pages handed to the pipeline but not yet extracted; only mark_processed moves them to seen_hashes
+        self.pending_hashes = set()
+
+    def _load(self) -> set:
+        if self.seen_pages_file and os.path.exists(self.seen_pages_file):
+            try:
+                with open(self.seen_pages_file, 'r') as f:
+                    return set(json.load(f))
+            except json.JSONDecodeError:
+                print(f"Error reading {self.seen_pages_file}, starting with no processed pages")
+        return set()
+
+    def save(self):
+        if not self.seen_pages_file:
+            return
+        with self._lock:
+            with atomic_write(self.seen_pages_file) as f:
+                json.dump(sorted(self.seen_hashes), f)
+
+    def search_urls(self, keyword: str) -> List[str]:
+        """Top non-Wikipedia result URLs for the keyword."""
+        query = f"{keyword} original paper that introduced it"
+        try:
+            # Ask for extra results since Wikipedia hits and duplicates are dropped
+            if self.tavily_searcher is not None:
+                results = self.tavily_searcher.result_urls(query, max_results=self.max_pages * 2)
+            else:
+                results = self.google_searcher.search_query(query, max_results=self.max_pages * 2)
+        except Exception as e:
+            print(f"Error searching the web for {keyword}: {e}")
+            return []
+        urls = [url for url in dict.fromkeys(results) if "wikipedia.org" not in url]
+        return urls[:self.max_pages]
+
+    def _fetch(self, url: str) -> Optional[dict]:
+        from scrapers.general_scraper import WebPageExtractor
+        try:
+            return WebPageExtractor(url).run()
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    def mark_processed(self, content_hash: str):
+        """Records a page as processed once its extraction succeeded, so later runs skip it."""
+        with self._lock:
+            self.pending_hashes.discard(content_hash)
+            self.seen_hashes.add(content_hash)
+
+    def iter_pages(self, keyword: str) -> Iterator[Tuple[str, str, str, List[str], str]]:
+        """
+        Fetches the top pages concurrently and yields ("page", title, text, references, content hash)
+        in completion order, skipping pages whose content was already processed (or is being
+        processed) for this keyword. Call mark_processed with the hash once the page was extracted.
+        """
+        urls = self.search_urls(keyword)
+        print(f"Fetching {len(urls)} general web pages for {keyword}")
+        if not urls:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(urls)), thread_name_prefix="web-fallback") as executor:
+            futures = {executor.submit(self._fetch, url): url for url in urls}
+            for future in as_completed(futures):
+                url, data = futures[future], future.result()
+                if not data or not data.get("all_text"):
+                    continue
+                content_hash = page_content_hash(keyword, data["all_text"])
+                with self._lock:
+                    if content_hash in self.seen_hashes or content_hash in self.pending_hashes:
+                        print(f"Skipping {url} - same content already processed for {keyword}")
+                        continue
+                    self.pending_hashes.add(content_hash)
+                title = data["metadata"].get("title") or url
+                yield ("page", title, data["all_text"][:MAX_PAGE_CHARS], data["explicit_references"], content_hash)
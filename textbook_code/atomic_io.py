@@ -0,0 +1,38 @@
+import os
+import tempfile
+from contextlib import contextmanager
+
+
+def _target_mode(path: str) -> int:
+    """Permission bits the file at path should get: its current ones, or the umask default for a new file."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = 'w', encoding: str = None):
+    """
+    Yields a file object for a temporary file next to path and swaps it in when the block completes,
+    so readers never see a partial file. mkstemp creates the file 0600, so it is given the target's
+    permissions before the swap. If the block raises, the temporary file is removed and path is untouched.
+
+    Args:
+        path: File to replace.
+        mode: Write mode passed to os.fdopen ('w' or 'wb').
+        encoding: Text encoding for text modes.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.chmod(tmp_path, _target_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
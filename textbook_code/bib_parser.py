@@ -0,0 +1,177 @@
+import json
+import os
+import re
+import statistics
+from typing import Dict, List, Optional
+
+from atomic_io import atomic_write
+
+# Bump when the segmentation or field extraction changes so cached results are re-parsed
+BIB_PARSER_VERSION = 2
+
+LABEL_PATTERN = re.compile(r'^\s*\[(\d+)\]\s*')
+YEAR_PATTERN = re.compile(r'\b(1[5-9]\d\d|20\d\d)[a-z]?\b')
+ITALIC_FLAG = 2
+# Periods that end a sentence, not those of initials ("C. A. R."), "et al.", "Jr. and ..." or
+# two-letter first names followed by a surname ("Yu. Ofman.", "Th. Ottmann,")
+SENTENCE_END_PATTERN = re.compile(
+    r'(?<![A-Z])(?<!\bet al)(?!(?<=\bJr)\.\s+and\b)(?!(?<=\b[A-Z][a-z])\.\s+[A-Z][^\s.,]*[.,])\.\s+')
+
+
+def join_lines(current: str, line: str) -> str:
+    """Appends a line to an entry, re-joining words hyphenated across the line break."""
+    if not current:
+        return line
+    if current.endswith('-') and line[:1].islower():
+        return current[:-1] + line
+    if current.endswith(('-', '\u2013')) and line[:1].isdigit():
+        return current + line  # page range such as "10-15" broken after the dash
+    return f"{current} {line}"
+
+
+def parse_fields(text: str, italic_text: str = "") -> Dict:
+    """
+    Splits an entry in the 'Authors. Title. Venue, Year.' layout into fields. When the title
+    heuristic fails, the italic run (book titles are set in italics) is used instead.
+    """
+    years = YEAR_PATTERN.findall(text)
+    year = int(years[-1]) if years else None
+    parts = [p.strip() for p in SENTENCE_END_PATTERN.split(text) if p.strip()]
+
+    authors_text = parts[0] if parts else ""
+    authors_text = re.sub(r',?\s*(editors?|eds?)\.?$', '', authors_text)
+    authors = [a.strip() for a in re.split(r',\s*and\s+|\s+and\s+|,\s*(?!Jr\b)', authors_text) if a.strip()]
+
+    title = parts[1].rstrip('.') if len(parts) > 1 else None
+    if not title and italic_text.strip():
+        title = italic_text.strip().rstrip('.')
+    venue = ". ".join(parts[2:]).rstrip('.') if len(parts) > 2 else None
+    if venue and year:
+        venue = re.sub(rf',?\s*{year}[a-z]?$', '', venue).strip() or None
+
+    return {"authors": authors, "title": title, "venue": venue, "year": year}
+
+
+class BibliographyParser:
+    def __init__(self, cache_path: Optional[str] = None, margin_ratio: float = 0.06, heading_size_ratio: float = 1.15):
+        """
+        Segments bibliography pages into entries using fitz text blocks and spans.
+
+        Args:
+            cache_path: JSON file caching parsed entries per PDF fingerprint.
+            margin_ratio: Lines in the top/bottom margin (running heads, page numbers) are dropped.
+            heading_size_ratio: Lines set this much larger than body text (headings) are dropped.
+        """
+        self.cache_path = cache_path
+        self.margin_ratio = margin_ratio
+        self.heading_size_ratio = heading_size_ratio
+
+    def load_cached(self, fingerprint: Optional[str]) -> Optional[List[Dict]]:
+        if not self.cache_path or not fingerprint or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except json.JSONDecodeError:
+            return None
+        if cached.get("fingerprint") != fingerprint or cached.get("version") != BIB_PARSER_VERSION:
+            return None
+        print(f"Loaded {len(cached['entries'])} parsed bibliography entries from {self.cache_path}")
+        return cached["entries"]
+
+    def save_cached(self, fingerprint: Optional[str], entries: List[Dict]):
+        if not self.cache_path or not fingerprint:
+            return
+        with atomic_write(self.cache_path, encoding='utf-8') as f:
+            json.dump({"version": BIB_PARSER_VERSION, "fingerprint": fingerprint, "entries": entries}, f)
+
+    def _page_lines(self, page) -> List[Dict]:
+        """Returns the text lines of a page with geometry, font size, italic text and column."""
+        layout = page.get_text("dict")
+        width, height = layout["width"], layout["height"]
+        mid = width / 2
+        slack = width * 0.02
+
+        lines = []
+        for block in layout["blocks"]:
+            if block.get("type") != 0:
+                continue
+            for line in block["lines"]:
+                spans = [span for span in line["spans"] if span["text"].strip()]
+                if not spans:
+                    continue
+                x0, y0, x1, y1 = line["bbox"]
+                if y1 < height * self.margin_ratio or y0 > height * (1 - self.margin_ratio):
+                    continue
+                if x1 <= mid + slack:
+                    column = 0
+                elif x0 >= mid - slack:
+                    column = 1
+                else:
+                    column = 0  # spans the page: single-column layout
+                lines.append({
+                    "x0": x0, "y0": y0,
+                    "column": column,
+                    "size": max(span["size"] for span in spans),
+                    "text": "".join(span["text"] for span in spans).strip(),
+                    "italic": " ".join(span["text"].strip() for span in spans if span["flags"] & ITALIC_FLAG),
+                })
+
+        # Labels such as "[12]" can be separate lines on the same baseline; merge those first
+        lines.sort(key=lambda l: (l["column"], round(l["y0"]), l["x0"]))
+        merged = []
+        for line in lines:
+            if merged and merged[-1]["column"] == line["column"] and abs(merged[-1]["y0"] - line["y0"]) < 2:
+                merged[-1]["text"] = f"{merged[-1]['text']} {line['text']}"
+                merged[-1]["italic"] = f"{merged[-1]['italic']} {line['italic']}".strip()
+                continue
+            merged.append(line)
+        return merged
+
+    def parse_pages(self, pages) -> List[Dict]:
+        """Parses fitz pages into entries {number, text, authors, title, venue, year}."""
+        page_lines = [self._page_lines(page) for page in pages]
+        all_lines = [line for lines in page_lines for line in lines]
+        if not all_lines:
+            return []
+
+        body_size = statistics.median(line["size"] for line in all_lines)
+        labelled = sum(1 for line in all_lines if LABEL_PATTERN.match(line["text"])) > len(all_lines) * 0.05
+
+        entries = []
+        current = None
+        for lines in page_lines:
+            # Hanging indent: entries start at the column's smallest indent, continuation lines are indented
+            column_indent = {}
+            for line in lines:
+                column_indent[line["column"]] = min(column_indent.get(line["column"], line["x0"]), line["x0"])
+
+            for line in lines:
+                if line["size"] > body_size * self.heading_size_ratio:
+                    continue
+                label = LABEL_PATTERN.match(line["text"])
+                if labelled:
+                    starts_entry = label is not None
+                else:
+                    starts_entry = line["x0"] <= column_indent[line["column"]] + 2
+
+                if starts_entry or current is None:
+                    current = {
+                        "number": int(label.group(1)) if label else len(entries) + 1,
+                        "text": "",
+                        "italic": "",
+                    }
+                    entries.append(current)
+                text = line["text"][label.end():] if label else line["text"]
+                current["text"] = join_lines(current["text"], text)
+                if line["italic"]:
+                    current["italic"] = join_lines(current["italic"], line["italic"])
+
+        parsed = []
+        for entry in entries:
+            text = re.sub(r'\s+', ' ', entry["text"]).strip()
+            if not text:
+                continue
+            parsed.append({"number": entry["number"], "text": text, **parse_fields(text, entry["italic"])})
+        print(f"Parsed {len(parsed)} bibliography entries from page layout.")
+        return parsed
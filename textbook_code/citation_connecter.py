@@ -1,13 +1,35 @@
+import bisect
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 import json
 from db_manager import JsonDatabaseManager
 
-class ReferenceExtractor:
-    def __init__(self, json_db_manager: JsonDatabaseManager, bibliography_text: str):
+# Matches [3], [3, 7], [12–15] and lists split over line breaks, but not array indexing like A[1]
+CITATION_MARKER_PATTERN = re.compile(r'\[\s*(\d+(?:\s*[,;\-\u2013\u2014]\s*\d+)*)\s*\]')
+# Adjacent markers such as [2][4] form one run; a run right after a word is indexing, e.g. A[1][2]
+CITATION_PATTERN = re.compile(r'(?<![\w\]])(?:' + CITATION_MARKER_PATTERN.pattern + r')+')
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+# Wider "ranges" are more likely page or interval notation than citations
+MAX_CITATION_RANGE = 10
 
+class ReferenceExtractor:
+    def __init__(self, json_db_manager: JsonDatabaseManager, bibliography_text: str = "", bibliography_entries: Optional[List[Dict]] = None):
+        """
+        Args:
+            bibliography_text: Raw bibliography text, split on [n] labels when no structured entries are given.
+            bibliography_entries: Entries from PdfIngester.extract_bibliography_entries. Their parsed
+                authors/title/venue/year are stored alongside each source.
+        """
         self.db_manager = json_db_manager
-        self.parsed_bibliography = self._parse_bibliography(bibliography_text)
+        self.bibliography_fields: Dict[int, Dict] = {}
+        if bibliography_entries:
+            self.parsed_bibliography = {entry["number"]: entry["text"] for entry in bibliography_entries}
+            self.bibliography_fields = {
+                entry["number"]: {field: entry.get(field) for field in ("authors", "title", "venue", "year")}
+                for entry in bibliography_entries
+            }
+        else:
+            self.parsed_bibliography = self._parse_bibliography(bibliography_text)
         print(f"Initialized ReferenceExtractor. Parsed {len(self.parsed_bibliography)} bibliography entries.")
 
     def _parse_bibliography(self, bibliography_text: str) -> Dict[int, str]:
@@ -34,6 +56,64 @@ class ReferenceExtractor:
 
         return parsed_refs
 
+    def _expand_citation(self, body: str) -> List[int]:
+        """
+        Expands the body of a citation marker such as '3', '3, 7' or '12–15' into reference numbers.
+        Returns nothing for markers that are more likely interval notation, such as '[0, 1]' or
+        '[1, 100]': a range wider than MAX_CITATION_RANGE, or a number missing from the bibliography.
+        """
+        ref_nums = []
+        for part in re.split(r'\s*[,;]\s*', body.strip()):
+            range_match = re.fullmatch(r'(\d+)\s*[-\u2013\u2014]\s*(\d+)', part)
+            if range_match:
+                first, last = int(range_match.group(1)), int(range_match.group(2))
+                if first > last or last - first > MAX_CITATION_RANGE:
+                    return []
+                ref_nums.extend(range(first, last + 1))
+            elif part.isdigit():
+                ref_nums.append(int(part))
+            else:
+                return []
+        if self.parsed_bibliography and any(ref_num not in self.parsed_bibliography for ref_num in ref_nums):
+            return []
+        return ref_nums
+
+    def build_citation_index(self, section_text: str) -> Tuple[List[str], Dict[int, List[int]]]:
+        """
+        Splits the section into sentences once and maps every cited reference number to the
+        indexes of the sentences citing it, in order of first appearance.
+        """
+        starts = [0] + [m.end() for m in SENTENCE_BOUNDARY.finditer(section_text)]
+        ends = [m.start() for m in SENTENCE_BOUNDARY.finditer(section_text)] + [len(section_text)]
+        sentences = [section_text[start:end].strip() for start, end in zip(starts, ends)]
+
+        ref_to_sentences: Dict[int, List[int]] = {}
+        for match in CITATION_PATTERN.finditer(section_text):
+            sentence_idx = bisect.bisect_right(starts, match.start()) - 1
+            if not sentences[sentence_idx]:
+                continue
+            for marker in CITATION_MARKER_PATTERN.finditer(match.group(0)):
+                for ref_num in self._expand_citation(marker.group(1)):
+                    sentence_ids = ref_to_sentences.setdefault(ref_num, [])
+                    if sentence_idx not in sentence_ids:
+                        sentence_ids.append(sentence_idx)
+        return sentences, ref_to_sentences
+
+    def iter_section_citations(self, section_title: str, section_text: str) -> Iterator[Tuple[int, str, str]]:
+        """Yields unique (reference number, full reference, context sentence) triples for one section."""
+        sentences, ref_to_sentences = self.build_citation_index(section_text)
+        seen = set()
+        for ref_num, sentence_ids in ref_to_sentences.items():
+            full_reference = self.parsed_bibliography.get(ref_num)
+            if full_reference is None:
+                print(f"Warning: Reference [{ref_num}] found in '{section_title}' but not in bibliography.")
+                continue
+            for sentence_idx in sentence_ids:
+                unique_key = (full_reference, sentences[sentence_idx])
+                if unique_key not in seen:
+                    seen.add(unique_key)
+                    yield ref_num, full_reference, sentences[sentence_idx]
+
     def extract_and_add_references(self, sections: List[Dict]):
         if not self.parsed_bibliography:
             print("No bibliography entries parsed. Cannot extract references.")
@@ -48,43 +128,19 @@ class ReferenceExtractor:
                 print(f"Warning: Skipping malformed section entry: {section}")
                 continue
 
-            found_ref_matches = list(re.finditer(r'\[(\d+)\]', section_text))
-            sentences = re.split(r'(?<=[.!?])\s+', section_text)
-            sentences = [s.strip() for s in sentences if s.strip()]
-
             added_count = 0
-            processed_unique_references_with_context = set() 
-
-            for match in found_ref_matches:
-                ref_num_str = match.group(1)
-                try:
-                    ref_num = int(ref_num_str)
-                    if ref_num in self.parsed_bibliography:
-                        full_reference = self.parsed_bibliography[ref_num]
-
-                        context_sentences_for_match = []
-                        for sentence in sentences:
-                            if f"[{ref_num_str}]" in sentence:
-                                context_sentences_for_match.append(sentence)
-                        
-                        for context_sentence in set(context_sentences_for_match):
-                            source_entry = {
-                                "source_text": full_reference,
-                                "context_sentence": context_sentence
-                            }
-                            
-                            unique_key = (full_reference, context_sentence)
-                            if unique_key not in processed_unique_references_with_context:
-                                self.db_manager.add_source_to_section(section_title, source_entry)
-                                processed_unique_references_with_context.add(unique_key)
-                                added_count += 1
-                    else:
-                        print(f"Warning: Reference [{ref_num}] found in '{section_title}' but not in bibliography.")
-                except ValueError:
-                    print(f"Warning: Could not parse reference number '{ref_num_str}' in section '{section_title}'.")
+            for ref_num, full_reference, context_sentence in self.iter_section_citations(section_title, section_text):
+                source_entry = {
+                    "source_text": full_reference,
+                    "context_sentence": context_sentence
+                }
+                fields = self.bibliography_fields.get(ref_num)
+                if fields:
+                    source_entry.update(fields)
+                self.db_manager.add_source_to_section(section_title, source_entry)
+                added_count += 1
             
             if added_count > 0:
                 print(f"Processed section '{section_title}': Added {added_count} unique bibliography references with context.")
             else:
                 print(f"Processed section '{section_title}': No new bibliography references with context found.")
-
@@ -1,11 +1,21 @@
 import json
 import os
-from typing import Dict, List, Any
+from contextlib import contextmanager
+from typing import Dict, List, Any, Set, Tuple
+
+from atomic_io import atomic_write
 
 class JsonDatabaseManager:
-    def __init__(self, db_file_path: str):
+    def __init__(self, db_file_path: str, compact: bool = False):
         self.db_file_path = db_file_path
+        # compact=True writes the JSON without indentation, which is much faster for large maps
+        self.compact = compact
+        self._batch_depth = 0
+        self._dirty = False
+        self._interned: Dict[str, str] = {}
+        self._source_index: Dict[str, Set[Tuple[str, str]]] = {}
         self.data = self._load_data()
+        self._rebuild_source_index()
         print(f"Initialized JsonDatabaseManager with database file: {self.db_file_path}")
 
     def _load_data(self) -> dict:
@@ -25,20 +35,86 @@ class JsonDatabaseManager:
             print("JSON database file not found or is empty. Starting with empty database.")
             return {}
 
+    def _intern(self, text):
+        # Repeated bibliography strings share a single instance in memory
+        if not isinstance(text, str):
+            return text
+        return self._interned.setdefault(text, text)
+
+    def _source_key(self, source_data: Dict[str, str]) -> Tuple[str, str]:
+        return (source_data.get("source_text"), source_data.get("context_sentence"))
+
+    def _rebuild_source_index(self):
+        """Builds the per-section (source_text, context_sentence) index used for O(1) duplicate checks."""
+        self._source_index = {}
+        for section_title, section in self.data.items():
+            if not isinstance(section, dict):
+                continue
+            sources = section.get("sources", [])
+            for source in sources:
+                for field in ("source_text", "context_sentence"):
+                    if field in source:
+                        source[field] = self._intern(source[field])
+            self._source_index[section_title] = {self._source_key(source) for source in sources}
+
     def _save_data(self):
+        if self._batch_depth > 0:
+            # Inside a batch: persist once on commit instead of on every change
+            self._dirty = True
+            return
+        self._write_data()
+
+    def _write_data(self):
         try:
-            with open(self.db_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4)
+            # Swapped in atomically, so readers never see a partial file
+            with atomic_write(self.db_file_path, encoding='utf-8') as f:
+                if self.compact:
+                    json.dump(self.data, f, separators=(',', ':'))
+                else:
+                    json.dump(self.data, f, indent=4)
+            self._dirty = False
             print("Data saved successfully to JSON database.")
         except Exception as e:
             print(f"Error saving data to JSON file: {e}")
 
+    @contextmanager
+    def batch(self):
+        """
+        Defers persistence of all changes made inside the block to a single save on exit.
+        Batches can be nested; only the outermost one commits, and only if its block completes.
+        If an exception leaves the outermost batch, the uncommitted changes are discarded by
+        reloading the last saved state from disk.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._discard_changes()
+            raise
+        else:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self.commit()
+
+    def _discard_changes(self):
+        self.data = self._load_data()
+        self._rebuild_source_index()
+        self._dirty = False
+        print("Batch failed; discarded uncommitted changes.")
+
+    def commit(self):
+        """Writes pending changes to disk immediately, even inside a batch."""
+        self._write_data()
+
     def add_section_entry(self, section_title: str, section_data: Dict[str, Any] = None):
         if section_title not in self.data:
             self.data[section_title] = {
                 "details": section_data if section_data is not None else {},
                 "sources": []  # Initialize with an empty list for sources
             }
+            self._source_index[section_title] = set()
             print(f"Added new section entry: '{section_title}'")
         else:
             if section_data is not None:
@@ -53,15 +129,16 @@ class JsonDatabaseManager:
             self.add_section_entry(section_title) # Create section if it doesn't exist
 
         # Check for duplicates based on both source_text and context_sentence
-        is_duplicate = False
-        for existing_source in self.data[section_title]["sources"]:
-            if (existing_source.get("source_text") == source_data.get("source_text") and
-                existing_source.get("context_sentence") == source_data.get("context_sentence")):
-                is_duplicate = True
-                break
-
-        if not is_duplicate:
+        section_index = self._source_index.setdefault(section_title, set())
+        source_key = self._source_key(source_data)
+
+        if source_key not in section_index:
+            source_data = dict(source_data)
+            for field in ("source_text", "context_sentence"):
+                if field in source_data:
+                    source_data[field] = self._intern(source_data[field])
             self.data[section_title]["sources"].append(source_data)
+            section_index.add(source_key)
             print(f"Added source '{source_data.get('source_text', 'N/A')}' with context to section '{section_title}'")
             self._save_data()
         else:
@@ -88,6 +165,7 @@ class JsonDatabaseManager:
 
         if section_title in self.data:
             del self.data[section_title]
+            self._source_index.pop(section_title, None)
             self._save_data()
             print(f"Section '{section_title}' deleted successfully.")
         else:
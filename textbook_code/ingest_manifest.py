@@ -0,0 +1,58 @@
+import hashlib
+import json
+import os
+from typing import Dict, List, Tuple
+
+from atomic_io import atomic_write
+
+# Bump after parser/extractor fixes so every section is re-ingested on the next run
+PARSER_VERSION = 1
+
+
+class IngestManifest:
+    def __init__(self, manifest_path: str):
+        """
+        Remembers the fingerprints of the last ingestion (PDF, bibliography and every TOC section)
+        so re-runs only reprocess sections whose pages or bibliography changed.
+        """
+        self.manifest_path = manifest_path
+        self.data = self._load()
+
+    def _load(self) -> dict:
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except json.JSONDecodeError:
+                print(f"Warning: Manifest '{self.manifest_path}' is malformed. Re-ingesting everything.")
+        return {}
+
+    def save(self):
+        with atomic_write(self.manifest_path, encoding='utf-8') as f:
+            json.dump(self.data, f, indent=2)
+
+    def is_unchanged(self, pdf_hash: str) -> bool:
+        """True when the same PDF was fully ingested by the current parser version."""
+        return self.data.get("parser_version") == PARSER_VERSION and self.data.get("pdf_sha256") == pdf_hash
+
+    @staticmethod
+    def section_key(section_fingerprint: str, bibliography_hash: str) -> str:
+        # A section is stale if its pages, the bibliography or the parser changed
+        return hashlib.sha256(f"{PARSER_VERSION}|{bibliography_hash}|{section_fingerprint}".encode('utf-8')).hexdigest()
+
+    def diff(self, section_fingerprints: Dict[str, str], bibliography_hash: str) -> Tuple[List[str], List[str]]:
+        """Returns (changed or new section keys, section keys no longer in the PDF). Keys are PdfIngester.section_key values."""
+        previous = self.data.get("sections", {})
+        changed = [key for key, fingerprint in section_fingerprints.items()
+                   if previous.get(key) != self.section_key(fingerprint, bibliography_hash)]
+        removed = [key for key in previous if key not in section_fingerprints]
+        return changed, removed
+
+    def update(self, pdf_hash: str, bibliography_hash: str, section_fingerprints: Dict[str, str]):
+        self.data = {
+            "parser_version": PARSER_VERSION,
+            "pdf_sha256": pdf_hash,
+            "bibliography_sha256": bibliography_hash,
+            "sections": {key: self.section_key(fingerprint, bibliography_hash)
+                         for key, fingerprint in section_fingerprints.items()},
+        }
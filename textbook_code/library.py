@@ -0,0 +1,223 @@
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, List, Optional, Set
+
+from atomic_io import atomic_write
+from bib_parser import join_lines, parse_fields
+from pdf_parser import PdfIngester
+from citation_connecter import ReferenceExtractor
+
+
+def normalize_reference(text: str) -> str:
+    """Normalizes a bibliography entry so the same reference printed by different books matches."""
+    text = re.sub(r'-\s*\n\s*', '', text)  # re-join words hyphenated across lines
+    text = re.sub(r'[^a-z0-9]+', ' ', text.lower())
+    return text.strip()
+
+
+def _fold(text: str) -> str:
+    """Lower-case ASCII letters and digits only, so accents and PDF diacritic artifacts do not matter."""
+    # Spacing accents such as the "´" in "Lov´asz" are how PDF text extraction often renders diacritics
+    text = "".join(c for c in text if unicodedata.category(c) != 'Sk')
+    text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', ' ', text.lower()).strip()
+
+
+def reference_key(text: str) -> str:
+    """
+    Dedup key of a bibliography entry: first-author surname, year and normalized title, so the same
+    work printed with different author formatting or venue punctuation by two books matches.
+    Falls back to the whole normalized entry when no title can be parsed.
+    """
+    joined = ""
+    for line in text.splitlines():
+        joined = join_lines(joined, line.strip())
+    fields = parse_fields(joined)
+    if not fields["title"] or not fields["authors"]:
+        return normalize_reference(text)
+    names = [name for name in _fold(fields["authors"][0]).split() if name not in ("jr", "sr")]
+    surname = names[-1] if names else ""
+    return f"{surname}|{fields['year'] or ''}|{_fold(fields['title'])}"
+
+
+def reference_id(text: str) -> str:
+    return hashlib.sha1(reference_key(text).encode('utf-8')).hexdigest()[:16]
+
+
+def book_id_for(pdf_path: str) -> str:
+    """File name plus a hash of the absolute path, so same-named PDFs in different directories stay apart."""
+    name = os.path.splitext(os.path.basename(pdf_path))[0]
+    path_hash = hashlib.sha1(os.path.abspath(pdf_path).encode('utf-8')).hexdigest()[:8]
+    return f"{name}-{path_hash}"
+
+
+class TextbookLibrary:
+    def __init__(self, store_path: str = "textbook_library.json"):
+        """
+        Shared store for a shelf of textbooks: one global, deduplicated bibliography table and,
+        for every reference, the (book, section, context) locations that cite it.
+        """
+        self.store_path = store_path
+        self.data = self._load_data()
+        self._token_index: Dict[str, Set[str]] = {}
+        self._rebuild_index()
+
+    def _load_data(self) -> dict:
+        if os.path.exists(self.store_path) and os.path.getsize(self.store_path) > 0:
+            try:
+                with open(self.store_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                print(f"Loaded textbook library with {len(data.get('books', {}))} books.")
+                return data
+            except json.JSONDecodeError:
+                print(f"Warning: Library file '{self.store_path}' is malformed. Starting with an empty library.")
+        return {"books": {}, "bibliography": {}, "citations": {}}
+
+    def save(self):
+        with atomic_write(self.store_path, encoding='utf-8') as f:
+            json.dump(self.data, f, separators=(',', ':'))
+        print(f"Library saved to {self.store_path}")
+
+    def _index_reference(self, ref_id: str, text: str):
+        for token in set(normalize_reference(text).split()):
+            self._token_index.setdefault(token, set()).add(ref_id)
+
+    def _unindex_reference(self, ref_id: str, text: str):
+        for token in set(normalize_reference(text).split()):
+            posting = self._token_index.get(token)
+            if posting is not None:
+                posting.discard(ref_id)
+                if not posting:
+                    del self._token_index[token]
+
+    def _rebuild_index(self):
+        self._token_index = {}
+        for ref_id, entry in self.data["bibliography"].items():
+            self._index_reference(ref_id, entry["text"])
+
+    def _remove_book(self, book_id: str):
+        """Drops every citation of a book so it can be re-ingested cleanly."""
+        for ref_id in list(self.data["citations"]):
+            remaining = [c for c in self.data["citations"][ref_id] if c["book"] != book_id]
+            if remaining:
+                self.data["citations"][ref_id] = remaining
+            else:
+                del self.data["citations"][ref_id]
+        for ref_id in list(self.data["bibliography"]):
+            books = [b for b in self.data["bibliography"][ref_id]["books"] if b != book_id]
+            if books:
+                self.data["bibliography"][ref_id]["books"] = books
+            else:
+                self._unindex_reference(ref_id, self.data["bibliography"].pop(ref_id)["text"])
+        self.data["books"].pop(book_id, None)
+
+    def ingest_pdf(self, pdf_path: str, workers: Optional[int] = 1) -> bool:
+        """Ingests one textbook. Returns False if it was skipped (unchanged or unreadable)."""
+        book_id = book_id_for(pdf_path)
+        ingester = PdfIngester(pdf_path, workers=workers)
+        if not ingester.document:
+            return False
+
+        try:
+            pdf_hash = ingester.pdf_fingerprint()
+            if self.data["books"].get(book_id, {}).get("sha256") == pdf_hash:
+                print(f"'{book_id}' is already in the library and unchanged. Skipping.")
+                return False
+            self._remove_book(book_id)
+            # Libraries written before ids carried a path hash keyed the book by its file name alone
+            legacy_id = os.path.splitext(os.path.basename(pdf_path))[0]
+            if self.data["books"].get(legacy_id, {}).get("path") == pdf_path:
+                self._remove_book(legacy_id)
+
+            bibliography_text = ingester.extract_bibliography()
+            sections = ingester.extract_all_sections()
+            extractor = ReferenceExtractor(None, bibliography_text)
+
+            citation_count = 0
+            for section in sections:
+                if not section.get('title') or not section.get('text_content'):
+                    continue
+                for _, full_reference, context_sentence in extractor.iter_section_citations(section['title'], section['text_content']):
+                    ref_id = reference_id(full_reference)
+                    entry = self.data["bibliography"].get(ref_id)
+                    if entry is None:
+                        entry = self.data["bibliography"][ref_id] = {"text": full_reference, "books": []}
+                        self._index_reference(ref_id, full_reference)
+                    if book_id not in entry["books"]:
+                        entry["books"].append(book_id)
+                    self.data["citations"].setdefault(ref_id, []).append({
+                        "book": book_id,
+                        "section": section['title'],
+                        "context": context_sentence,
+                    })
+                    citation_count += 1
+
+            self.data["books"][book_id] = {
+                "path": pdf_path,
+                "sha256": pdf_hash,
+                "sections": len(sections),
+                "references": len(extractor.parsed_bibliography),
+            }
+            print(f"Ingested '{book_id}': {len(sections)} sections, {citation_count} citations.")
+            return True
+        finally:
+            ingester.close_pdf()
+
+    def ingest_directory(self, pdf_dir: str, workers: Optional[int] = 1) -> int:
+        """Ingests every PDF in a directory into the shared store. Returns the number of books (re)ingested."""
+        ingested = 0
+        for pdf_path in sorted(glob.glob(os.path.join(pdf_dir, "*.pdf"))):
+            print(f"\n--- Ingesting {pdf_path} ---")
+            if self.ingest_pdf(pdf_path, workers):
+                ingested += 1
+                self.save()
+        return ingested
+
+    def find_references(self, query: str, limit: int = 20) -> List[Dict]:
+        """Returns bibliography entries containing every token of the query, e.g. "Hoare 1962"."""
+        tokens = normalize_reference(query).split()
+        if not tokens:
+            return []
+        # Intersect starting from the rarest token
+        postings = sorted((self._token_index.get(token, set()) for token in tokens), key=len)
+        ref_ids = set(postings[0])
+        for posting in postings[1:]:
+            ref_ids &= posting
+            if not ref_ids:
+                break
+        bibliography = self.data["bibliography"]
+        results = [{"id": ref_id, **bibliography[ref_id]} for ref_id in ref_ids if ref_id in bibliography]
+        results.sort(key=lambda r: len(self.data["citations"].get(r["id"], [])), reverse=True)
+        return results[:limit]
+
+    def citing_locations(self, ref_id: str) -> List[Dict]:
+        """Every (book, section, context) that cites the reference."""
+        return self.data["citations"].get(ref_id, [])
+
+    def who_cites(self, query: str, limit: int = 20) -> List[Dict]:
+        """Answers "which textbooks cite <query> and where"."""
+        return [{"reference": ref["text"], "locations": self.citing_locations(ref["id"])}
+                for ref in self.find_references(query, limit)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Multi-textbook library with cross-book citation lookup")
+    parser.add_argument("--store", default="textbook_library.json", help="Library store file")
+    parser.add_argument("--ingest", metavar="PDF_DIR", help="Ingest every PDF in this directory")
+    parser.add_argument("--workers", type=int, default=None, help="Processes per PDF (default: one per core)")
+    parser.add_argument("query", nargs="?", help='Reference to look up, e.g. "Hoare 1962"')
+    args = parser.parse_args()
+
+    library = TextbookLibrary(args.store)
+    if args.ingest:
+        library.ingest_directory(args.ingest, args.workers)
+    if args.query:
+        for result in library.who_cites(args.query):
+            print(f"\n{result['reference']}")
+            for location in result["locations"]:
+                print(f"  - {location['book']} / {location['section']}: {location['context'][:120]}")
@@ -1,5 +1,6 @@
 import os
 import json # For pretty printing the final database state
+import hashlib
 
 # Import the classes from their respective files
 # Ensure these files (pdf_ingester_class.py, json_db_manager_class.py, reference_extractor_class.py)
@@ -7,56 +8,93 @@ import json # For pretty printing the final database state
 from pdf_parser import PdfIngester
 from db_manager import JsonDatabaseManager
 from citation_connecter import ReferenceExtractor
+from ingest_manifest import IngestManifest
+from section_index import SectionSearchIndex
 
 def main():
     clrs_pdf_path = "files/algos_tb.pdf"
     json_db_file = "clrs_textbook_map.json"
-
-    if os.path.exists(json_db_file):
-        os.remove(json_db_file)
-        print(f"Cleaned up existing database file: {json_db_file}")
+    # Fingerprints of the last run; sections whose pages and bibliography are unchanged are skipped
+    manifest = IngestManifest(json_db_file + ".manifest.json")
+    section_index = SectionSearchIndex("clrs_section_index.json.gz")
 
     print("\n--- Initializing PDF Ingester ---")
-    pdf_ingester = PdfIngester(clrs_pdf_path)
+    pdf_ingester = PdfIngester(clrs_pdf_path, page_cache_path=clrs_pdf_path + ".pages", workers=None)
 
     if not pdf_ingester.document:
         print("Failed to load PDF. Exiting.")
         return
 
+    pdf_hash = pdf_ingester.pdf_fingerprint()
+    if os.path.exists(json_db_file) and os.path.exists(section_index.index_path) and manifest.is_unchanged(pdf_hash):
+        print(f"PDF unchanged since the last ingestion. Nothing to do for {json_db_file}.")
+        pdf_ingester.close_pdf()
+        return
+
     print("\n--- Extracting Bibliography ---")
     bibliography_text = pdf_ingester.extract_bibliography()
     if not bibliography_text:
         print("Warning: Could not extract bibliography. Reference extraction might be incomplete.")
     else:
         print(f"Bibliography extracted (snippet): {bibliography_text[:200]}...")
+    bibliography_entries = pdf_ingester.extract_bibliography_entries(cache_path=json_db_file + ".bibliography.json")
 
     print("\n--- Initializing JSON Database Manager ---")
-    db_manager = JsonDatabaseManager(json_db_file)
+    db_manager = JsonDatabaseManager(json_db_file, compact=True)
+
+    print("\n--- Comparing Section Fingerprints ---")
+    # Structured entries change with the layout parser version, so they are part of the hash
+    bibliography_hash = hashlib.sha256((bibliography_text + json.dumps(bibliography_entries, sort_keys=True)).encode('utf-8')).hexdigest()
+    section_fingerprints = pdf_ingester.section_fingerprints()
+    if not os.path.exists(json_db_file) or not os.path.exists(section_index.index_path):
+        changed_keys, removed_keys = list(section_fingerprints), []
+    else:
+        changed_keys, removed_keys = manifest.diff(section_fingerprints, bibliography_hash)
+    print(f"{len(changed_keys)} of {len(section_fingerprints)} sections changed, {len(removed_keys)} removed.")
 
-    print("\n--- Extracting All Sections from PDF ---")
-    all_sections_from_pdf = pdf_ingester.extract_all_sections()
+    # The database and the section index are keyed by title, so every section sharing a title with a
+    # changed or removed one is rebuilt too
+    stale_titles = sorted({PdfIngester.section_title(key) for key in changed_keys + removed_keys})
+    extract_keys = {key for key in section_fingerprints if PdfIngester.section_title(key) in stale_titles}
+
+    print("\n--- Extracting Changed Sections from PDF ---")
+    all_sections_from_pdf = pdf_ingester.extract_all_sections(None if len(extract_keys) == len(section_fingerprints) else extract_keys)
     print(f"Total sections extracted from PDF: {len(all_sections_from_pdf)}")
 
     print("\n--- Populating Database with Section Details ---")
-    for section_data in all_sections_from_pdf:
-        section_details = {
-            "level": section_data['level'],
-            "start_page": section_data['start_page'],
-            "end_page": section_data['end_page'],
-            "text_content_snippet": section_data['text_content'][:500] + "..." if len(section_data['text_content']) > 500 else section_data['text_content']
-        }
-        db_manager.add_section_entry(section_data['title'], section_details)
+    with db_manager.batch():
+        # Changed sections are rebuilt from scratch so stale sources do not linger
+        for title in stale_titles:
+            if title in db_manager.get_all_sections():
+                db_manager.delete_section(title)
+        for section_data in all_sections_from_pdf:
+            section_details = {
+                "level": section_data['level'],
+                "start_page": section_data['start_page'],
+                "end_page": section_data['end_page'],
+                "text_content_snippet": section_data['text_content'][:500] + "..." if len(section_data['text_content']) > 500 else section_data['text_content']
+            }
+            db_manager.add_section_entry(section_data['title'], section_details)
     print("All sections added to database (details only).")
 
+    print("\n--- Updating Full-Text Section Index ---")
+    section_index.remove_sections(stale_titles)
+    section_index.add_sections(all_sections_from_pdf)
+    section_index.save()
+
     print("\n--- Initializing Reference Extractor ---")
-    ref_extractor = ReferenceExtractor(db_manager, bibliography_text)
+    ref_extractor = ReferenceExtractor(db_manager, bibliography_text, bibliography_entries)
 
 
 
     print("\n--- Extracting and Adding References to Database ---")
-    ref_extractor.extract_and_add_references(all_sections_from_pdf)
+    with db_manager.batch():
+        ref_extractor.extract_and_add_references(all_sections_from_pdf)
     print("Reference extraction complete.")
 
+    manifest.update(pdf_hash, bibliography_hash, section_fingerprints)
+    manifest.save()
+
     # --- Step 7: Finalize and display results ---
     print("\n--- Processing Complete ---")
     print(f"Final database saved to: {json_db_file}")
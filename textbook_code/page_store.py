@@ -0,0 +1,93 @@
+import json
+import mmap
+import os
+from typing import Callable, List, Optional
+
+
+class PageTextStore:
+    def __init__(self, page_count: int, loader: Callable[[int], str], cache_path: Optional[str] = None, fingerprint: Optional[str] = None):
+        """
+        Holds the extracted text of every PDF page so each page is decoded exactly once.
+
+        Args:
+            page_count: Number of pages in the document.
+            loader: Called with a 0-based page number to extract that page's text.
+            cache_path: Optional on-disk cache. Page texts are written there once and read back
+                        through a memory map on later runs instead of being re-extracted.
+            fingerprint: Identifies the PDF the cache belongs to. A cache with another fingerprint is ignored.
+        """
+        self.page_count = page_count
+        self.loader = loader
+        self.cache_path = cache_path
+        self.fingerprint = fingerprint
+        self._pages: List[Optional[str]] = [None] * page_count
+        self._mmap = None
+        self._offsets = None
+        if cache_path:
+            self._open_cache()
+
+    def _index_path(self) -> str:
+        return self.cache_path + ".idx"
+
+    def _open_cache(self):
+        if not (os.path.exists(self.cache_path) and os.path.exists(self._index_path())):
+            return
+        try:
+            with open(self._index_path(), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get("fingerprint") != self.fingerprint or len(index.get("offsets", [])) != self.page_count + 1:
+                print("Page text cache belongs to a different PDF. Ignoring it.")
+                return
+            if os.path.getsize(self.cache_path) == 0:
+                self._offsets = index["offsets"]
+                return
+            with open(self.cache_path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._offsets = index["offsets"]
+            print(f"Using memory-mapped page text cache: {self.cache_path}")
+        except Exception as e:
+            print(f"Could not open page text cache: {e}")
+            self._mmap = None
+            self._offsets = None
+
+    def get(self, page_num: int) -> str:
+        text = self._pages[page_num]
+        if text is None:
+            if self._offsets is not None:
+                start, end = self._offsets[page_num], self._offsets[page_num + 1]
+                text = self._mmap[start:end].decode('utf-8') if self._mmap is not None else ""
+            else:
+                text = self.loader(page_num)
+            self._pages[page_num] = text
+        return text
+
+    def fill(self, first_page: int, texts: List[str]):
+        """Stores already extracted texts for consecutive pages starting at first_page."""
+        for offset, text in enumerate(texts):
+            self._pages[first_page + offset] = text
+
+    def missing_pages(self) -> List[int]:
+        if self._offsets is not None:
+            return []
+        return [i for i, text in enumerate(self._pages) if text is None]
+
+    def save(self):
+        """Writes every page text to the on-disk cache (extracting pages not seen yet)."""
+        if not self.cache_path or self._offsets is not None:
+            return
+        offsets = [0]
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            for page_num in range(self.page_count):
+                data = self.get(page_num).encode('utf-8')
+                f.write(data)
+                offsets.append(offsets[-1] + len(data))
+        os.replace(tmp_path, self.cache_path)
+        with open(self._index_path(), 'w', encoding='utf-8') as f:
+            json.dump({"fingerprint": self.fingerprint, "offsets": offsets}, f)
+        print(f"Saved page text cache to {self.cache_path}")
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
@@ -1,18 +1,46 @@
 import fitz
+import hashlib
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+from page_store import PageTextStore
+from bib_parser import BibliographyParser
+
+
+def _extract_pages(pdf_path: str, page_nums: list) -> list:
+    # Runs in a worker process, so it opens its own fitz document
+    document = fitz.open(pdf_path)
+    try:
+        return [(page_num, document.load_page(page_num).get_text()) for page_num in page_nums]
+    finally:
+        document.close()
+
 
 class PdfIngester:
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, page_cache_path: str = None, workers: int = 1):
         self.pdf_path = pdf_path
+        self.page_cache_path = page_cache_path
+        # workers > 1 extracts page text in a process pool; None uses one worker per core
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
         self.document = None
         self.table_of_contents = []
+        self.page_store = None
+        self._page_fingerprints = {}
+        self._pdf_fingerprint = None
         self._load_pdf()
 
     def _load_pdf(self):
         try:
             self.document = fitz.open(self.pdf_path)
             self.table_of_contents = self.document.get_toc()
+            self.page_store = PageTextStore(
+                self.document.page_count,
+                self._load_page_text,
+                cache_path=self.page_cache_path,
+                fingerprint=self.pdf_fingerprint() if self.page_cache_path else None,
+            )
             print(f"Successfully loaded PDF: {self.pdf_path}")
             print(f"Extracted {len(self.table_of_contents)} TOC entries.")
         except fitz.FileNotFoundError:
@@ -22,6 +50,71 @@ class PdfIngester:
             print(f"An error occurred while loading the PDF: {e}")
             self.document = None
 
+    def pdf_fingerprint(self) -> str:
+        # Hashed once; the page cache, the bibliography cache and the manifest all use it
+        if self._pdf_fingerprint is None:
+            sha = hashlib.sha256()
+            with open(self.pdf_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    sha.update(chunk)
+            self._pdf_fingerprint = sha.hexdigest()
+        return self._pdf_fingerprint
+
+    def _load_page_text(self, page_num: int) -> str:
+        return self.document.load_page(page_num).get_text()
+
+    def get_page_text(self, page_num: int) -> str:
+        # Every page is decoded at most once; nested sections reuse the stored text
+        return self.page_store.get(page_num)
+
+    def extract_pages_parallel(self, chunks_per_worker: int = 4, pages: set = None):
+        """
+        Extracts every page not yet in the page store (restricted to pages, if given) using a
+        process pool. Pages are split into contiguous chunks and merged back by page number,
+        so the store ends up identical to the serial path.
+        """
+        missing = self.page_store.missing_pages()
+        if pages is not None:
+            missing = [page_num for page_num in missing if page_num in pages]
+        if self.workers <= 1 or len(missing) < 2:
+            return
+
+        n_chunks = min(len(missing), self.workers * chunks_per_worker)
+        chunk_size = -(-len(missing) // n_chunks)
+        chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+        print(f"Extracting {len(missing)} pages with {self.workers} worker processes...")
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for results in executor.map(_extract_pages, [self.pdf_path] * len(chunks), chunks):
+                for page_num, text in results:
+                    self.page_store.fill(page_num, [text])
+
+    def _page_fingerprint(self, page_num: int) -> str:
+        # Hashing the raw content stream is much cheaper than extracting the text
+        if page_num not in self._page_fingerprints:
+            self._page_fingerprints[page_num] = hashlib.sha1(self.document.load_page(page_num).read_contents()).hexdigest()
+        return self._page_fingerprints[page_num]
+
+    @staticmethod
+    def section_key(level: int, title: str, page: int) -> str:
+        # Titles repeat in a TOC (e.g. "Exercises", "Problems"), so sections are keyed by level and start page too
+        return f"{level}|{page}|{title}"
+
+    @staticmethod
+    def section_title(section_key: str) -> str:
+        return section_key.split("|", 2)[2]
+
+    def section_fingerprints(self) -> dict:
+        """Maps every TOC section's key (see section_key) to a hash of its level, page range and page contents."""
+        fingerprints = {}
+        for i, (level, title, page) in enumerate(self.table_of_contents):
+            start_page_idx, end_page_idx = self._get_page_range_for_section(i)
+            sha = hashlib.sha256(f"{level}|{start_page_idx}|{end_page_idx}".encode('utf-8'))
+            for page_num in range(max(start_page_idx, 0), min(end_page_idx, self.document.page_count)):
+                sha.update(self._page_fingerprint(page_num).encode('utf-8'))
+            fingerprints[self.section_key(level, title, page)] = sha.hexdigest()
+        return fingerprints
+
     def get_table_of_contents(self) -> list:
         if not self.document:
             print("PDF document not loaded. Cannot retrieve TOC.")
@@ -44,7 +137,7 @@ class PdfIngester:
         
         return start_page - 1, end_page - 1
 
-    def extract_all_sections(self) -> list[dict]:
+    def extract_all_sections(self, keys: set = None) -> list[dict]:
         if not self.document:
             print("PDF document not loaded. Cannot extract sections.")
             return []
@@ -52,16 +145,26 @@ class PdfIngester:
             print("No Table of Contents found. Cannot extract sections by title.")
             return []
 
+        # keys (see section_key) restricts extraction to the given sections (used for incremental re-ingestion)
+        toc_indexes = [i for i, (level, title, page) in enumerate(self.table_of_contents)
+                       if keys is None or self.section_key(level, title, page) in keys]
+
         all_sections_data = []
+        needed_pages = None
+        if keys is not None:
+            needed_pages = set()
+            for i in toc_indexes:
+                needed_pages.update(range(*self._get_page_range_for_section(i)))
+        self.extract_pages_parallel(pages=needed_pages)
 
-        for i, (level, title, _) in enumerate(self.table_of_contents):
+        for i in toc_indexes:
+            level, title, _ = self.table_of_contents[i]
             start_page_idx, end_page_idx = self._get_page_range_for_section(i)
             
             section_text = []
             for page_num in range(start_page_idx, end_page_idx):
                 if 0 <= page_num < self.document.page_count: # Ensure page number is valid
-                    page = self.document.load_page(page_num)
-                    section_text.append(page.get_text())
+                    section_text.append(self.get_page_text(page_num))
                 else:
                     print(f"Warning: Attempted to access invalid page {page_num} for section '{title}'. Skipping.")
                     break # Stop if an invalid page is encountered within a section
@@ -75,50 +178,75 @@ class PdfIngester:
             })
             print(f"Extracted section: '{title}' (Pages {start_page_idx + 1}-{end_page_idx + 1})")
 
+        if toc_indexes and self.page_store.cache_path:
+            # Completes and writes the page cache so the next run memory-maps it (no-op if it was loaded from disk)
+            self.extract_pages_parallel()
+            self.page_store.save()
         return all_sections_data
 
-    def extract_bibliography(self) -> str:
-
+    def find_bibliography_pages(self) -> tuple[int, int]:
+        """Returns the 0-based [start, end) page range of the bibliography, or (-1, -1) if not found."""
         if not self.document:
-            print("PDF document not loaded. Cannot extract bibliography.")
-            return ""
-
-        bibliography_text = []
-        bibliography_start_page = -1
+            return -1, -1
 
         for i, (level, title, page_num) in enumerate(self.table_of_contents):
             if re.search(r'bibliograph|reference', title, re.IGNORECASE):
-                bibliography_start_page = page_num - 1
                 _, end_page_idx = self._get_page_range_for_section(i)
-                
                 print(f"Found bibliography/references in TOC: '{title}' starting on page {page_num}")
-                for p_num in range(bibliography_start_page, end_page_idx):
-                    if 0 <= p_num < self.document.page_count:
-                        page = self.document.load_page(p_num)
-                        bibliography_text.append(page.get_text())
-                return "\n".join(bibliography_text).strip()
+                return page_num - 1, end_page_idx
 
         print("Bibliography not found in TOC. Scanning last pages...")
         scan_pages = min(20, self.document.page_count)
         for p_num in range(self.document.page_count - scan_pages, self.document.page_count):
             if p_num >= 0: # Ensure we don't go below page 0
-                page = self.document.load_page(p_num)
-                text = page.get_text()
+                text = self.get_page_text(p_num)
 
                 if re.search(r'^\s*(bibliography|references)\s*$', text.split('\n')[0], re.IGNORECASE | re.MULTILINE):
-                    bibliography_start_page = p_num
                     print(f"Found bibliography/references by scanning at page {p_num + 1}")
-
-                    for final_p_num in range(bibliography_start_page, self.document.page_count):
-                        page = self.document.load_page(final_p_num)
-                        bibliography_text.append(page.get_text())
-                    return "\n".join(bibliography_text).strip()
+                    return p_num, self.document.page_count
 
         print("Bibliography/References section not found.")
-        return ""
+        return -1, -1
+
+    def extract_bibliography(self) -> str:
+
+        if not self.document:
+            print("PDF document not loaded. Cannot extract bibliography.")
+            return ""
+
+        start_page_idx, end_page_idx = self.find_bibliography_pages()
+        bibliography_text = []
+        for p_num in range(start_page_idx, end_page_idx):
+            if 0 <= p_num < self.document.page_count:
+                bibliography_text.append(self.get_page_text(p_num))
+        return "\n".join(bibliography_text).strip()
+
+    def extract_bibliography_entries(self, cache_path: str = None) -> list[dict]:
+        """
+        Parses the bibliography from the page layout (columns, indentation, fonts) into structured
+        entries: {number, text, authors, title, venue, year}. Results are cached per PDF in cache_path.
+        """
+        if not self.document:
+            print("PDF document not loaded. Cannot extract bibliography.")
+            return []
+
+        parser = BibliographyParser(cache_path)
+        fingerprint = self.pdf_fingerprint() if cache_path else None
+        cached = parser.load_cached(fingerprint)
+        if cached is not None:
+            return cached
+
+        start_page_idx, end_page_idx = self.find_bibliography_pages()
+        pages = [self.document.load_page(p_num) for p_num in range(start_page_idx, end_page_idx)
+                 if 0 <= p_num < self.document.page_count]
+        entries = parser.parse_pages(pages)
+        parser.save_cached(fingerprint, entries)
+        return entries
 
     def close_pdf(self):
 
+        if self.page_store:
+            self.page_store.close()
         if self.document:
             self.document.close()
             self.document = None
@@ -0,0 +1,158 @@
+import gzip
+import json
+import math
+import os
+import re
+from typing import Dict, List, Optional
+
+from atomic_io import atomic_write
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    # Re-join words hyphenated across PDF line breaks before tokenizing
+    text = re.sub(r'-\s*\n\s*', '', text.lower())
+    return TOKEN_PATTERN.findall(text)
+
+
+class SectionSearchIndex:
+    def __init__(self, index_path: str = "clrs_section_index.json.gz", k1: float = 1.2, b: float = 0.75):
+        """
+        Positional inverted index over full section text with BM25 ranking and phrase queries.
+        The index is persisted as gzipped JSON and only loaded when first needed.
+        """
+        self.index_path = index_path
+        self.k1 = k1
+        self.b = b
+        self._loaded = False
+        self.docs: Dict[str, Dict] = {}                       # doc id -> section metadata and length
+        self.postings: Dict[str, Dict[str, List[int]]] = {}   # term -> doc id -> positions
+        self.next_id = 0
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.index_path):
+            return
+        with gzip.open(self.index_path, 'rt', encoding='utf-8') as f:
+            data = json.load(f)
+        self.docs = data["docs"]
+        self.postings = data["postings"]
+        self.next_id = data["next_id"]
+        print(f"Loaded section index with {len(self.docs)} sections from {self.index_path}")
+
+    def save(self):
+        self._ensure_loaded()
+        with atomic_write(self.index_path, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+            json.dump({"docs": self.docs, "postings": self.postings, "next_id": self.next_id}, f, separators=(',', ':'))
+        print(f"Saved section index with {len(self.docs)} sections to {self.index_path}")
+
+    def remove_sections(self, titles):
+        """Drops the given section titles from the index (used before re-indexing changed sections)."""
+        self._ensure_loaded()
+        titles = set(titles)
+        doc_ids = {doc_id for doc_id, doc in self.docs.items() if doc["title"] in titles}
+        if not doc_ids:
+            return
+        for doc_id in doc_ids:
+            del self.docs[doc_id]
+        for term in list(self.postings):
+            postings = self.postings[term]
+            for doc_id in doc_ids & postings.keys():
+                del postings[doc_id]
+            if not postings:
+                del self.postings[term]
+
+    def add_sections(self, sections: List[Dict]):
+        """Indexes sections as returned by PdfIngester.extract_all_sections. Existing titles are replaced."""
+        self.remove_sections(section['title'] for section in sections)
+        for section in sections:
+            doc_id = str(self.next_id)
+            self.next_id += 1
+            tokens = tokenize(section.get('text_content', ''))
+            self.docs[doc_id] = {
+                "title": section['title'],
+                "level": section.get('level'),
+                "start_page": section.get('start_page'),
+                "end_page": section.get('end_page'),
+                "length": len(tokens),
+            }
+            for position, term in enumerate(tokens):
+                self.postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+
+    def _phrase_docs(self, phrase_terms: List[str]) -> Dict[str, int]:
+        """Returns doc id -> number of occurrences of the consecutive phrase."""
+        if not phrase_terms or any(term not in self.postings for term in phrase_terms):
+            return {}
+        candidates = set(self.postings[phrase_terms[0]])
+        for term in phrase_terms[1:]:
+            candidates &= self.postings[term].keys()
+        matches = {}
+        for doc_id in candidates:
+            following = [set(self.postings[term][doc_id]) for term in phrase_terms[1:]]
+            count = sum(1 for start in self.postings[phrase_terms[0]][doc_id]
+                        if all(start + offset + 1 in positions for offset, positions in enumerate(following)))
+            if count:
+                matches[doc_id] = count
+        return matches
+
+    def search(self, query: str, limit: int = 10, min_level: Optional[int] = None) -> List[Dict]:
+        """
+        Ranks sections for a query. Quoted parts are phrase queries that a section must contain;
+        other words are ranked with BM25. Returns [{title, level, start_page, end_page, score}].
+        """
+        self._ensure_loaded()
+        if not self.docs:
+            return []
+
+        phrases = [tokenize(p) for p in re.findall(r'"([^"]+)"', query)]
+        phrases = [p for p in phrases if p]
+        terms = tokenize(re.sub(r'"[^"]+"', ' ', query)) + [term for phrase in phrases for term in phrase]
+
+        allowed = None
+        for phrase in phrases:
+            phrase_docs = set(self._phrase_docs(phrase))
+            allowed = phrase_docs if allowed is None else allowed & phrase_docs
+        if allowed is not None and not allowed:
+            return []
+
+        n_docs = len(self.docs)
+        avg_len = sum(doc["length"] for doc in self.docs.values()) / n_docs or 1.0
+        scores: Dict[str, float] = {}
+        for term in set(terms):
+            postings = self.postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, positions in postings.items():
+                if allowed is not None and doc_id not in allowed:
+                    continue
+                tf = len(positions)
+                length = self.docs[doc_id]["length"]
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_len))
+
+        results = []
+        for doc_id, score in sorted(scores.items(), key=lambda item: item[1], reverse=True):
+            doc = self.docs[doc_id]
+            if min_level is not None and (doc["level"] or 0) < min_level:
+                continue
+            results.append({
+                "title": doc["title"],
+                "level": doc["level"],
+                "start_page": doc["start_page"],
+                "end_page": doc["end_page"],
+                "score": round(score, 4),
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    index = SectionSearchIndex()
+    for result in index.search(" ".join(sys.argv[1:]) or '"binary search tree"'):
+        print(f"{result['score']:8.3f}  {result['title']} (pages {result['start_page']}-{result['end_page']})")